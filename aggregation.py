@@ -0,0 +1,105 @@
+"""Per-tech-lead summary counters behind the Super Admin overview.
+
+A summary is a flat mapping of counter name to count, e.g. ``total_interns``,
+``offers_received``, ``cohort:Cohort 1`` or ``offer:No``. Flat counters can be
+added and subtracted, so storage backends keep them up to date incrementally.
+"""
+from collections import Counter
+
+import pandas as pd
+
+# Column tagging each row with its tech lead when all leads are combined
+LEAD_COLUMN = "Tech Lead"
+# Team number column of the intern form
+TEAM_COLUMN = "Team(eg :2 or 3)"
+
+# Counters of interns that answered "Yes" in a column
+YES_COUNTERS = {
+    "offers_received": "Received Offer letter",
+    "apps_pushed": "Pushed Apps onto GitLab",
+    "data_collection_started": "Data Collection (started?)",
+}
+# Counters of interns with a given "Active" status; anything else counts as active
+STATUS_COUNTERS = {
+    "inactive": "No",
+    "academic_break": "Academic Break",
+}
+
+
+def _missing(value):
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def record_counts(record):
+    """Summary counters contributed by a single intern record"""
+    counts = Counter(total_interns=1)
+    if not _missing(record.get("Cohort")):
+        counts[f"cohort:{record['Cohort']}"] += 1
+    if not _missing(record.get("Received Offer letter")):
+        counts[f"offer:{record['Received Offer letter']}"] += 1
+    for key, column in YES_COUNTERS.items():
+        if record.get(column) == "Yes":
+            counts[key] += 1
+    for key, status in STATUS_COUNTERS.items():
+        if record.get("Active") == status:
+            counts[key] += 1
+    return counts
+
+
+def _indicators(frame):
+    """One boolean column per summary counter and one row per intern"""
+    columns = {"total_interns": pd.Series(True, index=frame.index)}
+    for key, column in YES_COUNTERS.items():
+        if column in frame.columns:
+            columns[key] = frame[column].eq("Yes")
+    if "Active" in frame.columns:
+        for key, status in STATUS_COUNTERS.items():
+            columns[key] = frame["Active"].eq(status)
+    parts = [pd.DataFrame(columns, index=frame.index)]
+    if "Cohort" in frame.columns:
+        parts.append(pd.get_dummies(frame["Cohort"], prefix="cohort", prefix_sep=":"))
+    if "Received Offer letter" in frame.columns:
+        parts.append(pd.get_dummies(frame["Received Offer letter"], prefix="offer", prefix_sep=":"))
+    return pd.concat(parts, axis=1)
+
+
+def _counts(totals):
+    return Counter({key: int(n) for key, n in totals.items() if n})
+
+
+def in_teams(frame, teams):
+    """Mask of the interns whose team is one of ``teams``, compared as text so 2, "2" and 2.0 match"""
+    if TEAM_COLUMN not in frame.columns:
+        return pd.Series(False, index=frame.index)
+    values = frame[TEAM_COLUMN].astype(str).str.strip().str.replace(r"\.0$", "", regex=True)
+    return values.isin([str(team).strip() for team in teams])
+
+
+def summarize_interns(frame):
+    """Summary counters for a whole frame of one tech lead's interns"""
+    return _counts(_indicators(frame).sum())
+
+
+def lead_statistics(frame):
+    """Summary counters of every tech lead in one groupby over a combined frame
+
+    ``frame`` holds all leads' interns tagged with LEAD_COLUMN; leads keep the
+    order in which they first appear.
+    """
+    table = _indicators(frame).groupby(frame[LEAD_COLUMN], sort=False).sum()
+    return {lead: _counts(row) for lead, row in table.iterrows()}
+
+
+def apply_delta(counts, added=None, removed=None):
+    """Return ``counts`` with one record's contribution added and/or removed"""
+    counts = Counter(counts)
+    if added is not None:
+        counts.update(record_counts(added))
+    if removed is not None:
+        counts.subtract(record_counts(removed))
+    return +counts
+
+
+def prefixed(counts, prefix):
+    """Sub-counters such as every ``cohort:`` entry, keyed without the prefix"""
+    return {key[len(prefix):]: n for key, n in counts.items() if key.startswith(prefix)}
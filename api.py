@@ -0,0 +1,360 @@
+"""Headless HTTP API over the tracker data, for scripts that would otherwise scrape CSV downloads.
+
+Runs next to the Streamlit app against the same storage backend and settings,
+and needs Starlette and uvicorn (installed with recent Streamlit):
+
+    python api.py    # serves on TRACKER_API_HOST:TRACKER_API_PORT, 127.0.0.1:8502 by default
+
+Requests use HTTP Basic auth with the app's credentials from
+.streamlit/secrets.toml: a tech lead's name and password give access to their
+own data, "admin" and the admin password to every lead's. Interns, history,
+teams and team progress are returned with an ETag holding the data's version; a request
+whose If-None-Match matches it gets 304 without the data being read. Writes
+check If-Match the same way and answer 412 when the data changed since. Lists
+are paginated with ``offset`` and ``limit``. Writes go through the same
+validation, history log and search index updates as the pages.
+
+    GET   /leads
+    GET   /leads/{lead}/interns?offset=&limit=&cohort=&active=
+    GET   /leads/{lead}/interns/{name}
+    POST  /leads/{lead}/interns          {"interns": [{"Name": ..., ...}], "update_existing": true}
+    PATCH /leads/{lead}/interns          {"names": [...], "fields": {...}}
+    GET   /leads/{lead}/history?offset=&limit=&intern=
+    GET   /leads/{lead}/teams
+    GET   /leads/{lead}/team-progress?offset=&limit=
+    POST  /leads/{lead}/team-progress    {"updates": [{"team": ..., "member": ... or null, "progress": {...}}]}
+"""
+import base64
+import binascii
+import hmac
+import os
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+import pandas as pd
+import uvicorn
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from aggregation import TEAM_COLUMN
+from config import (
+    DATA_FOLDER, HISTORY_FOLDER, SEARCH_INDEX_PATH, SQLITE_PATH, STORAGE_BACKEND, TEAM_FOLDER, TEAM_NUMBERS, TECH_LEADS
+)
+from history import history_entry
+from jobs import data_version
+from roster import import_records, plan_import, validate_roster
+from search_index import SearchIndex, intern_changes, progress_changes
+from storage import InternIndex, StaleDataError, clean_record, open_backend
+from teams import PHASES, progress_frame
+
+SECRETS_PATH = os.environ.get("TRACKER_SECRETS", os.path.join(".streamlit", "secrets.toml"))
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+class ApiError(Exception):
+    """An error answered with ``status`` and a JSON body of the message and any details"""
+
+    def __init__(self, status, message, headers=None, **details):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers
+        self.details = details
+
+
+def load_secrets(path=SECRETS_PATH):
+    """The app's credentials: ``admin_password`` and the ``tech_leads`` name -> password table"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def authenticate(request, secrets):
+    """The tech lead making the request, or None for the admin; ApiError 401 otherwise"""
+    scheme, _, encoded = request.headers.get("Authorization", "").partition(" ")
+    username = password = ""
+    if scheme.lower() == "basic":
+        try:
+            username, _, password = base64.b64decode(encoded).decode().partition(":")
+        except (binascii.Error, UnicodeDecodeError):
+            pass
+    # Same defaults as the login page
+    if username == "admin" and hmac.compare_digest(password, secrets.get("admin_password", "admin123")):
+        return None
+    expected = secrets.get("tech_leads", {}).get(username, "")
+    if username in TECH_LEADS and expected and hmac.compare_digest(password, expected):
+        return username
+    raise ApiError(401, "Invalid credentials", headers={"WWW-Authenticate": 'Basic realm="tracker"'})
+
+
+def etag(version):
+    return f'"{version}"'
+
+
+def matches(header, version):
+    """Whether an If-Match / If-None-Match header lists ``version``'s ETag"""
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag(version) in tags
+
+
+def records(frame):
+    """JSON-friendly rows of a frame, blanks as null"""
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+def page_params(request):
+    try:
+        offset = int(request.query_params.get("offset", 0))
+        limit = int(request.query_params.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        raise ApiError(400, "offset and limit must be integers")
+    if offset < 0 or not 0 < limit <= MAX_LIMIT:
+        raise ApiError(400, f"offset must be >= 0 and limit between 1 and {MAX_LIMIT}")
+    return offset, limit
+
+
+def paginated(items, total, offset, limit):
+    return {
+        "items": items, "total": total, "offset": offset, "limit": limit,
+        "next_offset": offset + limit if offset + limit < total else None,
+    }
+
+
+def intern_rows(items):
+    """Validated intern rows from JSON objects, as the roster import checks an uploaded file"""
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ApiError(400, "Expected a list of intern objects")
+    frame = pd.DataFrame(items, dtype=object).fillna("").astype(str).apply(lambda column: column.str.strip())
+    rows, problems, ignored = validate_roster(frame)
+    if ignored:
+        raise ApiError(422, f"Unknown columns: {', '.join(ignored)}")
+    if not problems.empty:
+        problems["Row"] = problems["Row"] - 2  # Index into the request's list instead of a file line
+        raise ApiError(422, "Invalid interns", problems=records(problems))
+    return rows
+
+
+def create_app(backend, secrets, search_index=None):
+    """The Starlette app serving ``backend``; ``search_index`` is kept current on writes if given"""
+
+    def lead_for(request):
+        user = authenticate(request, secrets)
+        lead = request.path_params["lead"]
+        if lead not in TECH_LEADS:
+            raise ApiError(404, f"Unknown tech lead: {lead}")
+        if user is not None and user != lead:
+            raise ApiError(403, "Tech leads can only access their own data")
+        return lead, user
+
+    async def body(request):
+        try:
+            data = await request.json()
+        except ValueError:
+            raise ApiError(400, "The body must be JSON")
+        if not isinstance(data, dict):
+            raise ApiError(400, "The body must be a JSON object")
+        return data
+
+    def expected_version(request, current):
+        """The version a write must apply to: the current one, if If-Match allows it"""
+        header = request.headers.get("If-Match")
+        if header is not None and not matches(header, current):
+            raise ApiError(412, "The data changed since it was read", version=str(current))
+        return current
+
+    def not_modified(request, version):
+        header = request.headers.get("If-None-Match")
+        return header is not None and matches(header, version)
+
+    def index(lead, kind, before, after, changes):
+        if search_index is not None:
+            search_index.apply(lead, kind, before, after, changes)
+
+    # Reads
+
+    async def list_leads(request):
+        user = authenticate(request, secrets)
+        leads = TECH_LEADS if user is None else [user]
+        version = await run_in_threadpool(data_version, backend, leads)
+        if not_modified(request, version):
+            return Response(status_code=304, headers={"ETag": etag(version)})
+        summary = await run_in_threadpool(backend.load_summary, leads)
+        items = [{"lead": lead, "counts": summary.get(lead, {})} for lead in leads]
+        return JSONResponse({"items": items}, headers={"ETag": etag(version)})
+
+    async def list_interns(request):
+        lead, _ = lead_for(request)
+        offset, limit = page_params(request)
+        version = await run_in_threadpool(backend.interns_version, lead)
+        if not_modified(request, version):
+            return Response(status_code=304, headers={"ETag": etag(version)})
+        frame = await run_in_threadpool(backend.load_interns, lead)
+        for param, column in (("cohort", "Cohort"), ("active", "Active")):
+            if param in request.query_params:
+                frame = frame[frame[column] == request.query_params[param]]
+        items = records(frame.iloc[offset:offset + limit])
+        return JSONResponse(paginated(items, len(frame), offset, limit), headers={"ETag": etag(version)})
+
+    async def get_intern(request):
+        lead, _ = lead_for(request)
+        version = await run_in_threadpool(backend.interns_version, lead)
+        if not_modified(request, version):
+            return Response(status_code=304, headers={"ETag": etag(version)})
+        record = InternIndex(await run_in_threadpool(backend.load_interns, lead)).get(request.path_params["name"])
+        if record is None:
+            raise ApiError(404, f"Unknown intern: {request.path_params['name']}")
+        return JSONResponse(clean_record(record), headers={"ETag": etag(version)})
+
+    async def list_history(request):
+        lead, _ = lead_for(request)
+        offset, limit = page_params(request)
+        intern = request.query_params.get("intern")
+        version = await run_in_threadpool(backend.history_version, lead)
+        if not_modified(request, version):
+            return Response(status_code=304, headers={"ETag": etag(version)})
+        frame, total = await run_in_threadpool(
+            backend.history_page, lead, [intern] if intern else None, None, None, offset, limit
+        )
+        return JSONResponse(paginated(records(frame), total, offset, limit), headers={"ETag": etag(version)})
+
+    async def get_teams(request):
+        lead, _ = lead_for(request)
+        version = await run_in_threadpool(backend.teams_version, lead)
+        if not_modified(request, version):
+            return Response(status_code=304, headers={"ETag": etag(version)})
+        teams = await run_in_threadpool(backend.load_teams, lead)
+        return JSONResponse(teams, headers={"ETag": etag(version)})
+
+    async def list_team_progress(request):
+        lead, _ = lead_for(request)
+        offset, limit = page_params(request)
+        version = await run_in_threadpool(backend.teams_version, lead)
+        if not_modified(request, version):
+            return Response(status_code=304, headers={"ETag": etag(version)})
+        frame = progress_frame(lead, await run_in_threadpool(backend.load_teams, lead))
+        items = records(frame.iloc[offset:offset + limit])
+        return JSONResponse(paginated(items, len(frame), offset, limit), headers={"ETag": etag(version)})
+
+    # Batched writes
+    # Each checks If-Match against the version it read, then writes with that
+    # version as expected_version, so a write racing another one fails with 412.
+
+    def upsert_interns(request, data, lead, user):
+        rows = intern_rows(data.get("interns"))
+        current = backend.interns_version(lead)
+        expected = expected_version(request, current)
+        interns = InternIndex(backend.load_interns(lead))
+        # Tech leads file interns under their own team number, as on the form
+        defaults = None if user is None else {TEAM_COLUMN: TEAM_NUMBERS.get(lead, "")}
+        inserts, updates, unchanged = plan_import(rows, interns, defaults)
+        skipped = 0 if data.get("update_existing", True) else len(updates)
+        changes, entries = import_records(inserts, updates if not skipped else [])
+        version = current
+        if changes:
+            version = backend.upsert_interns(lead, changes, expected_version=expected)
+            backend.append_history_many(lead, entries)
+            index(lead, "interns", current, version, intern_changes(changes))
+        return {"added": len(inserts), "updated": len(updates) - skipped, "skipped": skipped,
+                "unchanged": unchanged}, version
+
+    def update_interns(request, data, lead, user):
+        names, fields = data.get("names"), data.get("fields")
+        if not isinstance(names, list) or not isinstance(fields, dict) or not fields:
+            raise ApiError(400, 'Expected "names" (a list) and "fields" (an object)')
+        if "Name" in fields:
+            raise ApiError(422, "Names can't be changed in a batch")
+        if user is not None and TEAM_COLUMN in fields:
+            raise ApiError(403, "Only the admin can change the team field")
+        fields = clean_record(intern_rows([{"Name": "-", **fields}]).iloc[0].to_dict())
+        del fields["Name"]
+        current = backend.interns_version(lead)
+        expected = expected_version(request, current)
+        interns = InternIndex(backend.load_interns(lead))
+        unknown = [name for name in names if name not in interns]
+        if unknown:
+            raise ApiError(404, "Unknown interns", names=unknown)
+        # Like Bulk Edit: one history entry per intern whose value actually changes
+        entries = [
+            history_entry(name, "Updated", {field: interns.value(name, field) for field in fields}, fields)
+            for name in dict.fromkeys(names)
+        ]
+        entries = [entry for entry in entries if entry["Changed_Fields"]]
+        version = current
+        if entries:
+            changed = [entry["Intern"] for entry in entries]
+            version = backend.update_interns(lead, changed, fields, expected_version=expected)
+            backend.append_history_many(lead, entries)
+            index(lead, "interns", current, version, intern_changes([{"Name": name, **fields} for name in changed]))
+        return {"updated": len(entries), "unchanged": len(set(names)) - len(entries)}, version
+
+    def update_team_progress(request, data, lead, user):
+        updates = data.get("updates")
+        if not isinstance(updates, list) or not updates:
+            raise ApiError(400, 'Expected "updates", a list of {"team", "member", "progress"} objects')
+        current = backend.teams_version(lead)
+        expected = expected_version(request, current)
+        teams = backend.load_teams(lead)
+        # Check every update before writing any
+        for i, update in enumerate(updates):
+            team, member, progress = update.get("team"), update.get("member"), update.get("progress")
+            if team not in teams or (member is not None and member not in teams[team]["members"]):
+                raise ApiError(404, f"Update {i}: unknown team or member")
+            if not isinstance(progress, dict) or not progress or not set(progress) <= set(PHASES):
+                raise ApiError(422, f"Update {i}: progress must map phases to text", phases=PHASES)
+        version = expected
+        for update in updates:
+            progress = {phase: str(text) for phase, text in update["progress"].items()}
+            before = version
+            version = backend.update_team_progress(lead, update["team"], update["member"], progress,
+                                                   expected_version=version)
+            index(lead, "teams", before, version, progress_changes(update["team"], update["member"], progress))
+        return {"updated": len(updates)}, version
+
+    def write_endpoint(write, version_of):
+        async def endpoint(request):
+            lead, user = lead_for(request)
+            data = await body(request)
+            try:
+                result, version = await run_in_threadpool(write, request, data, lead, user)
+            except StaleDataError:
+                raise ApiError(412, "The data changed while writing", version=str(version_of(lead)))
+            return JSONResponse({**result, "version": str(version)}, headers={"ETag": etag(version)})
+        return endpoint
+
+    async def api_error(request, exc):
+        return JSONResponse({"error": str(exc), **exc.details}, status_code=exc.status, headers=exc.headers)
+
+    return Starlette(
+        routes=[
+            Route("/leads", list_leads),
+            Route("/leads/{lead}/interns", list_interns, methods=["GET"]),
+            Route("/leads/{lead}/interns", write_endpoint(upsert_interns, backend.interns_version), methods=["POST"]),
+            Route("/leads/{lead}/interns", write_endpoint(update_interns, backend.interns_version), methods=["PATCH"]),
+            Route("/leads/{lead}/interns/{name}", get_intern),
+            Route("/leads/{lead}/history", list_history),
+            Route("/leads/{lead}/teams", get_teams),
+            Route("/leads/{lead}/team-progress", list_team_progress, methods=["GET"]),
+            Route("/leads/{lead}/team-progress", write_endpoint(update_team_progress, backend.teams_version),
+                  methods=["POST"]),
+        ],
+        exception_handlers={ApiError: api_error},
+    )
+
+
+def main():
+    backend = open_backend(
+        STORAGE_BACKEND, sqlite_path=SQLITE_PATH,
+        data_folder=DATA_FOLDER, history_folder=HISTORY_FOLDER, team_folder=TEAM_FOLDER
+    )
+    app = create_app(backend, load_secrets(), SearchIndex(SEARCH_INDEX_PATH))
+    uvicorn.run(app, host=os.environ.get("TRACKER_API_HOST", "127.0.0.1"), port=int(os.environ.get("TRACKER_API_PORT", "8502")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Memory and filter cost of intern frames as plain strings vs. with INTERN_SCHEMA.
+
+Run from the repository root:
+
+    python benchmarks/bench_intern_schema.py
+"""
+import io
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import INTERN_SCHEMA, apply_schema, memory_report  # noqa: E402
+
+
+def synthetic_csv(n, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({column: rng.choice(values, n) for column, values in INTERN_SCHEMA.items()})
+    frame.insert(0, "Name", [f"Intern {i}" for i in range(n)])
+    frame["Remarks"] = rng.choice(["", "On track", "Needs help with deployment"], n)
+    return frame.to_csv(index=False)
+
+
+def main():
+    for n in (10_000, 100_000):
+        plain = pd.read_csv(io.StringIO(synthetic_csv(n)))
+        typed = apply_schema(plain)
+        print(f"\n{n:,} interns")
+        print(memory_report(plain).to_string())
+        for label, frame in (("plain", plain), ("typed", typed)):
+            filter_ms = min(timeit.repeat(
+                lambda: frame[(frame["Cohort"] == "Cohort 1") & (frame["Received Offer letter"] == "Yes")],
+                number=1, repeat=5
+            )) * 1000
+            print(f"{label:>6} filter: {filter_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
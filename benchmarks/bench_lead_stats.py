@@ -0,0 +1,80 @@
+"""Compare per-lead boolean-mask statistics with the single-groupby version.
+
+Run from the repository root:
+
+    python benchmarks/bench_lead_stats.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aggregation import LEAD_COLUMN, lead_statistics  # noqa: E402
+
+LEADS = [f"Lead {i}" for i in range(12)]
+
+
+def synthetic_interns(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        LEAD_COLUMN: rng.choice(LEADS, n),
+        "Name": [f"Intern {i}" for i in range(n)],
+        "Cohort": rng.choice(["Cohort 1", "Cohort 2"], n),
+        "Received Offer letter": rng.choice(["Yes", "No"], n),
+        "Pushed Apps onto GitLab": rng.choice(["Yes", "No"], n),
+        "Data Collection (started?)": rng.choice(["Yes", "No"], n),
+        "Active": rng.choice(["Yes", "No", "Academic Break"], n),
+    })
+
+
+def mask_statistics(per_lead):
+    """The original Super Admin loop: six filter-and-count passes per lead"""
+    all_reports, stats = [], {}
+    for lead, tech_df in per_lead.items():
+        all_reports.append(tech_df)
+        stats[lead] = {
+            "total_interns": len(tech_df),
+            "cohort_1": len(tech_df[tech_df["Cohort"] == "Cohort 1"]),
+            "cohort_2": len(tech_df[tech_df["Cohort"] == "Cohort 2"]),
+            "offers_received": len(tech_df[tech_df["Received Offer letter"] == "Yes"]),
+            "apps_pushed": len(tech_df[tech_df["Pushed Apps onto GitLab"] == "Yes"]),
+            "data_collection_started": len(tech_df[tech_df["Data Collection (started?)"] == "Yes"]),
+        }
+    # Combined twice: once for the download and once for Cohort Analysis
+    pd.concat(all_reports, ignore_index=True)
+    combined_df = pd.concat(all_reports, ignore_index=True)
+    combined_df["Cohort"].value_counts()
+    combined_df["Received Offer letter"].value_counts()
+    return stats
+
+
+def groupby_statistics(per_lead):
+    """Combine once, then count everything in one groupby"""
+    combined_df = pd.concat(
+        [frame.assign(**{LEAD_COLUMN: lead}) for lead, frame in per_lead.items()], ignore_index=True
+    )
+    return lead_statistics(combined_df)
+
+
+def main():
+    print(f"{'interns':>10} {'masks (ms)':>12} {'groupby (ms)':>13} {'speedup':>8}")
+    for n in (10_000, 100_000):
+        interns = synthetic_interns(n)
+        per_lead = {lead: frame.drop(columns=LEAD_COLUMN) for lead, frame in interns.groupby(LEAD_COLUMN)}
+        stats = groupby_statistics(per_lead)
+        for lead, expected in mask_statistics(per_lead).items():
+            assert stats[lead]["total_interns"] == expected["total_interns"]
+            assert stats[lead].get("cohort:Cohort 1", 0) == expected["cohort_1"]
+            assert stats[lead].get("offers_received", 0) == expected["offers_received"]
+        repeat = 5
+        masks = min(timeit.repeat(lambda: mask_statistics(per_lead), number=1, repeat=repeat)) * 1000
+        groupby = min(timeit.repeat(lambda: groupby_statistics(per_lead), number=1, repeat=repeat)) * 1000
+        print(f"{n:>10,} {masks:>12.1f} {groupby:>13.1f} {masks / groupby:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Time the script body of app.py reruns for each page, with synthetic data.
+
+Uses Streamlit's AppTest and times only the script execution, not AppTest's
+own polling. Run from the repository root:
+
+    python benchmarks/bench_rerun.py [interns]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from streamlit.runtime.scriptrunner import exec_code, script_runner
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import storage  # noqa: E402
+from history import history_entry  # noqa: E402
+
+LEAD = "nikhil"
+PAGES = ["Add/Update Intern", "View All Interns", "Edit Intern", "Delete Intern", "Change History", "🚀 Project Teams"]
+
+run_times = []
+
+
+def _timed(func, ctx):
+    def timed_func():
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            run_times.append(time.perf_counter() - start)
+    return _exec_func_with_error_handling(timed_func, ctx)
+
+
+_exec_func_with_error_handling = exec_code.exec_func_with_error_handling
+script_runner.exec_func_with_error_handling = _timed
+
+
+def write_fixture(n, seed=0):
+    """A data/, history/ and teams/ tree for LEAD in the current directory"""
+    rng = np.random.default_rng(seed)
+    backend = storage.CsvBackend()
+    frame = pd.DataFrame({column: [""] * n for column in storage.INTERN_COLUMNS})
+    frame["Name"] = [f"Intern {i}" for i in range(n)]
+    for column, values in storage.INTERN_SCHEMA.items():
+        frame[column] = rng.choice(values, n)
+    backend.save_interns(LEAD, frame)
+    backend.append_history_many(LEAD, [
+        history_entry(f"Intern {i % n}", "Updated", {"Remarks": ""}, {"Remarks": f"note {i}"})
+        for i in range(min(n, 3000))
+    ])
+
+
+def session(tech_lead=LEAD, is_super_admin=False):
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60)
+    at.secrets["tech_leads"] = {LEAD: ""}
+    at.session_state["logged_in"] = True
+    at.session_state["tech_lead"] = tech_lead
+    at.session_state["is_super_admin"] = is_super_admin
+    return at
+
+
+def median_ms(at, reruns):
+    at.run()
+    del run_times[:]
+    for _ in range(reruns):
+        at.run()
+    return sorted(run_times)[len(run_times) // 2] * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as folder:
+        os.chdir(folder)
+        write_fixture(n)
+        print(f"{n:,} interns, median script time of 20 reruns")
+        for page in PAGES:
+            at = session()
+            at.run()
+            [box for box in at.sidebar.selectbox if box.label == "Navigate to:"][0].set_value(page)
+            print(f"{page:>20}: {median_ms(at, 20):6.1f} ms")
+        print(f"{'Super Admin':>20}: {median_ms(session('Super Admin', True), 20):6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Latency and peak memory of the storage, history, team and Super Admin operations.
+
+For each size a synthetic tree (see synthetic.py) is written to a temporary
+folder, then every operation is timed against the CSV backend, the way the
+pages call it. Per-lead operations use the first tech lead. Latency is the
+median of several calls. Memory is measured on one separate call: the peak of
+what tracemalloc sees Python and numpy allocate, plus the pyarrow buffers the
+result holds on to, since pandas keeps strings there and tracemalloc can't see
+them. Run from the repository root:
+
+    python benchmarks/bench_suite.py [--sizes 1000 10000 100000] [--history-per-intern 10]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import storage  # noqa: E402
+from aggregation import LEAD_COLUMN, lead_statistics  # noqa: E402
+from config import LOAD_WORKERS, TECH_LEADS  # noqa: E402
+from exports import available_formats, export_file  # noqa: E402
+from history import history_entry, record_as_of, replay  # noqa: E402
+from search_index import SearchIndex, intern_changes  # noqa: E402
+from synthetic import intern_name, write_tree  # noqa: E402
+
+LEAD = TECH_LEADS[0]
+
+
+def _arrow_bytes():
+    try:
+        import pyarrow
+    except ImportError:
+        return 0
+    return pyarrow.total_allocated_bytes()
+
+
+def measure(func, repeat):
+    """(median ms, traced peak MiB, MiB of pyarrow buffers held by the result) of ``func``"""
+    func()  # warm up imports and caches the operation relies on
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    arrow_before = _arrow_bytes()
+    tracemalloc.start()
+    try:
+        result = func()
+        traced = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    arrow = max(_arrow_bytes() - arrow_before, 0)
+    del result
+    return sorted(times)[len(times) // 2] * 1000, traced / 2 ** 20, arrow / 2 ** 20
+
+
+def check_history(backend):
+    """An Add/Update save logs only the fields it changed and replays to the saved record"""
+    old = backend.load_interns(LEAD).iloc[0].to_dict()
+    # The form has no Active field and gives "nan" for blank cells shown as text
+    new = {key: "nan" if value != value else value for key, value in old.items() if key != "Active"}
+    new["Remarks"] = "Checked"
+    entry = history_entry(old["Name"], "Updated", old, new)
+    assert entry["Changed_Fields"] == '["Remarks"]', entry["Changed_Fields"]
+    added = history_entry(old["Name"], "Added", None, old)
+    assert replay([added, entry])["Active"] == old["Active"]
+
+
+def operations(folder):
+    """Operation name -> callable, against a tree already written under ``folder``"""
+    folders = {
+        "data_folder": os.path.join(folder, "data"),
+        "history_folder": os.path.join(folder, "history"),
+        "team_folder": os.path.join(folder, "teams"),
+    }
+    backend = storage.CsvBackend(**folders)
+    name = intern_name(1, 0)
+    record = backend.load_interns(LEAD).iloc[0].to_dict()
+    edits = iter(range(10 ** 9))
+
+    def upsert_intern():
+        backend.upsert_intern(LEAD, {**record, "Remarks": f"Edit {next(edits)}"})
+
+    def append_history():
+        backend.append_history(LEAD, history_entry(name, "Updated", {"Remarks": ""}, {"Remarks": "x"}))
+
+    def save_teams():
+        backend.save_teams(LEAD, backend.load_teams(LEAD))
+
+    def update_team_progress():
+        backend.update_team_progress(LEAD, "Team 1", name, {"Week 1: MVP Build": f"Edit {next(edits)}"})
+
+    def super_admin_stats(source, workers=LOAD_WORKERS):
+        return lead_statistics(storage.load_leads(source, TECH_LEADS, workers))
+
+    search_path = os.path.join(folder, "search.db")
+    index = SearchIndex(search_path)
+    index.refresh(backend, TECH_LEADS)
+
+    def index_remark():
+        # A Remarks save as the Edit Intern page records it, index update included
+        before = backend.interns_version(LEAD)
+        fields = {"Remarks": f"Blocked on deployment {next(edits)}"}
+        after = backend.update_intern(LEAD, name, fields)
+        index.apply(LEAD, "interns", before, after, intern_changes([{"Name": name, **fields}]))
+
+    def rebuild_index():
+        # Forget the lead's indexed version so that refresh() rebuilds it from storage
+        index.replace(LEAD, "interns", None, [])
+        index.refresh(backend, [LEAD])
+
+    def export_all():
+        frames = (chunk.assign(**{LEAD_COLUMN: lead}) for lead in TECH_LEADS for chunk in backend.iter_interns(lead))
+        export_file(frames).close()
+
+    return {
+        "load_interns (cold)": lambda: storage.CsvBackend(**folders).load_interns(LEAD),
+        "load_interns (cached)": lambda: backend.load_interns(LEAD),
+        "upsert_intern": upsert_intern,
+        "append_history": append_history,
+        "history_page (cold index)": lambda: storage.CsvBackend(**folders).history_page(LEAD),
+        "history_page": lambda: backend.history_page(LEAD),
+        "history_page (one intern)": lambda: backend.history_page(LEAD, interns=[name]),
+        "record_as_of": lambda: record_as_of(backend, LEAD, name, "2025-07-01 00:00:00"),
+        "load_teams": lambda: backend.load_teams(LEAD),
+        "save_teams": save_teams,
+        "update_team_progress": update_team_progress,
+        "load_summary": lambda: backend.load_summary(TECH_LEADS),
+        "Super Admin stats (cold, 1 thread)": lambda: super_admin_stats(storage.CsvBackend(**folders), 1),
+        f"Super Admin stats (cold, {LOAD_WORKERS} threads)": lambda: super_admin_stats(storage.CsvBackend(**folders)),
+        **({
+            f"Super Admin stats (cold, {LOAD_WORKERS} threads, pyarrow)":
+                lambda: super_admin_stats(storage.CsvBackend(**folders, csv_engine="pyarrow")),
+        } if "Parquet" in available_formats() else {}),
+        "Super Admin stats (cached)": lambda: super_admin_stats(backend),
+        "export all interns (CSV)": export_all,
+        "search index (rebuild one lead)": rebuild_index,
+        "update_intern + search index": index_remark,
+        "search (all leads)": lambda: index.search("waiting data", TECH_LEADS),
+    }
+
+
+def bench(interns, history_rows, repeat):
+    with tempfile.TemporaryDirectory() as folder:
+        start = time.perf_counter()
+        check_history(write_tree(folder, interns, history_rows))
+        print(f"\n{interns:,} interns, {history_rows:,} history rows "
+              f"(generated in {time.perf_counter() - start:.1f} s)")
+        rows = []
+        for label, func in operations(folder).items():
+            ms, traced, arrow = measure(func, repeat)
+            rows.append({
+                "operation": label, "median ms": round(ms, 2),
+                "traced peak MiB": round(traced, 2), "arrow MiB": round(arrow, 2),
+            })
+        print(pd.DataFrame(rows).to_string(index=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="interns across all tech leads")
+    parser.add_argument("--history-per-intern", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for interns in args.sizes:
+        bench(interns, interns * args.history_per_intern, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
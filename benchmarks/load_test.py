@@ -0,0 +1,398 @@
+"""Many tech lead and Super Admin sessions using the app at once: throughput,
+latency, write conflicts, lost updates and damaged files.
+
+Each simulated tech lead session behaves like a browser tab on the app. It
+renders (reads its lead's versions and interns, as every rerun of app.py
+does), waits a moment, then makes one write against the versions it
+rendered, calling the backend the way the pages do. The writes are Add,
+Edit and Delete of interns, progress of a project team, and re-saving the
+whole teams file with a member added or removed. A write rejected with
+StaleDataError is a conflict: the session renders again and retries, as a
+user would after the error. Super Admin sessions keep rendering the admin
+panel: every lead's summary counters, interns and team progress.
+
+Every session only changes interns and a team of its own, so what they
+should look like in the end is known. Anything else found in the end is a
+lost update: a missing or stale intern, one deleted that came back, a
+missing history entry or team progress. Every file must also still load,
+with no duplicate interns, a summary that matches them and no temp files
+left behind.
+
+Sessions run as threads sharing one backend, like Streamlit sessions in one
+server process, or with --processes as processes with a backend each, like
+several app servers over one data folder. Run from the repository root:
+
+    python benchmarks/load_test.py [--sessions 24] [--admins 2] [--ops 40] [--backend sqlite] [--processes]
+
+The exit status is 1 if any update was lost or any file damaged.
+"""
+import argparse
+import glob
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import storage  # noqa: E402
+from aggregation import summarize_interns  # noqa: E402
+from config import LOAD_WORKERS, TECH_LEADS  # noqa: E402
+from history import history_entry  # noqa: E402
+from synthetic import write_tree  # noqa: E402
+from teams import PHASES, TeamProgressCache, new_team  # noqa: E402
+
+# Relative weight of each tech lead operation
+OPERATIONS = {"add": 3, "edit": 4, "delete": 1, "team progress": 3, "save teams": 1}
+# A session gives up on an operation after this many conflicts in a row
+MAX_ATTEMPTS = 50
+
+
+class Session:
+    """One simulated browser tab: what it did, how long it took, and what it expects to find"""
+
+    def __init__(self, number, lead, think, seed):
+        self.number = number
+        self.lead = lead
+        self.think = think
+        self.rng = random.Random(seed)
+        self.latencies = defaultdict(list)
+        self.conflicts = Counter()
+        self.errors = []
+        # Name -> Remarks of the interns this session added and has not deleted
+        self.interns = {}
+        self.deleted = set()
+        # Intern -> history entries this session appended
+        self.history = Counter()
+        self.team = f"Load Test {number}"
+        # Member -> {phase: text} of this session's team
+        self.members = {}
+        self._added = 0
+        self._edits = 0
+
+    def _token(self):
+        self._edits += 1
+        return f"Session {self.number} edit {self._edits}"
+
+    def render(self, backend):
+        """Read what a rerun of the page reads; the expected versions of the write that follows"""
+        versions = {"interns": backend.interns_version(self.lead), "teams": backend.teams_version(self.lead)}
+        backend.load_interns(self.lead)
+        return versions
+
+    def run(self, backend, kind, func):
+        """Render, think and write until the write isn't stale; record its latency and conflicts"""
+        elapsed = 0.0
+        for _ in range(MAX_ATTEMPTS):
+            start = time.perf_counter()
+            versions = self.render(backend)
+            elapsed += time.perf_counter() - start
+            time.sleep(self.rng.uniform(0, 2 * self.think))
+            start = time.perf_counter()
+            try:
+                func(backend, versions)
+            except storage.StaleDataError:
+                self.conflicts[kind] += 1
+                continue
+            except Exception as e:
+                self.errors.append(f"{kind} ({self.lead}, session {self.number}): {type(e).__name__}: {e}")
+                return
+            finally:
+                elapsed += time.perf_counter() - start
+            self.latencies[kind].append(elapsed)
+            return
+        self.errors.append(f"{kind} ({self.lead}, session {self.number}): gave up after {MAX_ATTEMPTS} conflicts")
+
+    def _append_history(self, backend, name, action, old=None, new=None):
+        backend.append_history(self.lead, history_entry(name, action, old, new))
+        self.history[name] += 1
+
+    # Tech lead operations
+    # Each makes one write with the versions its render returned, then updates
+    # what the session expects to find.
+    def add(self, backend, versions):
+        self._added += 1
+        name = f"Load {self.number}-{self._added}"
+        record = {column: "" for column in storage.INTERN_COLUMNS}
+        record.update({column: self.rng.choice(values) for column, values in storage.INTERN_SCHEMA.items()})
+        record.update({"Name": name, "Remarks": self._token()})
+        backend.upsert_intern(self.lead, record, expected_version=versions["interns"])
+        self.interns[name] = record["Remarks"]
+        self._append_history(backend, name, "Added", None, record)
+
+    def edit(self, backend, versions):
+        if not self.interns:
+            return self.add(backend, versions)
+        name = self.rng.choice(sorted(self.interns))
+        remarks = self._token()
+        backend.update_intern(self.lead, name, {"Remarks": remarks}, expected_version=versions["interns"])
+        old = self.interns[name]
+        self.interns[name] = remarks
+        self._append_history(backend, name, "Updated", {"Remarks": old}, {"Remarks": remarks})
+
+    def delete(self, backend, versions):
+        if not self.interns:
+            return self.add(backend, versions)
+        name = self.rng.choice(sorted(self.interns))
+        backend.delete_intern(self.lead, name, expected_version=versions["interns"])
+        remarks = self.interns.pop(name)
+        self.deleted.add(name)
+        self._append_history(backend, name, "Deleted", {"Name": name, "Remarks": remarks})
+
+    def team_progress(self, backend, versions):
+        if not self.members:
+            return self.save_teams(backend, versions)
+        backend.load_teams(self.lead)
+        member = self.rng.choice(sorted(self.members))
+        phase = self.rng.choice(PHASES)
+        text = self._token()
+        backend.update_team_progress(self.lead, self.team, member, {phase: text}, expected_version=versions["teams"])
+        self.members[member][phase] = text
+
+    def save_teams(self, backend, versions):
+        """Create this session's team, or add or remove its third member, by rewriting all teams"""
+        teams = backend.load_teams(self.lead)
+        members = dict(self.members) or {f"Member {self.number}-{i}": {} for i in (1, 2)}
+        extra = f"Member {self.number}-3"
+        if self.members:
+            if extra in members:
+                del members[extra]
+            else:
+                members[extra] = {}
+        team = new_team(members)
+        for member, progress in members.items():
+            team["members"][member].update(progress)
+        teams[self.team] = team
+        backend.save_teams(self.lead, teams, expected_version=versions["teams"])
+        self.members = {member: dict(progress) for member, progress in team["members"].items()}
+
+    def run_lead(self, backend, ops):
+        funcs = {
+            "add": self.add, "edit": self.edit, "delete": self.delete,
+            "team progress": self.team_progress, "save teams": self.save_teams,
+        }
+        for kind in self.rng.choices(list(OPERATIONS), weights=list(OPERATIONS.values()), k=ops):
+            self.run(backend, kind, funcs[kind])
+
+    def run_admin(self, backend, ops, leads, progress_cache):
+        """Render the Super Admin panel ``ops`` times"""
+        for _ in range(ops):
+            start = time.perf_counter()
+            try:
+                backend.load_summary(leads)
+                storage.load_leads(backend, leads, LOAD_WORKERS)
+                progress_cache.load(backend, leads)
+            except Exception as e:
+                self.errors.append(f"admin render (session {self.number}): {type(e).__name__}: {e}")
+            else:
+                self.latencies["admin render"].append(time.perf_counter() - start)
+            time.sleep(self.rng.uniform(0, 2 * self.think))
+
+
+def open_tree(folder, kind):
+    """A backend over the tree under ``folder``; "sqlite" opens the database copied from it"""
+    if kind == "sqlite":
+        return storage.SqliteBackend(os.path.join(folder, "tracker.db"))
+    return storage.CsvBackend(
+        data_folder=os.path.join(folder, "data"),
+        history_folder=os.path.join(folder, "history"),
+        team_folder=os.path.join(folder, "teams"),
+    )
+
+
+def build_tree(folder, kind, interns, history_rows, leads):
+    """Write a synthetic tree under ``folder``, copied into SQLite for that backend"""
+    csv_backend = write_tree(folder, interns, history_rows, leads=leads)
+    if kind == "sqlite":
+        backend = open_tree(folder, kind)
+        for lead in leads:
+            backend.save_interns(lead, csv_backend.load_interns(lead))
+            backend.append_history_many(lead, csv_backend.load_history(lead).to_dict("records"))
+            backend.save_teams(lead, csv_backend.load_teams(lead))
+
+
+def make_sessions(args, leads):
+    """Tech lead sessions spread round-robin over ``leads``, then the admin sessions"""
+    sessions = [
+        Session(number, leads[number % len(leads)], args.think / 1000, args.seed + number)
+        for number in range(args.sessions)
+    ]
+    sessions += [
+        Session(number, None, args.think / 1000, args.seed + number)
+        for number in range(args.sessions, args.sessions + args.admins)
+    ]
+    return sessions
+
+
+def run_session(session, backend, args, leads, progress_cache, start):
+    start.wait()
+    if session.lead is None:
+        session.run_admin(backend, args.ops, leads, progress_cache)
+    else:
+        session.run_lead(backend, args.ops)
+    return session
+
+
+class _Ready:
+    """Processes start as soon as their pool gives them a session"""
+
+    def wait(self):
+        pass
+
+
+def _process_main(folder, args, leads, session):
+    """One session in a process of its own, with its own backend and caches"""
+    backend = open_tree(folder, args.backend)
+    return run_session(session, backend, args, leads, TeamProgressCache(), _Ready())
+
+
+def run_all(folder, args, leads, sessions):
+    """Run every session at once; the sessions as they ended and the wall time"""
+    started = time.perf_counter()
+    if args.processes:
+        with multiprocessing.Pool(len(sessions)) as pool:
+            sessions = pool.starmap(_process_main, [(folder, args, leads, session) for session in sessions])
+    else:
+        backend = open_tree(folder, args.backend)
+        progress_cache = TeamProgressCache()
+        start = threading.Barrier(len(sessions))
+        threads = [
+            threading.Thread(target=run_session, args=(session, backend, args, leads, progress_cache, start))
+            for session in sessions
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return sessions, time.perf_counter() - started
+
+
+def check_files(backend, folder, leads):
+    """Files that no longer load or contradict themselves"""
+    damaged = []
+    for lead in leads:
+        try:
+            frame = backend.load_interns(lead)
+        except Exception as e:
+            damaged.append(f"{lead}: interns don't load: {type(e).__name__}: {e}")
+            continue
+        duplicates = frame["Name"][frame["Name"].duplicated()].tolist()
+        if duplicates:
+            damaged.append(f"{lead}: duplicate interns {duplicates[:5]}")
+        summary = backend.load_summary([lead]).get(lead, Counter())
+        if +Counter(summary) != summarize_interns(frame):
+            damaged.append(f"{lead}: summary counters don't match the interns")
+        for what, load in (("teams", backend.load_teams), ("history", backend.load_history)):
+            try:
+                load(lead)
+            except Exception as e:
+                damaged.append(f"{lead}: {what} don't load: {type(e).__name__}: {e}")
+    for path in glob.glob(os.path.join(folder, "**", "*.tmp"), recursive=True):
+        damaged.append(f"temp file left behind: {os.path.relpath(path, folder)}")
+    return damaged
+
+
+def check_sessions(backend, sessions):
+    """Updates of ``sessions`` that the data doesn't show"""
+    lost = []
+    for lead in sorted({session.lead for session in sessions if session.lead is not None}):
+        try:
+            frame = backend.load_interns(lead)
+            teams = backend.load_teams(lead)
+            history = Counter(backend.load_history(lead)["Intern"])
+        except Exception:
+            continue  # Reported by check_files
+        remarks = dict(zip(frame["Name"], frame["Remarks"]))
+        for session in sessions:
+            if session.lead != lead:
+                continue
+            for name, expected in session.interns.items():
+                if name not in remarks:
+                    lost.append(f"{lead}: {name} is missing")
+                elif remarks[name] != expected:
+                    lost.append(f"{lead}: {name} has {remarks[name]!r} instead of {expected!r}")
+            for name in sorted(session.deleted & set(remarks)):
+                lost.append(f"{lead}: {name} was deleted but is back")
+            for name, count in session.history.items():
+                if history[name] < count:
+                    lost.append(f"{lead}: {count - history[name]} of {count} history entries of {name} are missing")
+            if session.members:
+                members = teams.get(session.team, {}).get("members", {})
+                if set(members) != set(session.members):
+                    lost.append(f"{lead}: {session.team} has members {sorted(members)}, not {sorted(session.members)}")
+                for member, progress in session.members.items():
+                    for phase, text in progress.items():
+                        if text and members.get(member, {}).get(phase) != text:
+                            lost.append(f"{lead}: {session.team} progress of {member} in {phase} is lost")
+    return lost
+
+
+def percentile_ms(values, q):
+    return np.percentile(values, q) * 1000 if values else float("nan")
+
+
+def report(args, sessions, wall, lost, damaged):
+    latencies = defaultdict(list)
+    conflicts = Counter()
+    errors = []
+    for session in sessions:
+        for kind, values in session.latencies.items():
+            latencies[kind].extend(values)
+        conflicts.update(session.conflicts)
+        errors.extend(session.errors)
+    done = sum(len(values) for values in latencies.values())
+    print(
+        f"{args.sessions} tech lead sessions + {args.admins} admin sessions, {args.backend} backend, "
+        f"{'processes' if args.processes else 'threads'}: {done:,} operations in {wall:.1f} s "
+        f"({done / wall:.1f} ops/s)"
+    )
+    print(f"{'operation':<16}{'done':>7}{'p50 ms':>10}{'p99 ms':>10}{'conflicts':>11}")
+    for kind in [*OPERATIONS, "admin render"]:
+        values = latencies.get(kind, [])
+        if values or conflicts[kind]:
+            print(
+                f"{kind:<16}{len(values):>7}{percentile_ms(values, 50):>10.1f}"
+                f"{percentile_ms(values, 99):>10.1f}{conflicts[kind]:>11}"
+            )
+    for title, problems in (("Errors", errors), ("Lost updates", lost), ("Damaged files", damaged)):
+        print(f"{title}: {len(problems)}")
+        for problem in problems[:20]:
+            print(f"  {problem}")
+        if len(problems) > 20:
+            print(f"  ... and {len(problems) - 20} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the storage with many concurrent app sessions")
+    parser.add_argument("--sessions", type=int, default=24, help="tech lead sessions, spread over the leads")
+    parser.add_argument("--admins", type=int, default=2, help="Super Admin sessions")
+    parser.add_argument("--ops", type=int, default=40, help="operations per session")
+    parser.add_argument("--leads", type=int, default=len(TECH_LEADS), help="how many of the tech leads to use")
+    parser.add_argument("--interns", type=int, default=2000, help="interns across the leads before the test")
+    parser.add_argument("--history", type=int, default=20_000, help="history rows across the leads before the test")
+    parser.add_argument("--think", type=float, default=20, help="mean pause in ms between a render and its write")
+    parser.add_argument("--backend", choices=["csv", "sqlite"], default="csv")
+    parser.add_argument("--processes", action="store_true", help="one process per session instead of threads")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    leads = TECH_LEADS[:args.leads]
+    with tempfile.TemporaryDirectory() as folder:
+        build_tree(folder, args.backend, args.interns, args.history, leads)
+        sessions, wall = run_all(folder, args, leads, make_sessions(args, leads))
+        backend = open_tree(folder, args.backend)
+        lost = check_sessions(backend, sessions)
+        damaged = check_files(backend, folder, leads)
+        report(args, sessions, wall, lost, damaged)
+    sys.exit(1 if lost or damaged else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Fabricate data/, history/ and teams/ trees of any size for benchmarks.
+
+Interns are spread evenly over the tech leads in config.TECH_LEADS, each lead
+gets teams of five for about half of their interns, and history rows are
+spread over the same interns with timestamps across one year. Run from the
+repository root to write a tree:
+
+    python benchmarks/synthetic.py OUT_FOLDER [--interns 10000] [--history 100000]
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import storage  # noqa: E402
+from config import TEAM_NUMBERS, TECH_LEADS  # noqa: E402
+from history import history_entry  # noqa: E402
+from teams import PHASES, new_team  # noqa: E402
+
+COLLEGES = ["CBIT", "VNR VJIET", "JNTU Hyderabad", "Osmania University", "MGIT", "Vasavi"]
+REMARKS = ["", "", "On track", "Needs help with deployment", "Waiting on data access", "Strong progress"]
+BLOCKERS = ["", "", "", "GPU quota", "Dataset licensing", "Streamlit Cloud build failing"]
+# History rows are appended in batches of this many per lead
+HISTORY_BATCH = 20_000
+
+
+def intern_name(lead_number, i):
+    return f"Intern {lead_number}-{i}"
+
+
+def split(total, parts):
+    """``total`` divided into ``parts`` near-equal counts"""
+    return [total // parts + (i < total % parts) for i in range(parts)]
+
+
+def intern_frame(lead, lead_number, n, rng):
+    frame = pd.DataFrame({column: [""] * n for column in storage.INTERN_COLUMNS})
+    frame["Name"] = [intern_name(lead_number, i) for i in range(n)]
+    for column, values in storage.INTERN_SCHEMA.items():
+        frame[column] = rng.choice(values, n)
+    frame["Team(eg :2 or 3)"] = TEAM_NUMBERS.get(lead, "")
+    frame["GitLab User Name"] = [f"intern{lead_number}_{i}" for i in range(n)]
+    frame["College"] = rng.choice(COLLEGES, n)
+    frame["GitLab Acc Link"] = [f"https://gitlab.com/intern{lead_number}_{i}" for i in range(n)]
+    frame["Blockers?"] = rng.choice(BLOCKERS, n)
+    frame["Remarks"] = rng.choice(REMARKS, n)
+    return frame
+
+
+def history_entries(names, n, rng, start):
+    """``n`` history entries: one "Added" per intern, then field updates"""
+    step = timedelta(days=365) / max(n, 1)
+    for i in range(n):
+        time = (start + step * i).strftime("%Y-%m-%d %H:%M:%S")
+        name = names[i % len(names)]
+        if i < len(names):
+            yield history_entry(name, "Added", None, {"Name": name, "Cohort": "Cohort 1"}, time=time)
+        else:
+            field = ("Remarks", "Blockers?")[i % 2]
+            old, new = rng.choice(REMARKS + BLOCKERS, 2)
+            yield history_entry(name, "Updated", {field: old}, {field: f"{new} ({i})"}, time=time)
+
+
+def team_tree(names, rng):
+    """Teams of five for about half of ``names``, with some progress filled in"""
+    teams = {}
+    for number, start in enumerate(range(0, len(names) // 2 - 4, 5), 1):
+        team = new_team(names[start:start + 5])
+        for phase in PHASES[:rng.integers(0, len(PHASES) + 1)]:
+            team["team_progress"][phase] = f"Team {number}: {phase} done"
+            for progress in team["members"].values():
+                progress[phase] = rng.choice(REMARKS)
+        teams[f"Team {number}"] = team
+    return teams
+
+
+def write_tree(folder, interns, history_rows, leads=TECH_LEADS, seed=0):
+    """Write a synthetic tree under ``folder`` and return its CsvBackend"""
+    rng = np.random.default_rng(seed)
+    backend = storage.CsvBackend(
+        data_folder=os.path.join(folder, "data"),
+        history_folder=os.path.join(folder, "history"),
+        team_folder=os.path.join(folder, "teams"),
+    )
+    start = datetime(2025, 1, 1)
+    for number, (lead, n, rows) in enumerate(zip(leads, split(interns, len(leads)), split(history_rows, len(leads))), 1):
+        frame = intern_frame(lead, number, n, rng)
+        backend.save_interns(lead, frame)
+        names = frame["Name"].tolist()
+        if names and rows:
+            batch = []
+            for entry in history_entries(names, rows, rng, start):
+                batch.append(entry)
+                if len(batch) == HISTORY_BATCH:
+                    backend.append_history_many(lead, batch)
+                    batch = []
+            if batch:
+                backend.append_history_many(lead, batch)
+        backend.save_teams(lead, team_tree(names, rng))
+    return backend
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic data/, history/ and teams/ tree")
+    parser.add_argument("folder")
+    parser.add_argument("--interns", type=int, default=10_000, help="interns across all tech leads")
+    parser.add_argument("--history", type=int, default=100_000, help="history rows across all tech leads")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_tree(args.folder, args.interns, args.history, seed=args.seed)
+    print(f"Wrote {args.interns:,} interns and {args.history:,} history rows under {args.folder}")
+
+
+if __name__ == "__main__":
+    main()
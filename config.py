@@ -0,0 +1,44 @@
+"""Deployment settings: storage locations, backend selection and the tech lead roster"""
+import os
+
+# Constants
+DATA_FOLDER = "data"
+HISTORY_FOLDER = "history"
+TEAM_FOLDER = "teams"
+# Daily per-lead counters behind the Super Admin trends charts
+SNAPSHOT_FOLDER = "snapshots"
+# Job table and report files of the Super Admin panel's background jobs
+JOB_FOLDER = "jobs"
+# "csv" keeps the data/, history/ and teams/ folders; "sqlite" uses one database file
+STORAGE_BACKEND = os.environ.get("TRACKER_STORAGE", "csv")
+SQLITE_PATH = os.environ.get("TRACKER_DB", "tracker.db")
+# "pyarrow" parses intern CSVs with the optional pyarrow engine instead of pandas' C parser
+CSV_ENGINE = os.environ.get("TRACKER_CSV_ENGINE", "c")
+# Threads reading tech leads' files at once for the Super Admin panel
+LOAD_WORKERS = int(os.environ.get("TRACKER_LOAD_WORKERS", "4"))
+# Threads running the Super Admin panel's background jobs
+JOB_WORKERS = int(os.environ.get("TRACKER_JOB_WORKERS", "2"))
+# SQLite full-text index of blockers, remarks and team progress behind the Search page
+SEARCH_INDEX_PATH = os.environ.get("TRACKER_SEARCH_DB", "search.db")
+TECH_LEADS = [
+    "nikhil", "Edla Divyansh Teja", "GANNARAM DHRUV",
+    "Satwik Rakhelkar", "Gadagoju Srikar", "Hasini Parre", "Shiva Kumar ambotu",
+    "Puneeth Peela", "Ch.Bhuvana Sri", "Guni Sreepranav", "Sai Kartikeyan Koduri",
+    "Sudheer Kumar"
+]
+
+# Team number shown (read-only) on each tech lead's Add/Update form
+TEAM_NUMBERS = {
+    "Satwik Rakhelkar": "1",
+    "Gadagoju Srikar": "2",
+    "Puneeth Peela": "3",
+    "Shiva Kumar ambotu": "4",
+    "nikhil": "5",
+    "Sai Kartikeyan Koduri": "6",
+    "Guni Sreepranav": "7",
+    "Hasini Parre": "8",
+    "Ch.Bhuvana Sri": "9",
+    "GANNARAM DHRUV": "10",
+    "Edla Divyansh Teja": "11",
+    "Sudheer Kumar": "12"
+}
@@ -0,0 +1,89 @@
+"""Streaming exports of intern frames as CSV, gzip-compressed CSV or Parquet.
+
+Exports are written one frame at a time into a spooled temporary file, so a
+combined report of every tech lead never needs all rows serialized in memory at
+once. Parquet needs the optional pyarrow package.
+"""
+import gzip
+import tempfile
+
+import profiling
+
+# Format name -> (file suffix, MIME type)
+EXPORT_FORMATS = {
+    "CSV": (".csv", "text/csv"),
+    "CSV (gzip)": (".csv.gz", "application/gzip"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+def available_formats():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return [name for name in EXPORT_FORMATS if name != "Parquet"]
+    return list(EXPORT_FORMATS)
+
+
+def chunks(frame, chunksize=5000):
+    """Split an in-memory frame into row chunks"""
+    for start in range(0, len(frame), chunksize):
+        yield frame.iloc[start:start + chunksize]
+
+
+def _aligned(frames, columns):
+    # Every chunk must have the columns of the first one, in the same order
+    for frame in frames:
+        if columns is None:
+            columns = list(frame.columns)
+        profiling.count("export_rows", len(frame))
+        yield frame.reindex(columns=columns)
+
+
+def _write_csv(frames, out, columns):
+    header = True
+    for frame in _aligned(frames, columns):
+        out.write(frame.to_csv(index=False, header=header).encode("utf-8"))
+        header = False
+    if header and columns:
+        out.write((",".join(columns) + "\n").encode("utf-8"))
+
+
+def _write_parquet(frames, out, columns):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for frame in _aligned(frames, columns):
+            # Strings throughout, so chunks with differently inferred types share a schema
+            table = pa.Table.from_pandas(frame.astype("string"), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(out, table.schema)
+            writer.write_table(table)
+        if writer is None:
+            schema = pa.schema([(column, pa.string()) for column in columns or []])
+            pq.write_table(schema.empty_table(), out)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def export_file(frames, fmt="CSV", columns=None):
+    """Write ``frames`` in export format ``fmt`` and return the rewound file
+
+    ``columns`` fixes the exported columns; by default the first frame's are used.
+    """
+    out = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    with profiling.span("export", format=fmt) as info:
+        if fmt == "Parquet":
+            _write_parquet(frames, out, columns)
+        elif fmt == "CSV (gzip)":
+            with gzip.GzipFile(fileobj=out, mode="wb") as compressed:
+                _write_csv(frames, compressed, columns)
+        else:
+            _write_csv(frames, out, columns)
+        info["bytes"] = out.tell()
+    out.seek(0)
+    return out
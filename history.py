@@ -0,0 +1,107 @@
+"""Field-level change records for the intern history log.
+
+An "Updated" entry stores only the fields that changed: ``Old`` and ``New`` are
+JSON objects of those fields' values before and after, and ``Changed_Fields``
+lists their names. "Added" entries store the full new record in ``New`` and
+"Deleted" entries the full old record in ``Old``, so replaying an intern's
+entries in order rebuilds the record as of any point in time.
+
+Entries written by older versions hold ``str(dict)`` reprs of whole rows; they
+are still parsed, and replay treats them as updates of every field.
+"""
+import ast
+import json
+from datetime import datetime
+
+from storage import clean_record
+
+
+def _blank(value):
+    # A text input showing a NaN cell gives back "nan"
+    return value is None or value in ("", "nan") or (isinstance(value, float) and value != value)
+
+
+def _same(old, new):
+    # Form inputs give "" and strings where the CSV gives NaN and numbers
+    if _blank(old) or _blank(new):
+        return _blank(old) and _blank(new)
+    return str(old) == str(new)
+
+
+def record_diff(old, new):
+    """Return (before, after) mappings of just the fields of ``new`` that differ
+
+    Fields missing from ``new`` were not written, so they are not changes.
+    """
+    old, new = clean_record(old or {}), clean_record(new or {})
+    changed = [key for key in new if not _same(old.get(key), new.get(key))]
+    return {key: old.get(key) for key in changed}, {key: new.get(key) for key in changed}
+
+
+def history_entry(intern, action, old=None, new=None, time=None):
+    """A history log entry; updates keep only the changed fields"""
+    if action == "Updated":
+        old, new = record_diff(old, new)
+        changed_fields = list(new)
+    else:
+        old = clean_record(old) if old else None
+        new = clean_record(new) if new else None
+        changed_fields = None
+    return {
+        "Time": time or datetime.now().isoformat(),
+        "Intern": intern,
+        "Action": action,
+        "Old": json.dumps(old) if old else "",
+        "New": json.dumps(new) if new else "",
+        "Changed_Fields": json.dumps(changed_fields) if changed_fields else "",
+    }
+
+
+class _NanToNone(ast.NodeTransformer):
+    def visit_Name(self, node):
+        return ast.Constant(None) if node.id == "nan" else node
+
+
+def parse_values(text):
+    """Field values stored in an entry's Old/New column, or {} if there are none"""
+    if _blank(text):
+        return {}
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        # Older entries: str(dict) of a whole row, with NaN printed as nan
+        return ast.literal_eval(_NanToNone().visit(ast.parse(text, mode="eval")))
+    except (SyntaxError, ValueError):
+        return {}
+
+
+def entry_changes(entry):
+    """Return (before, after) of the fields an entry changed
+
+    Whole-row entries from older versions are reduced to their differing fields.
+    """
+    old, new = parse_values(entry.get("Old")), parse_values(entry.get("New"))
+    if entry.get("Action") == "Updated":
+        return record_diff(old, new)
+    return old, new
+
+
+def replay(entries, record=None):
+    """Apply history entries, oldest first, to ``record``; None if the intern doesn't exist"""
+    record = dict(record) if record else None
+    for entry in entries:
+        action = entry.get("Action")
+        if action == "Added":
+            record = parse_values(entry.get("New"))
+        elif action == "Deleted":
+            record = None
+        elif action == "Updated":
+            record = {**(record or {}), **parse_values(entry.get("New"))}
+    return record
+
+
+def record_as_of(backend, lead, intern, as_of=None):
+    """Rebuild an intern's record as it was at ISO timestamp ``as_of`` (now if None)"""
+    return replay(backend.intern_history(lead, intern, until=as_of))
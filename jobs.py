@@ -0,0 +1,298 @@
+"""Background jobs for slow Super Admin operations, run in a thread pool off the Streamlit script.
+
+Every job is a row of a SQLite job table: its kind, a key identifying the work,
+status (queued, running, done or failed), progress, and a JSON result or the
+error. Submitting a job whose key matches one already queued or running
+returns that job instead, so admins who ask for the same work from several
+sessions share one run; keys that include the data's versions can also reuse a
+finished result. Files a job produces are written next to the table.
+
+The runner that owns a job refreshes its heartbeat while it is queued or
+running. Whenever jobs are submitted or read, those whose process has exited
+or whose heartbeat is older than STALE_SECONDS are marked failed, so a crash
+of any server process never leaves a job that others keep waiting on.
+"""
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+
+from aggregation import LEAD_COLUMN, in_teams, lead_statistics
+from exports import EXPORT_FORMATS, export_file
+from storage import load_leads
+
+JOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    label TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    result TEXT,
+    error TEXT,
+    pid INTEGER NOT NULL,
+    submitted TEXT NOT NULL,
+    started TEXT,
+    finished TEXT,
+    heartbeat REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_key ON jobs (key, status);
+"""
+ACTIVE = ("queued", "running")
+JOB_COLUMNS = ["id", "kind", "key", "label", "status", "progress", "message", "result", "error", "pid",
+               "submitted", "started", "finished", "heartbeat"]
+# How often a runner refreshes the heartbeat of its jobs, and when a job without one is given up on
+HEARTBEAT_SECONDS = 10
+STALE_SECONDS = 60
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # Exists, owned by someone else
+    return True
+
+
+def job_key(kind, **params):
+    """A key identifying ``kind`` of work on ``params``, for deduplication"""
+    return f"{kind}:{json.dumps(params, sort_keys=True, default=str)}"
+
+
+def data_version(backend, leads):
+    """A short digest of every lead's interns version; changes whenever any of them is written"""
+    versions = ",".join(str(backend.interns_version(lead)) for lead in leads)
+    return hashlib.sha1(versions.encode()).hexdigest()[:12]
+
+
+class Job:
+    """What a running job function gets: progress reporting and a place for its files"""
+
+    def __init__(self, runner, job_id):
+        self.runner = runner
+        self.id = job_id
+
+    def report(self, progress, message=""):
+        """Record progress (0 to 1) and what the job is doing"""
+        self.runner._update(self.id, progress=float(progress), message=message)
+
+    def path(self, name):
+        """Path of an output file of this job"""
+        return os.path.join(self.runner.folder, f"{self.id}_{name}")
+
+
+class JobRunner:
+    """The job table and the threads running its jobs, shared by every session in this process"""
+
+    def __init__(self, folder="jobs", max_workers=2, keep=50):
+        os.makedirs(folder, exist_ok=True)
+        self.folder = folder
+        self.path = os.path.join(folder, "jobs.db")
+        self.keep = keep
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._done = {}
+        self._lock = threading.Lock()
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(JOB_SCHEMA)
+            if "heartbeat" not in {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}:
+                conn.execute("ALTER TABLE jobs ADD COLUMN heartbeat REAL")  # Tables of older versions
+        self._fail_orphans()
+        self.prune()
+        self._stopped = threading.Event()
+        threading.Thread(target=self._beat, name="job-heartbeat", daemon=True).start()
+
+    @contextmanager
+    def _connection(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _update(self, job_id, **fields):
+        with self._connection() as conn:
+            conn.execute(
+                f"UPDATE jobs SET {', '.join(f'{name} = ?' for name in fields)} WHERE id = ?",
+                [*fields.values(), job_id]
+            )
+
+    def _beat(self):
+        while not self._stopped.wait(HEARTBEAT_SECONDS):
+            with self._connection() as conn:
+                conn.execute(
+                    f"UPDATE jobs SET heartbeat = ? WHERE pid = ? AND status IN ({', '.join('?' * len(ACTIVE))})",
+                    (time.time(), os.getpid(), *ACTIVE)
+                )
+
+    def _fail_orphans(self, conn=None):
+        """Mark failed the jobs of other processes that have exited or stopped sending heartbeats"""
+        if conn is None:
+            with self._transaction() as conn:
+                return self._fail_orphans(conn)
+        rows = conn.execute(
+            f"SELECT id, pid, heartbeat FROM jobs WHERE status IN ({', '.join('?' * len(ACTIVE))}) AND pid != ?",
+            (*ACTIVE, os.getpid())
+        ).fetchall()
+        stale = time.time() - STALE_SECONDS
+        for row in rows:
+            if not _alive(row["pid"]) or (row["heartbeat"] or 0) < stale:
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, finished = ? WHERE id = ?",
+                    ("Interrupted: the app stopped while the job ran", _now(), row["id"])
+                )
+
+    def prune(self):
+        """Forget all but the newest ``keep`` finished jobs, with their files"""
+        with self._transaction() as conn:
+            old = [row["id"] for row in conn.execute(
+                "SELECT id FROM jobs WHERE status NOT IN (?, ?) ORDER BY id DESC LIMIT -1 OFFSET ?", (*ACTIVE, self.keep)
+            )]
+            conn.executemany("DELETE FROM jobs WHERE id = ?", [(job_id,) for job_id in old])
+        old = set(old)
+        for name in os.listdir(self.folder):
+            prefix = name.split("_", 1)[0]
+            if prefix.isdigit() and int(prefix) in old:
+                os.remove(os.path.join(self.folder, name))
+
+    def submit(self, kind, key, label, func, *args, reuse=False):
+        """Queue ``func(*args, job=Job)`` unless a job with ``key`` is already queued or running
+
+        With ``reuse`` a job with ``key`` that finished successfully is returned
+        too. Returns the id of the new or matching job.
+        """
+        statuses = ACTIVE + (("done",) if reuse else ())
+        with self._transaction() as conn:
+            self._fail_orphans(conn)
+            row = conn.execute(
+                f"SELECT id FROM jobs WHERE key = ? AND status IN ({', '.join('?' * len(statuses))}) "
+                "ORDER BY id DESC LIMIT 1",
+                (key, *statuses)
+            ).fetchone()
+            if row is not None:
+                return row["id"]
+            job_id = conn.execute(
+                "INSERT INTO jobs (kind, key, label, status, pid, submitted, heartbeat) "
+                "VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                (kind, key, label, os.getpid(), _now(), time.time())
+            ).lastrowid
+        done = threading.Event()
+        with self._lock:
+            self._done[job_id] = done
+        self._pool.submit(self._run, job_id, func, args, done)
+        return job_id
+
+    def _run(self, job_id, func, args, done):
+        self._update(job_id, status="running", started=_now(), heartbeat=time.time())
+        try:
+            result = func(*args, job=Job(self, job_id))
+        except Exception as e:
+            self._update(job_id, status="failed", error=str(e), finished=_now())
+        else:
+            self._update(job_id, status="done", progress=1.0, result=json.dumps(result), finished=_now())
+        finally:
+            done.set()
+            with self._lock:
+                self._done.pop(job_id, None)
+
+    def wait(self, job_id, timeout):
+        """Wait up to ``timeout`` seconds for a job of this process to finish; the job as it then is"""
+        with self._lock:
+            done = self._done.get(job_id)
+        if done is not None:
+            done.wait(timeout)
+        return self.get(job_id)
+
+    def get(self, job_id):
+        """A job as a dict of JOB_COLUMNS, its result decoded; None if it is unknown"""
+        self._fail_orphans()
+        with self._connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._as_dict(row) if row else None
+
+    def recent(self, limit=10):
+        """The newest jobs, newest first"""
+        self._fail_orphans()
+        with self._connection() as conn:
+            rows = conn.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [self._as_dict(row) for row in rows]
+
+    @staticmethod
+    def _as_dict(row):
+        job = dict(row)
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
+        self._stopped.set()
+
+
+# Jobs of the Super Admin panel
+# Each takes the backend and its parameters plus the Job, and returns a
+# JSON-friendly result.
+
+def team_statistics(backend, leads, teams, max_workers, job, frames=None):
+    """Summary counters of every lead's interns in ``teams``, as lead_statistics() gives them
+
+    With ``frames`` (a storage.LeadsFrameCache) the interns are read through it,
+    so the admin panel can reuse the frame this job loaded.
+    """
+    job.report(0, f"Reading {len(leads)} tech leads' interns")
+    interns = frames.load(backend, leads, max_workers) if frames else load_leads(backend, leads, max_workers)
+    job.report(0.9, "Counting interns")
+    return {lead: dict(counts) for lead, counts in lead_statistics(interns[in_teams(interns, teams)]).items()}
+
+
+def combined_report(backend, leads, teams, export_format, columns, job):
+    """Every lead's interns, in ``teams`` if given, exported to one file; its path and download name"""
+    suffix, mime = EXPORT_FORMATS[export_format]
+
+    def frames():
+        # Chunk by chunk from storage, so no lead's interns are ever all in memory
+        for i, lead in enumerate(leads):
+            job.report(i / len(leads), f"Exporting {lead}'s interns")
+            for frame in backend.iter_interns(lead):
+                if teams:
+                    frame = frame[in_teams(frame, teams)]
+                yield frame.assign(**{LEAD_COLUMN: lead})
+
+    name = f"all_tech_leads_combined_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}"
+    path = job.path(name)
+    with export_file(frames(), export_format, columns) as f, open(path, "wb") as out:
+        shutil.copyfileobj(f, out)
+    return {"path": path, "file_name": name, "mime": mime}
+
+
+def compact_histories(backend, leads, job):
+    """Compact every lead's history log"""
+    for i, lead in enumerate(leads):
+        job.report(i / len(leads), f"Compacting {lead}'s history")
+        backend.compact_history(lead)
+    return {"leads": len(leads)}
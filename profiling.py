@@ -0,0 +1,123 @@
+"""Opt-in timing of the hot paths, collected per Streamlit rerun.
+
+Set ``TRACKER_PROFILE=1`` to record, for every rerun, a span per instrumented
+call (CSV reads and writes, history appends, exports, the Super Admin loads)
+with the rows and bytes it touched, plus counters such as frame cache hits.
+Finished runs are appended as JSON lines to ``TRACKER_PROFILE_LOG``
+(profile.jsonl by default) and the latest ones are shown in the sidebar.
+With profiling off, ``span`` and ``count`` return without recording anything.
+"""
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+ENABLED = os.environ.get("TRACKER_PROFILE", "").lower() in ("1", "true", "yes")
+LOG_PATH = os.environ.get("TRACKER_PROFILE_LOG", "profile.jsonl")
+# Runs kept per session for the sidebar panel
+KEEP_RUNS = 20
+
+_current = contextvars.ContextVar("profile_run", default=None)
+_log_lock = threading.Lock()
+
+
+class Run:
+    """Spans and counters recorded during one rerun"""
+
+    def __init__(self):
+        self.time = datetime.now().isoformat(timespec="milliseconds")
+        self.tags = {}
+        self.spans = []
+        self.counters = {}
+        self.depth = 0
+        self.start = time.perf_counter()
+        self.total_ms = None
+
+    def as_dict(self):
+        return {
+            "time": self.time, **self.tags, "total_ms": self.total_ms,
+            "counters": self.counters, "spans": self.spans,
+        }
+
+
+@contextmanager
+def span(name, **fields):
+    """Time the block as span ``name``; the yielded dict takes extra fields, e.g. rows"""
+    run = _current.get()
+    if run is None:
+        yield {}
+        return
+    info = dict(fields)
+    depth = run.depth
+    run.depth += 1
+    start = time.perf_counter()
+    try:
+        yield info
+    finally:
+        run.depth = depth
+        run.spans.append({
+            "name": name, "depth": depth,
+            "start_ms": round((start - run.start) * 1000, 3),
+            "ms": round((time.perf_counter() - start) * 1000, 3),
+            **info,
+        })
+
+
+def timed(name):
+    """Decorator recording each call as span ``name``"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count(name, n=1):
+    """Add ``n`` to counter ``name`` of the current run"""
+    run = _current.get()
+    if run is not None:
+        run.counters[name] = run.counters.get(name, 0) + n
+
+
+def tag(**fields):
+    """Attach fields such as the tech lead or page to the current run"""
+    run = _current.get()
+    if run is not None:
+        run.tags.update(fields)
+
+
+def _write_log(record, log_path):
+    line = json.dumps(record, default=str) + "\n"
+    with _log_lock, open(log_path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+@contextmanager
+def profile_run(runs=None, log_path=None, enabled=None):
+    """Record the spans of the enclosed rerun
+
+    The finished run is logged and appended to ``runs`` (trimmed to KEEP_RUNS)
+    even when the block exits through st.stop() or st.rerun(). Yields None when
+    profiling is off.
+    """
+    if not (ENABLED if enabled is None else enabled):
+        yield None
+        return
+    run = Run()
+    token = _current.set(run)
+    try:
+        yield run
+    finally:
+        _current.reset(token)
+        run.total_ms = round((time.perf_counter() - run.start) * 1000, 3)
+        record = run.as_dict()
+        if runs is not None:
+            runs.append(record)
+            del runs[:-KEEP_RUNS]
+        _write_log(record, log_path or LOG_PATH)
@@ -0,0 +1,122 @@
+"""Bulk import of intern rosters from CSV or Excel files.
+
+A roster is read with every cell as text, validated against INTERN_COLUMNS and
+INTERN_SCHEMA, then planned against the tech lead's current interns: rows whose
+Name is new become inserts, rows matching an existing intern become updates of
+the fields they fill in. Blank cells never overwrite existing values.
+"""
+import os
+
+import pandas as pd
+
+from history import history_entry, record_diff
+from storage import INTERN_COLUMNS, INTERN_SCHEMA
+
+
+def upload_types():
+    """File types the uploader accepts; Excel needs the optional openpyxl package"""
+    try:
+        import openpyxl  # noqa: F401
+    except ImportError:
+        return ["csv"]
+    return ["csv", "xlsx"]
+
+
+def read_roster(file, file_name):
+    """Parse an uploaded roster with every cell as a stripped string, blanks as ''"""
+    if os.path.splitext(file_name)[1].lower() == ".xlsx":
+        frame = pd.read_excel(file, dtype=str, keep_default_na=False)
+    else:
+        frame = pd.read_csv(file, dtype=str, keep_default_na=False)
+    frame.columns = [str(column).strip() for column in frame.columns]
+    return frame.apply(lambda column: column.str.strip())
+
+
+def template_csv():
+    """An empty roster with every intern column, as CSV bytes"""
+    return pd.DataFrame(columns=INTERN_COLUMNS).to_csv(index=False).encode("utf-8")
+
+
+def validate_roster(frame):
+    """Return (rows, problems, ignored columns) for a parsed roster
+
+    ``rows`` keeps the known intern columns with INTERN_SCHEMA values in their
+    canonical spelling (e.g. "yes" -> "Yes"). ``problems`` has one row per
+    invalid cell, numbered as in the file (header is row 1).
+    """
+    ignored = [column for column in frame.columns if column not in INTERN_COLUMNS]
+    rows = frame[[column for column in frame.columns if column in INTERN_COLUMNS]].copy()
+    line = pd.Series(range(2, len(rows) + 2), index=rows.index)
+    problems = []
+
+    if "Name" not in rows.columns:
+        problems.append({"Row": None, "Column": "Name", "Value": "", "Problem": "The file has no Name column"})
+        return rows, pd.DataFrame(problems), ignored
+    for i in rows.index[rows["Name"] == ""]:
+        problems.append({"Row": line[i], "Column": "Name", "Value": "", "Problem": "Name is required"})
+    duplicated = rows["Name"].ne("") & rows["Name"].duplicated(keep=False)
+    for i in rows.index[duplicated]:
+        problems.append({"Row": line[i], "Column": "Name", "Value": rows.at[i, "Name"], "Problem": "Name appears more than once"})
+
+    for column, categories in INTERN_SCHEMA.items():
+        if column not in rows.columns:
+            continue
+        canonical = {category.lower(): category for category in categories}
+        values = rows[column].str.lower().map(canonical)
+        invalid = rows[column].ne("") & values.isna()
+        for i in rows.index[invalid]:
+            problems.append({
+                "Row": line[i], "Column": column, "Value": rows.at[i, column],
+                "Problem": f"Must be one of: {', '.join(categories)}",
+            })
+        rows[column] = values.fillna(rows[column])
+
+    problems = pd.DataFrame(problems, columns=["Row", "Column", "Value", "Problem"])
+    return rows, problems.sort_values("Row", kind="stable", ignore_index=True), ignored
+
+
+def plan_import(rows, interns, defaults=None):
+    """Split validated rows into inserts and updates against an InternIndex
+
+    Returns (inserts, updates, unchanged): ``inserts`` are the filled-in
+    fields of new interns, ``updates`` are (name, old record, changed fields)
+    for existing interns whose filled-in cells differ, ``unchanged`` counts
+    existing interns with nothing to change. ``defaults`` are fields forced onto every row, like a
+    tech lead's fixed team number.
+    """
+    inserts, updates, unchanged = [], [], 0
+    for record in rows.to_dict("records"):
+        record.update(defaults or {})
+        name = record["Name"]
+        filled = {column: value for column, value in record.items() if value != ""}
+        if name not in interns:
+            inserts.append(filled)
+            continue
+        old = interns.get(name)
+        changed = record_diff(old, filled)[1]
+        # record_diff also lists fields that are blank in ``filled`` only because they were left empty
+        changed = {column: value for column, value in changed.items() if column in filled}
+        if changed:
+            updates.append((name, old, changed))
+        else:
+            unchanged += 1
+    return inserts, updates, unchanged
+
+
+def conflict_preview(updates):
+    """One row per changed field of the existing interns an import would update"""
+    return pd.DataFrame(
+        [
+            {"Name": name, "Field": column, "Current": old.get(column), "Imported": value}
+            for name, old, changed in updates for column, value in changed.items()
+        ],
+        columns=["Name", "Field", "Current", "Imported"],
+    )
+
+
+def import_records(inserts, updates):
+    """The records to write and the history entries describing them"""
+    records = inserts + [{"Name": name, **changed} for name, _, changed in updates]
+    entries = [history_entry(record["Name"], "Added", None, record) for record in inserts]
+    entries += [history_entry(name, "Updated", old, dict(old, **changed)) for name, old, changed in updates]
+    return records, entries
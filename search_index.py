@@ -0,0 +1,248 @@
+"""Full-text search over intern blockers and remarks and team progress, for every tech lead.
+
+The index is a SQLite FTS5 table of documents, one per non-empty text: an
+intern's "Blockers?" or "Remarks", or one phase of a team member's or a team's
+overall progress. Next to them it stores the interns and teams version of each
+tech lead it was built from. A page that saves hands the index the texts it
+changed along with the versions before and after its write, so a save costs a
+few row updates; a lead changed behind the index's back (another process, a
+migration, an index write that failed) no longer matches its stored version
+and is rebuilt from storage on the next search.
+"""
+import re
+import sqlite3
+from collections import namedtuple
+from contextlib import contextmanager
+
+import pandas as pd
+
+from aggregation import LEAD_COLUMN
+from teams import OVERALL_TEAM
+
+# Intern columns that are indexed
+SEARCH_FIELDS = ["Blockers?", "Remarks"]
+# Columns of a search result, best match first
+RESULT_COLUMNS = [LEAD_COLUMN, "Type", "Team", "Name", "Field", "Match", "Score"]
+
+SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    tech_lead TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    team TEXT NOT NULL,
+    name TEXT NOT NULL,
+    field TEXT NOT NULL,
+    body TEXT NOT NULL,
+    UNIQUE (tech_lead, kind, team, name, field)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    body, content='documents', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS documents_insert AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts (rowid, body) VALUES (new.id, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_delete AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, body) VALUES ('delete', old.id, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_update AFTER UPDATE ON documents BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, body) VALUES ('delete', old.id, old.body);
+    INSERT INTO documents_fts (rowid, body) VALUES (new.id, new.body);
+END;
+CREATE TABLE IF NOT EXISTS indexed_versions (
+    tech_lead TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    version TEXT NOT NULL,
+    PRIMARY KEY (tech_lead, kind)
+);
+"""
+
+# What one write changed: documents to set as (team, name, field, text), where a
+# blank text removes the document; interns whose documents all go; and whether
+# the documents replace everything the tech lead had of that kind
+Changes = namedtuple("Changes", ["documents", "dropped", "replace"], defaults=((), (), False))
+
+
+def _text(value):
+    return "" if value is None or (isinstance(value, float) and pd.isna(value)) else str(value)
+
+
+def intern_documents(records):
+    """Documents of the SEARCH_FIELDS present in each record, keyed by its Name"""
+    return [
+        ("", record["Name"], field, _text(record[field]))
+        for record in records for field in SEARCH_FIELDS if field in record
+    ]
+
+
+def team_documents(teams):
+    """Documents of every phase text of every team, the overall progress under OVERALL_TEAM"""
+    documents = []
+    for team_name, team_data in teams.items():
+        members = {OVERALL_TEAM: team_data.get('team_progress', {}), **team_data.get('members', {})}
+        for member, progress in members.items():
+            documents.extend(progress_documents(team_name, member, progress))
+    return documents
+
+
+def progress_documents(team, member, progress):
+    """Documents of some phases of one member's progress, or the team's if ``member`` is None"""
+    return [(team, member or OVERALL_TEAM, phase, _text(text)) for phase, text in progress.items()]
+
+
+def intern_changes(records):
+    return Changes(documents=intern_documents(records))
+
+
+def removed_intern(name):
+    return Changes(dropped=[name])
+
+
+def progress_changes(team, member, progress):
+    return Changes(documents=progress_documents(team, member, progress))
+
+
+def all_teams(teams):
+    return Changes(documents=team_documents(teams), replace=True)
+
+
+def match_query(text):
+    """An FTS5 query matching documents with a word starting with each word of ``text``; None if it has none
+
+    Prefixes stand in for stemming, so "deploy" finds "deployed" and
+    "deployment". Words are quoted so that FTS5 operators and punctuation
+    typed into the search box are taken literally.
+    """
+    words = re.findall(r"\w+", text)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+class SearchIndex:
+    """The FTS5 index file, shared by every session in this process"""
+
+    def __init__(self, path="search.db"):
+        self.path = path
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SEARCH_SCHEMA)
+
+    @contextmanager
+    def _connection(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _indexed_version(conn, lead, kind):
+        row = conn.execute(
+            "SELECT version FROM indexed_versions WHERE tech_lead = ? AND kind = ?", (lead, kind)
+        ).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _write(conn, lead, kind, version, changes):
+        if changes.replace:
+            conn.execute("DELETE FROM documents WHERE tech_lead = ? AND kind = ?", (lead, kind))
+        conn.executemany(
+            "DELETE FROM documents WHERE tech_lead = ? AND kind = ? AND team = '' AND name = ?",
+            [(lead, kind, name) for name in changes.dropped]
+        )
+        kept = [(lead, kind, *document) for document in changes.documents if document[3].strip()]
+        removed = [(lead, kind, *document[:3]) for document in changes.documents if not document[3].strip()]
+        conn.executemany(
+            "DELETE FROM documents WHERE tech_lead = ? AND kind = ? AND team = ? AND name = ? AND field = ?",
+            removed
+        )
+        conn.executemany(
+            "INSERT INTO documents (tech_lead, kind, team, name, field, body) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (tech_lead, kind, team, name, field) DO UPDATE SET body = excluded.body "
+            "WHERE body != excluded.body",
+            kept
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO indexed_versions (tech_lead, kind, version) VALUES (?, ?, ?)",
+            (lead, kind, str(version))
+        )
+
+    def apply(self, lead, kind, before, after, changes=None):
+        """Record a write that took ``kind`` ("interns" or "teams") of ``lead`` from version ``before`` to ``after``
+
+        Applied only if the index was built from ``before``; otherwise the
+        lead is left for refresh() to rebuild. Returns whether it was applied.
+        """
+        try:
+            with self._transaction() as conn:
+                if self._indexed_version(conn, lead, kind) != str(before):
+                    return False
+                self._write(conn, lead, kind, after, changes or Changes())
+            return True
+        except sqlite3.Error:
+            # The stored version is unchanged, so the next search rebuilds this lead
+            return False
+
+    def refresh(self, backend, leads):
+        """Rebuild the documents of every lead whose interns or teams no longer match the index"""
+        with self._connection() as conn:
+            indexed = {
+                (lead, kind): version
+                for lead, kind, version in conn.execute("SELECT tech_lead, kind, version FROM indexed_versions")
+            }
+        rebuilt = 0
+        for lead in leads:
+            # Versions are read before the data: a write landing in between
+            # leaves an older version behind and is picked up next time
+            version = backend.interns_version(lead)
+            if indexed.get((lead, "interns")) != str(version):
+                df = backend.load_interns(lead)
+                records = df[["Name"] + [field for field in SEARCH_FIELDS if field in df.columns]].to_dict("records")
+                self.replace(lead, "interns", version, intern_documents(records))
+                rebuilt += 1
+            version = backend.teams_version(lead)
+            if indexed.get((lead, "teams")) != str(version):
+                self.replace(lead, "teams", version, team_documents(backend.load_teams(lead)))
+                rebuilt += 1
+        return rebuilt
+
+    def replace(self, lead, kind, version, documents):
+        """Replace all of ``lead``'s documents of ``kind`` with ``documents``, built from ``version``"""
+        with self._transaction() as conn:
+            self._write(conn, lead, kind, version, Changes(documents=documents, replace=True))
+
+    def search(self, text, leads=None, limit=50):
+        """The best ``limit`` documents matching ``text`` as RESULT_COLUMNS, optionally only ``leads``'"""
+        query = match_query(text)
+        if query is None or (leads is not None and not leads):
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+        sql = (
+            "SELECT d.tech_lead, d.kind, d.team, d.name, d.field, "
+            "snippet(documents_fts, 0, '**', '**', ' … ', 16), bm25(documents_fts) "
+            "FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid "
+            "WHERE documents_fts MATCH ?"
+        )
+        params = [query]
+        if leads is not None:
+            sql += f" AND d.tech_lead IN ({', '.join('?' * len(leads))})"
+            params.extend(leads)
+        sql += " ORDER BY bm25(documents_fts) LIMIT ?"
+        params.append(limit)
+        with self._connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        hits = pd.DataFrame(rows, columns=RESULT_COLUMNS)
+        hits["Type"] = hits["Type"].map({"interns": "Intern", "teams": "Team"})
+        # bm25() is lower for better matches
+        hits["Score"] = (-hits["Score"]).round(2)
+        return hits
@@ -0,0 +1,220 @@
+"""Daily per-tech-lead snapshots of the summary counters and team progress, for the trends view.
+
+A snapshot row is (Date, Tech Lead, Metric, Value): the intern counters of
+aggregation (``total_interns``, ``offers_received``, ``cohort:Cohort 1``, ...)
+plus the team counters of TEAM_METRICS, as they stood at the end of that day.
+Counters that are zero are left out. Rows are kept in one Parquet file, or a
+CSV file without the optional pyarrow package, and the trends view reads
+nothing else.
+
+Days before the first snapshot can be backfilled by replaying the history log
+backwards from the current interns; teams have no history, so backfilled days
+carry intern counters only. Run as a script to snapshot today, e.g. from cron:
+
+    python snapshots.py [--backfill]
+"""
+import argparse
+import os
+import threading
+from collections import Counter
+from datetime import date, timedelta
+
+import pandas as pd
+
+from aggregation import LEAD_COLUMN, apply_delta, summarize_interns
+from config import DATA_FOLDER, HISTORY_FOLDER, SNAPSHOT_FOLDER, SQLITE_PATH, STORAGE_BACKEND, TEAM_FOLDER, TECH_LEADS
+from history import entry_changes, parse_values
+from storage import atomic_write, clean_record, file_lock, open_backend
+from teams import OVERALL_TEAM, TeamProgressCache
+
+SNAPSHOT_COLUMNS = ["Date", LEAD_COLUMN, "Metric", "Value"]
+# Team counters of a snapshot; completion rates are done / total
+TEAM_METRICS = ["teams", "team_members", "member_phases_done", "member_phases", "team_phases_done", "team_phases"]
+
+
+def _columnar():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def team_counts(progress):
+    """TEAM_METRICS of every tech lead in a cross-lead progress table (see teams.progress_frame)"""
+    members = progress[progress["Member"] != OVERALL_TEAM]
+    overall = progress[progress["Member"] == OVERALL_TEAM]
+
+    def by_lead(frame):
+        return frame.groupby(LEAD_COLUMN, sort=False)
+
+    table = pd.DataFrame({
+        "teams": by_lead(progress)["Team"].nunique(),
+        "team_members": by_lead(members.drop_duplicates([LEAD_COLUMN, "Team", "Member"])).size(),
+        "member_phases_done": by_lead(members)["Done"].sum(),
+        "member_phases": by_lead(members).size(),
+        "team_phases_done": by_lead(overall)["Done"].sum(),
+        "team_phases": by_lead(overall).size(),
+    }).fillna(0)
+    return {lead: Counter({key: int(n) for key, n in row.items() if n}) for lead, row in table.iterrows()}
+
+
+def snapshot_frame(day, counts):
+    """Snapshot rows of ``day`` from a mapping of tech lead -> counters"""
+    rows = [
+        (pd.Timestamp(day), lead, metric, int(value))
+        for lead, lead_counts in counts.items() for metric, value in sorted(lead_counts.items()) if value
+    ]
+    return pd.DataFrame(rows, columns=SNAPSHOT_COLUMNS)
+
+
+def take_snapshot(backend, leads, progress, day=None):
+    """Today's (or ``day``'s) snapshot of ``leads`` from their summary counters and progress table"""
+    counts = {lead: Counter() for lead in leads}
+    for lead, lead_counts in backend.load_summary(leads).items():
+        counts[lead].update(lead_counts)
+    for lead, lead_counts in team_counts(progress).items():
+        if lead in counts:
+            counts[lead].update(lead_counts)
+    return snapshot_frame(day or date.today(), counts)
+
+
+def _undo(records, counts, entry):
+    """Step ``records`` and their ``counts`` back to before a history entry"""
+    name, action = entry["Intern"], entry["Action"]
+    current = records.get(name)
+    if action == "Added":
+        before = None
+    elif action == "Deleted":
+        before = parse_values(entry["Old"])
+    elif current is not None:
+        old, _ = entry_changes(entry)
+        before = {**current, **old}
+    else:
+        return counts  # An update of an intern the log never added; nothing to step back
+    if before is None:
+        records.pop(name, None)
+    else:
+        records[name] = before
+    return apply_delta(counts, added=before, removed=current)
+
+
+def backfill_frame(backend, lead, until=None):
+    """Intern counters of ``lead`` for every day from its first history entry to ``until`` (yesterday)
+
+    Replays the history log backwards from the current interns, so interns
+    that predate the log are counted with their earliest logged values.
+    """
+    until = pd.Timestamp(until or date.today() - timedelta(days=1))
+    history = backend.load_history(lead)
+    if history.empty:
+        return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+    history = history.assign(Day=history["Time"].astype(str).str[:10]).sort_values("Time", kind="stable")
+    interns = backend.load_interns(lead)
+    records = {record["Name"]: clean_record(record) for record in interns.to_dict("records")}
+    counts = summarize_interns(interns)
+
+    entries = history.to_dict("records")
+    rows = []
+    for day in pd.date_range(history["Day"].iloc[0], until)[::-1]:
+        day_text = day.strftime("%Y-%m-%d")
+        while entries and entries[-1]["Day"] > day_text:
+            counts = _undo(records, counts, entries.pop())
+        rows.append(snapshot_frame(day, {lead: counts}))
+    if not rows:
+        return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+    return pd.concat(rows[::-1], ignore_index=True)
+
+
+class SnapshotStore:
+    """The snapshot file, rewritten atomically under a lock on every write"""
+
+    def __init__(self, folder="snapshots"):
+        os.makedirs(folder, exist_ok=True)
+        self.columnar = _columnar()
+        self.path = os.path.join(folder, "lead_snapshots.parquet" if self.columnar else "lead_snapshots.csv")
+        # Day whose snapshot this process has already made sure of
+        self._checked_day = None
+        self._lock = threading.Lock()
+
+    def load(self, metrics=None, day=None):
+        """Snapshot rows, only of ``metrics`` and of ``day`` if given, oldest first"""
+        if not os.path.exists(self.path):
+            return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+        if self.columnar:
+            # Parquet skips the row groups and columns a filter rules out
+            filters = ([("Metric", "in", list(metrics))] if metrics else []) + (
+                [("Date", "==", pd.Timestamp(day))] if day is not None else []
+            )
+            return pd.read_parquet(self.path, filters=filters or None)
+        frame = pd.read_csv(self.path, parse_dates=["Date"])
+        if metrics:
+            frame = frame[frame["Metric"].isin(metrics)]
+        if day is not None:
+            frame = frame[frame["Date"] == pd.Timestamp(day)]
+        return frame
+
+    def metrics(self):
+        """Every metric with a snapshot"""
+        if not os.path.exists(self.path):
+            return []
+        if self.columnar:
+            return pd.read_parquet(self.path, columns=["Metric"])["Metric"].unique().tolist()
+        return self.load()["Metric"].unique().tolist()
+
+    def snapshot_once(self, day, leads, take):
+        """Store ``take(missing)`` for the ``leads`` without a snapshot on ``day``
+
+        The file is looked at only on the first call of each day in this
+        process, and snapshots already taken (by the script or another
+        process) are left alone. Returns the number of rows written.
+        """
+        with self._lock:
+            if self._checked_day == day:
+                return 0
+            taken = set(self.load(day=day)[LEAD_COLUMN])
+            missing = [lead for lead in leads if lead not in taken]
+            written = self.write(take(missing), overwrite=False) if missing else 0
+            self._checked_day = day
+        return written
+
+    def write(self, frame, overwrite=True):
+        """Store snapshot rows; with ``overwrite`` they replace the days they cover, otherwise only fill gaps"""
+        if frame.empty:
+            return 0
+        with file_lock(self.path):
+            stored = self.load()
+            keys = frame[["Date", LEAD_COLUMN]].drop_duplicates()
+            taken = pd.MultiIndex.from_frame(stored[["Date", LEAD_COLUMN]])
+            if overwrite:
+                stored = stored[~taken.isin(pd.MultiIndex.from_frame(keys))]
+            else:
+                frame = frame[~pd.MultiIndex.from_frame(frame[["Date", LEAD_COLUMN]]).isin(taken)]
+            combined = pd.concat([stored, frame], ignore_index=True) if not stored.empty else frame
+            combined = combined.astype({"Value": "int64"}).sort_values(["Date", LEAD_COLUMN, "Metric"], ignore_index=True)
+            if self.columnar:
+                atomic_write(self.path, lambda f: combined.to_parquet(f, index=False), binary=True)
+            else:
+                atomic_write(self.path, lambda f: combined.to_csv(f, index=False))
+        return len(frame)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store today's per-lead snapshot for the trends view")
+    parser.add_argument("--backfill", action="store_true",
+                        help="also fill days without a snapshot by replaying the history logs")
+    args = parser.parse_args()
+    backend = open_backend(
+        STORAGE_BACKEND, sqlite_path=SQLITE_PATH,
+        data_folder=DATA_FOLDER, history_folder=HISTORY_FOLDER, team_folder=TEAM_FOLDER
+    )
+    store = SnapshotStore(SNAPSHOT_FOLDER)
+    if args.backfill:
+        for lead in TECH_LEADS:
+            print(f"{lead}: {store.write(backfill_frame(backend, lead), overwrite=False)} rows backfilled")
+    progress = TeamProgressCache().load(backend, TECH_LEADS)
+    print(f"Today: {store.write(take_snapshot(backend, TECH_LEADS, progress))} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1305 @@
+"""Storage backends for intern records, change history and project teams.
+
+CsvBackend keeps the original layout (data/<lead>.csv, history/<lead>_history*.jsonl,
+teams/<lead>_teams.json plus a small progress journal) and replaces files atomically
+under an advisory lock.
+SqliteBackend keeps everything in one WAL-mode database and touches a single row
+per intern write. Both reject writes whose expected_version is out of date. Run ``python storage.py --help`` to
+import an existing CSV tree into SQLite.
+"""
+import glob
+import json
+import os
+import shutil
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import pandas as pd
+
+import profiling
+from aggregation import LEAD_COLUMN, apply_delta, summarize_interns
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+INTERN_COLUMNS = [
+    "Name", "Cohort", "Team(eg :2 or 3)", "GitLab User Name", "Year", "Received Offer letter", "College",
+    "GitLab Acc (README.md)", "GitLab Acc Link",
+    "Innings Courses (Python & AI)", "Huggingchat/Dify", "Huggingchat Link",
+    "Streamlit app and Deployment", "Streamlit Link",
+    "Huggingface+streamlit integration", "HF+Streamlit Link",
+    "Pushed Apps onto GitLab", "Data Collection (started?)", "Size of Data",
+    "Can go to any other places", "Blockers?", "Remarks", "Active"
+]
+# Superseded by "Team(eg :2 or 3)"; dropped whenever a record is written
+LEGACY_COLUMNS = ["Team"]
+HISTORY_COLUMNS = ["Time", "Intern", "Action", "Old", "New", "Changed_Fields"]
+# Declared categories of the low-cardinality intern columns. Loaded frames hold
+# these as categoricals (values outside the declared ones are kept as extra
+# categories); every other column stays as strings.
+YES_NO = ["Yes", "No"]
+INTERN_SCHEMA = {
+    "Cohort": ["Cohort 1", "Cohort 2"],
+    "Year": ["1", "2", "3", "4"],
+    "Received Offer letter": YES_NO,
+    "Pushed Apps onto GitLab": YES_NO,
+    "Data Collection (started?)": YES_NO,
+    "Active": ["Yes", "No", "Academic Break"],
+}
+HISTORY_SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+# Team progress journals are folded back into the teams JSON past this size
+TEAM_PROGRESS_MAX_BYTES = 256 * 1024
+
+
+def lead_slug(lead):
+    return lead.replace(' ', '_')
+
+
+def empty_interns():
+    return apply_schema(pd.DataFrame(columns=INTERN_COLUMNS))
+
+
+def _as_category(series, categories):
+    if series.dtype.kind == "f" and (series.dropna() % 1 == 0).all():
+        # Whole numbers parsed as floats because of blanks, e.g. Year
+        series = series.astype("Int64")
+    if not pd.api.types.is_string_dtype(series):
+        # Numbers, booleans and all-blank columns; string columns convert as they are
+        series = series.astype(object).where(series.notna(), None).map(str, na_action="ignore")
+    extra = sorted(set(series.dropna().unique()) - set(categories))
+    return series.astype(pd.CategoricalDtype(categories + extra))
+
+
+def apply_schema(frame):
+    """Return ``frame`` with the INTERN_SCHEMA columns converted to categoricals"""
+    converted = {
+        column: _as_category(frame[column], categories)
+        for column, categories in INTERN_SCHEMA.items() if column in frame.columns
+    }
+    return frame.assign(**converted)
+
+
+def set_fields(frame, rows, fields):
+    """Assign ``fields`` to ``rows`` (a mask or an index label), adding any new categories first"""
+    for column, value in fields.items():
+        if column in frame.columns and isinstance(frame[column].dtype, pd.CategoricalDtype):
+            if value is not None and value == value and value not in frame[column].cat.categories:
+                frame[column] = frame[column].cat.add_categories([value])
+        try:
+            frame.loc[rows, column] = value
+        except (TypeError, ValueError):
+            # e.g. text typed into a column read as all-blank floats
+            frame[column] = frame[column].astype(object)
+            frame.loc[rows, column] = value
+
+
+def assign_records(frame, labels, records):
+    """Assign each record's fields to the row with the matching label, one column at a time"""
+    columns = {}
+    for label, record in zip(labels, records):
+        for column, value in record.items():
+            rows, values = columns.setdefault(column, ([], []))
+            rows.append(label)
+            values.append(value)
+    for column, (rows, values) in columns.items():
+        if column in frame.columns and isinstance(frame[column].dtype, pd.CategoricalDtype):
+            new = {v for v in values if v is not None and v == v} - set(frame[column].cat.categories)
+            if new:
+                frame[column] = frame[column].cat.add_categories(sorted(new))
+        try:
+            frame.loc[rows, column] = values
+        except (TypeError, ValueError):
+            frame[column] = frame[column].astype(object)
+            frame.loc[rows, column] = values
+
+
+class InternIndex:
+    """Name -> row label map over a loaded intern frame, for O(1) single-intern reads and updates
+
+    Like the ``df[df["Name"] == name].iloc[0]`` lookups it replaces, the first
+    row wins when a name appears twice.
+    """
+
+    def __init__(self, frame):
+        self.frame = frame
+        names, labels = frame["Name"].tolist(), frame.index.tolist()
+        self.rows = dict(zip(reversed(names), reversed(labels)))
+
+    def __contains__(self, name):
+        return name in self.rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get(self, name, default=None):
+        """The intern's record as a dict, or ``default`` if there is no such intern"""
+        if name not in self.rows:
+            return default
+        return self.frame.loc[self.rows[name]].to_dict()
+
+    def value(self, name, column, default=None):
+        if name not in self.rows or column not in self.frame.columns:
+            return default
+        return self.frame.at[self.rows[name], column]
+
+    def update(self, name, fields):
+        """Assign ``fields`` to the intern's row in place"""
+        set_fields(self.frame, self.rows[name], fields)
+
+
+def memory_report(frame):
+    """Deep memory usage per column of a plain frame and of the same frame with INTERN_SCHEMA applied"""
+    report = pd.DataFrame({
+        "raw_bytes": frame.memory_usage(deep=True, index=False),
+        "typed_bytes": apply_schema(frame).memory_usage(deep=True, index=False),
+    })
+    report.loc["total"] = report.sum()
+    return report
+
+
+def clean_record(record):
+    """Convert numpy scalars and NaN into plain JSON-friendly values"""
+    cleaned = {}
+    for key, value in record.items():
+        if key in LEGACY_COLUMNS:
+            continue
+        if hasattr(value, "item"):
+            value = value.item()
+        if isinstance(value, float) and value != value:
+            value = None
+        cleaned[key] = value
+    return cleaned
+
+
+class StaleDataError(Exception):
+    """Raised when a write is based on data another session has since changed"""
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive advisory lock on ``path``, shared by every thread and process"""
+    with open(path + ".lock", "a+") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def file_version(path):
+    """Version token of a file; every atomic_write() produces a new inode and mtime"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return "0"
+    return f"{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def check_version(path, expected_version, current=None):
+    current = file_version(path) if current is None else current
+    if expected_version is not None and current != expected_version:
+        raise StaleDataError(
+            f"{os.path.basename(path)} was changed by another session since you loaded it. "
+            "Reload the page and try again."
+        )
+
+
+def atomic_write(path, write, binary=False):
+    """Call ``write(f)`` on a temp file next to ``path``, then swap it into place"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with (open(tmp_path, 'wb') if binary else open(tmp_path, 'w', encoding="utf-8", newline="")) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return file_version(path)
+
+
+class FrameCache:
+    """Process-wide LRU of parsed CSV frames, validated against file mtime and size"""
+
+    def __init__(self, max_entries=64, convert=None, engine=None):
+        self.max_entries = max_entries
+        self.convert = convert
+        self.engine = engine
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read_csv(self, path, copy=True):
+        """Return the parsed CSV, re-parsing only if the file changed
+
+        The frame is a private copy unless ``copy`` is False, in which case the
+        caller must treat it as read-only.
+        """
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._frames.get(path)
+            if entry is not None and entry[0] == key:
+                self._frames.move_to_end(path)
+                profiling.count("frame_cache_hits")
+                return entry[1].copy() if copy else entry[1]
+        profiling.count("frame_cache_misses")
+        with profiling.span("read_csv", path=path, bytes=stat.st_size) as info:
+            frame = pd.read_csv(path, engine=self.engine)
+            if self.convert is not None:
+                frame = self.convert(frame)
+            info["rows"] = len(frame)
+        with self._lock:
+            self._frames[path] = (key, frame)
+            self._frames.move_to_end(path)
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+        return frame.copy() if copy else frame
+
+    def invalidate(self, path):
+        with self._lock:
+            self._frames.pop(path, None)
+
+
+class LeadsFrameCache:
+    """The load_leads() frame of every lead, shared by a process until any lead's interns change
+
+    Keyed by each lead's interns version, so a write from any session or
+    process makes the next load read the leads again.
+    """
+
+    def __init__(self):
+        self._cached = None
+        self._lock = threading.Lock()
+
+    def get(self, backend, leads):
+        """The frame of ``leads`` if it is loaded and current, else None; callers must not modify it"""
+        key = tuple((lead, backend.interns_version(lead)) for lead in leads)
+        with self._lock:
+            cached = self._cached
+        return cached[1] if cached is not None and cached[0] == key else None
+
+    def load(self, backend, leads, max_workers=4):
+        """Every lead's interns tagged with LEAD_COLUMN, read again only if one of them changed"""
+        key = tuple((lead, backend.interns_version(lead)) for lead in leads)
+        with self._lock:
+            cached = self._cached
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        # Versions are read first, so a write during the load only costs a reload next time
+        frame = load_leads(backend, leads, max_workers)
+        with self._lock:
+            self._cached = (key, frame)
+        return frame
+
+
+def apply_progress(teams, rows):
+    """Overlay (team, member, phase, text) progress rows onto ``teams`` in place
+
+    A blank member is the team's overall progress. Rows for teams or members
+    that no longer exist are skipped.
+    """
+    for team_name, member, phase, text in rows:
+        team = teams.get(team_name)
+        if team is None:
+            continue
+        if not member:
+            team.setdefault("team_progress", {})[phase] = text
+        elif member in team.get("members", {}):
+            team["members"][member][phase] = text
+    return teams
+
+
+def check_progress_target(teams, team, member):
+    """Raise KeyError unless ``team`` (and ``member``, if given) exist"""
+    if team not in teams:
+        raise KeyError(team)
+    if member and member not in teams[team]["members"]:
+        raise KeyError(member)
+
+
+class HistoryIndex:
+    """Location of every history record of a tech lead, oldest first, grouped by intern"""
+
+    def __init__(self, entries):
+        # (file, offset or legacy row, length, time, intern)
+        self.entries = entries
+        self.by_intern = {}
+        for position, entry in enumerate(entries):
+            self.by_intern.setdefault(entry[4], []).append(position)
+
+    def select(self, interns=None, start=None, end=None):
+        """Positions of the matching records, newest first"""
+        if interns is None:
+            positions = range(len(self.entries) - 1, -1, -1)
+        else:
+            positions = sorted(
+                (position for name in set(interns) for position in self.by_intern.get(name, ())),
+                reverse=True
+            )
+        if start is None and end is None:
+            return positions
+        return [
+            position for position in positions
+            if (start is None or (self.entries[position][3] or "") >= start)
+            and (end is None or (self.entries[position][3] or "") < end)
+        ]
+
+
+class CsvBackend:
+    """One CSV of interns, one JSON Lines history log and one teams JSON per tech lead"""
+
+    def __init__(self, data_folder="data", history_folder="history", team_folder="teams", csv_engine=None):
+        if csv_engine == "pyarrow":
+            # Fail at startup rather than on the first read if the optional package is missing
+            import pyarrow  # noqa: F401
+        self.data_folder = data_folder
+        self.history_folder = history_folder
+        self.team_folder = team_folder
+        # Whole-file intern reads may use the pyarrow engine; chunked reads always use the C parser
+        self.frames = FrameCache(convert=apply_schema, engine=csv_engine)
+        self.history_frames = FrameCache(max_entries=16)
+        self._segment_indexes = {}
+        self._history_indexes = {}
+        for folder in (data_folder, history_folder, team_folder):
+            os.makedirs(folder, exist_ok=True)
+
+    # Interns
+    def data_path(self, lead):
+        return os.path.join(self.data_folder, f"{lead_slug(lead)}.csv")
+
+    def load_interns(self, lead):
+        path = self.data_path(lead)
+        if os.path.exists(path):
+            return self.frames.read_csv(path)
+        return empty_interns()
+
+    def iter_interns(self, lead, chunksize=5000):
+        """Yield a tech lead's interns in frames of at most ``chunksize`` rows"""
+        path = self.data_path(lead)
+        if os.path.exists(path):
+            yield from pd.read_csv(path, chunksize=chunksize)
+
+    def interns_version(self, lead):
+        return file_version(self.data_path(lead))
+
+    # Every intern write re-reads the file under the lock, applies its change and
+    # atomically replaces the CSV. Passing expected_version rejects the write with
+    # StaleDataError if the file changed since the caller loaded it. Writes return
+    # the new version.
+    def _write_interns(self, lead, path, frame):
+        frame = frame.drop(columns=[c for c in LEGACY_COLUMNS if c in frame.columns])
+        with profiling.span("write_interns_csv", path=path, rows=len(frame)) as info:
+            version = atomic_write(path, lambda f: frame.to_csv(f, index=False))
+            info["bytes"] = os.path.getsize(path)
+        self.frames.invalidate(path)
+        self._store_summary(lead, version, summarize_interns(frame))
+        return version
+
+    @contextmanager
+    def _locked_interns(self, lead, expected_version):
+        path = self.data_path(lead)
+        with file_lock(path):
+            check_version(path, expected_version)
+            yield path
+
+    def save_interns(self, lead, frame, expected_version=None):
+        """Replace all of a tech lead's interns"""
+        with self._locked_interns(lead, expected_version) as path:
+            return self._write_interns(lead, path, frame)
+
+    def upsert_intern(self, lead, record, expected_version=None):
+        with self._locked_interns(lead, expected_version) as path:
+            frame = self.load_interns(lead)
+            mask = frame["Name"] == record["Name"]
+            if mask.any():
+                set_fields(frame, mask, record)
+            else:
+                frame = pd.concat([frame, pd.DataFrame([record])], ignore_index=True)
+            return self._write_interns(lead, path, frame)
+
+    def upsert_interns(self, lead, records, expected_version=None):
+        """Insert or update many interns with a single rewrite of the CSV"""
+        with self._locked_interns(lead, expected_version) as path:
+            frame = self.load_interns(lead)
+            index = InternIndex(frame)
+            existing = [record for record in records if record["Name"] in index]
+            assign_records(frame, [index.rows[record["Name"]] for record in existing], existing)
+            new = [record for record in records if record["Name"] not in index]
+            if new:
+                frame = pd.concat([frame, pd.DataFrame(new)], ignore_index=True)
+            return self._write_interns(lead, path, frame)
+
+    def update_intern(self, lead, name, fields, expected_version=None):
+        with self._locked_interns(lead, expected_version) as path:
+            frame = self.load_interns(lead)
+            mask = frame["Name"] == name
+            if not mask.any():
+                raise KeyError(name)
+            set_fields(frame, mask, fields)
+            return self._write_interns(lead, path, frame)
+
+    def update_interns(self, lead, names, fields, expected_version=None):
+        """Assign the same ``fields`` to every intern in ``names`` with a single rewrite"""
+        with self._locked_interns(lead, expected_version) as path:
+            frame = self.load_interns(lead)
+            set_fields(frame, frame["Name"].isin(names), fields)
+            return self._write_interns(lead, path, frame)
+
+    def delete_intern(self, lead, name, expected_version=None):
+        with self._locked_interns(lead, expected_version) as path:
+            frame = self.load_interns(lead)
+            return self._write_interns(lead, path, frame[frame["Name"] != name])
+
+    # Summary index
+    # data/_summary.json holds each tech lead's summary counters next to the CSV
+    # version they were computed from. Intern writes refresh their lead's entry
+    # from the frame they just wrote; load_summary() rebuilds entries whose CSV
+    # was changed outside the backend.
+    @property
+    def summary_path(self):
+        return os.path.join(self.data_folder, "_summary.json")
+
+    def _read_summary(self):
+        if not os.path.exists(self.summary_path):
+            return {}
+        with open(self.summary_path, 'r') as f:
+            return json.load(f)
+
+    def _store_summary(self, lead, version, counts):
+        with file_lock(self.summary_path):
+            summary = self._read_summary()
+            summary[lead] = {"version": version, "counts": dict(counts)}
+            atomic_write(self.summary_path, lambda f: json.dump(summary, f))
+
+    @profiling.timed("load_summary")
+    def load_summary(self, leads):
+        """Summary counters of every lead in ``leads`` that has interns"""
+        summary = self._read_summary()
+        result = {}
+        for lead in leads:
+            version = self.interns_version(lead)
+            if version == "0":
+                continue
+            entry = summary.get(lead)
+            if entry is None or entry["version"] != version:
+                profiling.count("summary_rebuilds")
+                counts = summarize_interns(self.load_interns(lead))
+                self._store_summary(lead, version, counts)
+            else:
+                counts = entry["counts"]
+            if counts.get("total_interns"):
+                result[lead] = dict(counts)
+        return result
+
+    # History
+    # Each tech lead's history is an append-only JSON Lines log. The active segment
+    # ("<lead>_history.jsonl") is sealed into a numbered segment once it grows past
+    # HISTORY_SEGMENT_MAX_BYTES, so a save never touches more than one line on disk.
+    # "<lead>_history.csv" files written by older versions are read as the oldest
+    # segment until compact_history() folds them into the log.
+    #
+    # Every segment has a "<segment>.idx" sidecar with one [offset, length, time,
+    # intern] line per record, so the Change History page can pick a page of
+    # records from the index and seek straight to them. Missing or short indexes
+    # are rebuilt by scanning the uncovered tail of the segment.
+    def history_paths(self, lead):
+        """Return (active segment, legacy CSV, sealed segments oldest first) for a tech lead"""
+        prefix = os.path.join(self.history_folder, f"{lead_slug(lead)}_history")
+        sealed = sorted(glob.glob(f"{glob.escape(prefix)}.[0-9]*.jsonl"))
+        return f"{prefix}.jsonl", f"{prefix}.csv", sealed
+
+    @staticmethod
+    def read_history_segment(path):
+        with open(path, 'r', encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    @staticmethod
+    def _scan_segment(segment, start=0):
+        entries = []
+        with open(segment, 'rb') as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Partially written last line
+                    break
+                if line.strip():
+                    record = json.loads(line)
+                    entries.append([offset, len(line), record.get("Time"), record.get("Intern")])
+                offset += len(line)
+        return entries
+
+    def _segment_index(self, segment, persist=False):
+        """Index entries [offset, length, time, intern] of a segment, oldest first"""
+        stat = os.stat(segment)
+        key = (stat.st_size, stat.st_mtime_ns)
+        cached = self._segment_indexes.get(segment)
+        if cached is not None and cached[0] == key and (cached[2] or not persist):
+            return cached[1]
+        idx_file = segment + ".idx"
+        entries = []
+        if os.path.exists(idx_file):
+            with open(idx_file, 'r', encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        covered = entries[-1][0] + entries[-1][1] if entries else 0
+        if covered > stat.st_size:
+            # Left over from a file that has since been replaced
+            entries, covered = [], 0
+        persisted = covered == stat.st_size
+        if not persisted:
+            entries = entries + self._scan_segment(segment, covered)
+            if persist:
+                atomic_write(idx_file, lambda f: f.writelines(json.dumps(e) + "\n" for e in entries))
+                persisted = True
+        self._segment_indexes[segment] = (key, entries, persisted)
+        return entries
+
+    def _history_index(self, lead):
+        """HistoryIndex over the legacy CSV and every segment, rebuilt only when a file changed"""
+        active_file, legacy_file, sealed = self.history_paths(lead)
+        segments = sealed + ([active_file] if os.path.exists(active_file) else [])
+        files = ([legacy_file] if os.path.exists(legacy_file) else []) + segments
+        signature = tuple((path, os.stat(path).st_size, os.stat(path).st_mtime_ns) for path in files)
+        cached = self._history_indexes.get(lead)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        entries = []
+        if os.path.exists(legacy_file):
+            legacy = self.history_frames.read_csv(legacy_file, copy=False)
+            for row, (time, intern) in enumerate(zip(legacy["Time"], legacy["Intern"])):
+                entries.append((legacy_file, row, 0, str(time), intern))
+        for segment in segments:
+            entries.extend((segment, *entry) for entry in self._segment_index(segment))
+        index = HistoryIndex(entries)
+        self._history_indexes[lead] = (signature, index)
+        return index
+
+    def append_history(self, lead, history_entry):
+        self.append_history_many(lead, [history_entry])
+
+    def append_history_many(self, lead, history_entries):
+        """Append history records, sealing the active segment when it gets too big"""
+        active_file, _, _ = self.history_paths(lead)
+        with file_lock(active_file):
+            offset = 0
+            if os.path.exists(active_file):
+                # Bring the index up to date before extending it
+                self._segment_index(active_file, persist=True)
+                offset = os.path.getsize(active_file)
+            lines, index_lines = [], []
+            for entry in history_entries:
+                line = (json.dumps(entry) + "\n").encode("utf-8")
+                lines.append(line)
+                index_lines.append(json.dumps([offset, len(line), entry.get("Time"), entry.get("Intern")]) + "\n")
+                offset += len(line)
+            with profiling.span("append_history", rows=len(lines)) as info:
+                data = b"".join(lines)
+                info["bytes"] = len(data)
+                with open(active_file, 'ab') as f:
+                    f.write(data)
+                with open(active_file + ".idx", 'a', encoding="utf-8") as f:
+                    f.writelines(index_lines)
+            if offset >= HISTORY_SEGMENT_MAX_BYTES:
+                self._rotate_history(lead)
+
+    def has_history(self, lead):
+        active_file, legacy_file, sealed = self.history_paths(lead)
+        return bool(sealed) or os.path.exists(active_file) or os.path.exists(legacy_file)
+
+    def history_version(self, lead):
+        """Version token of the history log; appends, sealing and compaction all change it"""
+        active_file, legacy_file, sealed = self.history_paths(lead)
+        return "+".join(file_version(path) for path in [legacy_file, *sealed, active_file])
+
+    def rotate_history(self, lead):
+        """Seal the active history segment so new records start a fresh file"""
+        active_file, _, _ = self.history_paths(lead)
+        with file_lock(active_file):
+            return self._rotate_history(lead)
+
+    def _rotate_history(self, lead):
+        active_file, _, sealed = self.history_paths(lead)
+        if not os.path.exists(active_file) or os.path.getsize(active_file) == 0:
+            return None
+        next_seq = int(sealed[-1].rsplit('.', 2)[1]) + 1 if sealed else 1
+        sealed_file = active_file[:-len(".jsonl")] + f".{next_seq:06d}.jsonl"
+        # Index first: a segment without an index is rebuilt, a stale index is not
+        if os.path.exists(active_file + ".idx"):
+            os.replace(active_file + ".idx", sealed_file + ".idx")
+        os.replace(active_file, sealed_file)
+        return sealed_file
+
+    def load_history(self, lead):
+        """Load the full history of a tech lead, oldest first"""
+        active_file, legacy_file, sealed = self.history_paths(lead)
+        frames = []
+        if os.path.exists(legacy_file):
+            frames.append(pd.read_csv(legacy_file))
+        records = []
+        for path in sealed + ([active_file] if os.path.exists(active_file) else []):
+            records.extend(self.read_history_segment(path))
+        if records:
+            frames.append(pd.DataFrame(records, columns=HISTORY_COLUMNS))
+        if not frames:
+            return pd.DataFrame(columns=HISTORY_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+    def history_interns(self, lead):
+        """Interns with at least one history record, in order of their first record"""
+        if not self.has_history(lead):
+            return []
+        return list(self._history_index(lead).by_intern)
+
+    def history_page(self, lead, interns=None, start=None, end=None, offset=0, limit=20):
+        """One page of history records, newest first, and the number of matching records
+
+        ``interns`` restricts the records to those names and ``start``/``end``
+        to ISO timestamps in [start, end). Only the page's records are read.
+        """
+        if not self.has_history(lead):
+            return pd.DataFrame(columns=HISTORY_COLUMNS), 0
+        try:
+            return self._history_page(lead, interns, start, end, offset, limit)
+        except FileNotFoundError:
+            # A segment was sealed or compacted under us; the next index sees it
+            return self._history_page(lead, interns, start, end, offset, limit)
+
+    def _history_page(self, lead, interns, start, end, offset, limit):
+        with profiling.span("history_index"):
+            index = self._history_index(lead)
+        positions = index.select(interns, start, end)
+        with profiling.span("read_history_records", rows=len(positions[offset:offset + limit])):
+            records = self._read_history_records(index, positions[offset:offset + limit])
+        return pd.DataFrame(records, columns=HISTORY_COLUMNS), len(positions)
+
+    def intern_history(self, lead, intern, until=None):
+        """History records of one intern up to and including ``until``, oldest first"""
+        if not self.has_history(lead):
+            return []
+        try:
+            return self._intern_history(lead, intern, until)
+        except FileNotFoundError:
+            return self._intern_history(lead, intern, until)
+
+    def _intern_history(self, lead, intern, until):
+        index = self._history_index(lead)
+        positions = [
+            position for position in reversed(index.select([intern]))
+            if until is None or (index.entries[position][3] or "") <= until
+        ]
+        return self._read_history_records(index, positions)
+
+    def _read_history_records(self, index, positions):
+        records, handles = [], {}
+        try:
+            for position in positions:
+                segment, record_offset, length, _, _ = index.entries[position]
+                if segment.endswith(".csv"):
+                    legacy = self.history_frames.read_csv(segment, copy=False)
+                    records.append(legacy.iloc[record_offset].to_dict())
+                    continue
+                if segment not in handles:
+                    handles[segment] = open(segment, 'rb')
+                handles[segment].seek(record_offset)
+                records.append(json.loads(handles[segment].read(length)))
+        finally:
+            for f in handles.values():
+                f.close()
+        return records
+
+    def compact_history(self, lead):
+        """Seal the active segment, fold the legacy CSV into the log and merge undersized segments"""
+        active_file, legacy_file, _ = self.history_paths(lead)
+        with file_lock(active_file):
+            self._rotate_history(lead)
+            if os.path.exists(legacy_file):
+                legacy_df = pd.read_csv(legacy_file, dtype=str, keep_default_na=False)
+                records = legacy_df.reindex(columns=HISTORY_COLUMNS, fill_value="").to_dict("records")
+                legacy_segment = legacy_file[:-len(".csv")] + f".{0:06d}.jsonl"
+                atomic_write(legacy_segment, lambda f: f.writelines(json.dumps(r) + "\n" for r in records))
+                os.remove(legacy_file)
+            _, _, sealed = self.history_paths(lead)
+            # Merge runs of consecutive small segments into the first segment of each run
+            runs, run, run_size = [], [], 0
+            for path in sealed:
+                size = os.path.getsize(path)
+                if run and run_size + size > HISTORY_SEGMENT_MAX_BYTES:
+                    runs.append(run)
+                    run, run_size = [], 0
+                run.append(path)
+                run_size += size
+            if run:
+                runs.append(run)
+            for run in runs:
+                if len(run) < 2:
+                    continue
+                atomic_write(run[0], lambda out: self._concat_segments(run, out))
+                for path in run:
+                    if os.path.exists(path + ".idx"):
+                        os.remove(path + ".idx")
+                for path in run[1:]:
+                    os.remove(path)
+            _, _, sealed = self.history_paths(lead)
+            for path in sealed:
+                self._segment_index(path, persist=True)
+
+    @staticmethod
+    def _concat_segments(paths, out):
+        for path in paths:
+            with open(path, 'r', encoding="utf-8") as f:
+                shutil.copyfileobj(f, out)
+
+    # Teams
+    # <lead>_teams.json holds the teams as of the last full save. Progress edits
+    # are appended to <lead>_teams.progress.jsonl as [team, member, phase, text]
+    # rows (member null for the whole team) and replayed over it on load; the
+    # journal is folded into the JSON once it grows past TEAM_PROGRESS_MAX_BYTES.
+    def team_path(self, lead):
+        return os.path.join(self.team_folder, f"{lead_slug(lead)}_teams.json")
+
+    def progress_path(self, lead):
+        return os.path.join(self.team_folder, f"{lead_slug(lead)}_teams.progress.jsonl")
+
+    def load_teams(self, lead):
+        team_file = self.team_path(lead)
+        if not os.path.exists(team_file):
+            return {}
+        with open(team_file, 'r') as f:
+            teams = json.load(f)
+        progress_file = self.progress_path(lead)
+        if os.path.exists(progress_file):
+            with open(progress_file, 'r', encoding="utf-8") as f:
+                apply_progress(teams, (json.loads(line) for line in f if line.strip()))
+        return teams
+
+    def teams_version(self, lead):
+        return f"{file_version(self.team_path(lead))}+{file_version(self.progress_path(lead))}"
+
+    def _write_teams(self, lead, teams):
+        version = atomic_write(self.team_path(lead), lambda f: json.dump(teams, f, indent=2))
+        if os.path.exists(self.progress_path(lead)):
+            os.remove(self.progress_path(lead))
+        return f"{version}+0"
+
+    def save_teams(self, lead, teams, expected_version=None):
+        team_file = self.team_path(lead)
+        with file_lock(team_file):
+            check_version(team_file, expected_version, self.teams_version(lead))
+            return self._write_teams(lead, teams)
+
+    def update_team_progress(self, lead, team, member, progress, expected_version=None):
+        """Set some phases of one member's progress, or the team's if ``member`` is None
+
+        Only the given phases are appended to the journal; the teams JSON is
+        left alone until the journal is folded into it.
+        """
+        team_file = self.team_path(lead)
+        with file_lock(team_file):
+            check_version(team_file, expected_version, self.teams_version(lead))
+            teams = self.load_teams(lead)
+            check_progress_target(teams, team, member)
+            progress_file = self.progress_path(lead)
+            lines = "".join(json.dumps([team, member, phase, text]) + "\n" for phase, text in progress.items())
+            with profiling.span("append_team_progress", rows=len(progress), bytes=len(lines)):
+                with open(progress_file, 'a', encoding="utf-8") as f:
+                    f.write(lines)
+            if os.path.getsize(progress_file) >= TEAM_PROGRESS_MAX_BYTES:
+                return self._write_teams(lead, apply_progress(teams, (json.loads(line) for line in lines.splitlines())))
+            return self.teams_version(lead)
+
+    def discover_leads(self):
+        """Tech lead names recovered from the file names on disk"""
+        slugs = set()
+        for path in glob.glob(os.path.join(self.data_folder, "*.csv")):
+            slugs.add(os.path.basename(path)[:-len(".csv")])
+        for path in glob.glob(os.path.join(self.history_folder, "*_history*")):
+            slugs.add(os.path.basename(path).split("_history", 1)[0])
+        for path in glob.glob(os.path.join(self.team_folder, "*_teams.json")):
+            slugs.add(os.path.basename(path)[:-len("_teams.json")])
+        return sorted(slug.replace('_', ' ') for slug in slugs)
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interns (
+    tech_lead TEXT NOT NULL,
+    name TEXT NOT NULL,
+    cohort TEXT,
+    active TEXT,
+    record TEXT NOT NULL,
+    PRIMARY KEY (tech_lead, name)
+);
+CREATE INDEX IF NOT EXISTS interns_cohort ON interns (tech_lead, cohort);
+CREATE INDEX IF NOT EXISTS interns_active ON interns (tech_lead, active);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    tech_lead TEXT NOT NULL,
+    time TEXT,
+    intern TEXT,
+    action TEXT,
+    old TEXT,
+    new TEXT,
+    changed_fields TEXT
+);
+CREATE INDEX IF NOT EXISTS history_intern ON history (tech_lead, intern, id);
+CREATE INDEX IF NOT EXISTS history_lead ON history (tech_lead, id);
+CREATE TABLE IF NOT EXISTS teams (
+    tech_lead TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS team_progress (
+    tech_lead TEXT NOT NULL,
+    team TEXT NOT NULL,
+    member TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (tech_lead, team, member, phase)
+);
+CREATE TABLE IF NOT EXISTS lead_summary (
+    tech_lead TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    counts TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS versions (
+    tech_lead TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    PRIMARY KEY (tech_lead, kind)
+);
+"""
+
+
+class SqliteBackend:
+    """All tech leads in one SQLite database; intern writes touch a single row"""
+
+    def __init__(self, path="tracker.db"):
+        self.path = path
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SQLITE_SCHEMA)
+
+    def _connect(self):
+        # Short-lived connections keep Streamlit's per-run threads independent
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # Versions
+    # Each tech lead's interns and teams carry a counter bumped by every write,
+    # giving the same expected_version / StaleDataError contract as CsvBackend.
+    @staticmethod
+    def _version(conn, lead, kind):
+        row = conn.execute(
+            "SELECT version FROM versions WHERE tech_lead = ? AND kind = ?", (lead, kind)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _bump_version(self, conn, lead, kind, expected_version):
+        version = self._version(conn, lead, kind)
+        if expected_version is not None and version != expected_version:
+            raise StaleDataError(
+                f"{kind.capitalize()} of {lead} were changed by another session since you loaded them. "
+                "Reload the page and try again."
+            )
+        conn.execute(
+            "INSERT INTO versions (tech_lead, kind, version) VALUES (?, ?, ?) "
+            "ON CONFLICT (tech_lead, kind) DO UPDATE SET version = excluded.version",
+            (lead, kind, version + 1)
+        )
+        return version + 1
+
+    def interns_version(self, lead):
+        with self._connection() as conn:
+            return self._version(conn, lead, "interns")
+
+    def teams_version(self, lead):
+        with self._connection() as conn:
+            return self._version(conn, lead, "teams")
+
+    def history_version(self, lead):
+        # History rows are only ever appended, so the newest id identifies the log
+        with self._connection() as conn:
+            row = conn.execute("SELECT MAX(id) FROM history WHERE tech_lead = ?", (lead,)).fetchone()
+        return row[0] or 0
+
+    # Interns
+    def load_interns(self, lead):
+        with profiling.span("load_interns_sqlite") as info, self._connection() as conn:
+            rows = conn.execute(
+                "SELECT record FROM interns WHERE tech_lead = ? ORDER BY rowid", (lead,)
+            ).fetchall()
+            info["rows"] = len(rows)
+        if not rows:
+            return empty_interns()
+        return self._interns_frame(rows)
+
+    def iter_interns(self, lead, chunksize=5000):
+        """Yield a tech lead's interns in frames of at most ``chunksize`` rows"""
+        with self._connection() as conn:
+            cursor = conn.execute("SELECT record FROM interns WHERE tech_lead = ? ORDER BY rowid", (lead,))
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield self._interns_frame(rows)
+
+    @staticmethod
+    def _interns_frame(rows):
+        frame = pd.DataFrame([json.loads(row[0]) for row in rows])
+        frame = frame.reindex(columns=INTERN_COLUMNS + [c for c in frame.columns if c not in INTERN_COLUMNS])
+        return apply_schema(frame)
+
+    @staticmethod
+    def _write_intern(conn, lead, record):
+        conn.execute(
+            "INSERT INTO interns (tech_lead, name, cohort, active, record) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (tech_lead, name) DO UPDATE SET "
+            "cohort = excluded.cohort, active = excluded.active, record = excluded.record",
+            (lead, record["Name"], record.get("Cohort"), record.get("Active"), json.dumps(record))
+        )
+
+    @staticmethod
+    def _read_intern(conn, lead, name):
+        row = conn.execute(
+            "SELECT record FROM interns WHERE tech_lead = ? AND name = ?", (lead, name)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_interns(self, lead, frame, expected_version=None):
+        """Replace all of a tech lead's interns in one transaction"""
+        records = [clean_record(r) for r in frame.to_dict("records")]
+        records = [r for r in records if r.get("Name") is not None]
+        with profiling.span("save_interns_sqlite", rows=len(records)), self._transaction() as conn:
+            version = self._bump_version(conn, lead, "interns", expected_version)
+            conn.execute("DELETE FROM interns WHERE tech_lead = ?", (lead,))
+            for record in records:
+                self._write_intern(conn, lead, record)
+            self._store_summary(conn, lead, version, summarize_interns(frame[frame["Name"].notna()]))
+        return version
+
+    def upsert_intern(self, lead, record, expected_version=None):
+        record = clean_record(record)
+        with self._transaction() as conn:
+            version = self._bump_version(conn, lead, "interns", expected_version)
+            old = self._read_intern(conn, lead, record["Name"])
+            current = dict(old or {}, **record)
+            self._write_intern(conn, lead, current)
+            self._update_summary(conn, lead, version, added=current, removed=old)
+        return version
+
+    def upsert_interns(self, lead, records, expected_version=None):
+        """Insert or update many interns in one transaction"""
+        records = [clean_record(record) for record in records]
+        with self._transaction() as conn:
+            version = self._bump_version(conn, lead, "interns", expected_version)
+            self._merge_interns(conn, lead, version, records, insert=True)
+        return version
+
+    def update_interns(self, lead, names, fields, expected_version=None):
+        """Assign the same ``fields`` to every intern in ``names`` in one transaction"""
+        fields = clean_record(fields)
+        with self._transaction() as conn:
+            version = self._bump_version(conn, lead, "interns", expected_version)
+            self._merge_interns(conn, lead, version, [dict(fields, Name=name) for name in names], insert=False)
+        return version
+
+    def _merge_interns(self, conn, lead, version, records, insert):
+        # Merge each record into the stored one, applying the summary deltas in one go
+        row = conn.execute(
+            "SELECT version, counts FROM lead_summary WHERE tech_lead = ?", (lead,)
+        ).fetchone()
+        counts = json.loads(row[1]) if row is not None and row[0] == version - 1 else None
+        for record in records:
+            old = self._read_intern(conn, lead, record["Name"])
+            if old is None and not insert:
+                continue
+            current = dict(old or {}, **record)
+            self._write_intern(conn, lead, current)
+            if counts is not None:
+                counts = apply_delta(counts, added=current, removed=old)
+        if counts is None:
+            conn.execute("DELETE FROM lead_summary WHERE tech_lead = ?", (lead,))
+        else:
+            self._store_summary(conn, lead, version, counts)
+
+    def update_intern(self, lead, name, fields, expected_version=None):
+        fields = clean_record(fields)
+        with self._transaction() as conn:
+            version = self._bump_version(conn, lead, "interns", expected_version)
+            old = self._read_intern(conn, lead, name)
+            if old is None:
+                raise KeyError(name)
+            current = dict(old, **fields)
+            if current["Name"] != name:
+                conn.execute("DELETE FROM interns WHERE tech_lead = ? AND name = ?", (lead, name))
+            self._write_intern(conn, lead, current)
+            self._update_summary(conn, lead, version, added=current, removed=old)
+        return version
+
+    def delete_intern(self, lead, name, expected_version=None):
+        with self._transaction() as conn:
+            version = self._bump_version(conn, lead, "interns", expected_version)
+            old = self._read_intern(conn, lead, name)
+            conn.execute("DELETE FROM interns WHERE tech_lead = ? AND name = ?", (lead, name))
+            if old is not None:
+                self._update_summary(conn, lead, version, removed=old)
+        return version
+
+    # Summary index
+    # lead_summary keeps each tech lead's summary counters and the interns version
+    # they describe. Single-row writes apply the record's delta in the same
+    # transaction; a row that fell behind is rebuilt by load_summary().
+    @staticmethod
+    def _store_summary(conn, lead, version, counts):
+        conn.execute(
+            "INSERT INTO lead_summary (tech_lead, version, counts) VALUES (?, ?, ?) "
+            "ON CONFLICT (tech_lead) DO UPDATE SET version = excluded.version, counts = excluded.counts",
+            (lead, version, json.dumps(dict(counts)))
+        )
+
+    def _update_summary(self, conn, lead, version, added=None, removed=None):
+        row = conn.execute(
+            "SELECT version, counts FROM lead_summary WHERE tech_lead = ?", (lead,)
+        ).fetchone()
+        if row is None or row[0] != version - 1:
+            conn.execute("DELETE FROM lead_summary WHERE tech_lead = ?", (lead,))
+            return
+        self._store_summary(conn, lead, version, apply_delta(json.loads(row[1]), added, removed))
+
+    def _rebuild_summary(self, lead):
+        with self._transaction() as conn:
+            version = self._version(conn, lead, "interns")
+            if version == 0:
+                # Never written, so there is nothing to count
+                return {}
+            counts = dict(summarize_interns(self.load_interns(lead)))
+            self._store_summary(conn, lead, version, counts)
+        return counts
+
+    @profiling.timed("load_summary")
+    def load_summary(self, leads):
+        """Summary counters of every lead in ``leads`` that has interns"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT s.tech_lead, s.counts FROM lead_summary s JOIN versions v "
+                "ON v.tech_lead = s.tech_lead AND v.kind = 'interns' AND v.version = s.version"
+            ).fetchall()
+        summary = {lead: json.loads(counts) for lead, counts in rows}
+        result = {}
+        for lead in leads:
+            if lead not in summary:
+                summary[lead] = self._rebuild_summary(lead)
+            if summary[lead].get("total_interns"):
+                result[lead] = summary[lead]
+        return result
+
+    # History
+    def append_history(self, lead, history_entry):
+        self.append_history_many(lead, [history_entry])
+
+    def append_history_many(self, lead, history_entries):
+        with profiling.span("append_history", rows=len(history_entries)), self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO history (tech_lead, time, intern, action, old, new, changed_fields) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(lead, *(entry.get(c, "") for c in HISTORY_COLUMNS)) for entry in history_entries]
+            )
+
+    def load_history(self, lead):
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT time, intern, action, old, new, changed_fields FROM history "
+                "WHERE tech_lead = ? ORDER BY id", (lead,)
+            ).fetchall()
+        return pd.DataFrame(rows, columns=HISTORY_COLUMNS)
+
+    def history_interns(self, lead):
+        """Interns with at least one history record, in order of their first record"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT intern FROM history WHERE tech_lead = ? GROUP BY intern ORDER BY MIN(id)", (lead,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def history_page(self, lead, interns=None, start=None, end=None, offset=0, limit=20):
+        """One page of history records, newest first, and the number of matching records"""
+        where, params = ["tech_lead = ?"], [lead]
+        if interns is not None:
+            interns = list(interns)
+            if not interns:
+                return pd.DataFrame(columns=HISTORY_COLUMNS), 0
+            where.append(f"intern IN ({', '.join('?' * len(interns))})")
+            params.extend(interns)
+        if start is not None:
+            where.append("time >= ?")
+            params.append(start)
+        if end is not None:
+            where.append("time < ?")
+            params.append(end)
+        clause = " AND ".join(where)
+        with self._connection() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM history WHERE {clause}", params).fetchone()[0]
+            rows = conn.execute(
+                "SELECT time, intern, action, old, new, changed_fields FROM history "
+                f"WHERE {clause} ORDER BY id DESC LIMIT ? OFFSET ?", params + [limit, offset]
+            ).fetchall()
+        return pd.DataFrame(rows, columns=HISTORY_COLUMNS), total
+
+    def intern_history(self, lead, intern, until=None):
+        """History records of one intern up to and including ``until``, oldest first"""
+        query = (
+            "SELECT time, intern, action, old, new, changed_fields FROM history "
+            "WHERE tech_lead = ? AND intern = ?"
+        )
+        params = [lead, intern]
+        if until is not None:
+            query += " AND time <= ?"
+            params.append(until)
+        with self._connection() as conn:
+            rows = conn.execute(query + " ORDER BY id", params).fetchall()
+        return [dict(zip(HISTORY_COLUMNS, row)) for row in rows]
+
+    def has_history(self, lead):
+        with self._connection() as conn:
+            return conn.execute("SELECT 1 FROM history WHERE tech_lead = ? LIMIT 1", (lead,)).fetchone() is not None
+
+    def compact_history(self, lead):
+        """History rows need no compaction; fold the WAL back into the database file"""
+        with self._connection() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    # Teams
+    # teams.data holds a lead's teams as of the last full save; team_progress
+    # has one row per team x member x phase edited since (member '' for the
+    # whole team) and is laid over it on load.
+    @staticmethod
+    def _read_teams(conn, lead):
+        row = conn.execute("SELECT data FROM teams WHERE tech_lead = ?", (lead,)).fetchone()
+        if row is None:
+            return {}
+        rows = conn.execute(
+            "SELECT team, member, phase, text FROM team_progress WHERE tech_lead = ?", (lead,)
+        ).fetchall()
+        return apply_progress(json.loads(row[0]), rows)
+
+    def load_teams(self, lead):
+        with self._connection() as conn:
+            return self._read_teams(conn, lead)
+
+    def save_teams(self, lead, teams, expected_version=None):
+        with self._transaction() as conn:
+            version = self._bump_version(conn, lead, "teams", expected_version)
+            conn.execute(
+                "INSERT INTO teams (tech_lead, data) VALUES (?, ?) "
+                "ON CONFLICT (tech_lead) DO UPDATE SET data = excluded.data",
+                (lead, json.dumps(teams))
+            )
+            conn.execute("DELETE FROM team_progress WHERE tech_lead = ?", (lead,))
+        return version
+
+    def update_team_progress(self, lead, team, member, progress, expected_version=None):
+        """Set some phases of one member's progress, or the team's if ``member`` is None"""
+        with self._transaction() as conn:
+            version = self._bump_version(conn, lead, "teams", expected_version)
+            check_progress_target(self._read_teams(conn, lead), team, member)
+            conn.executemany(
+                "INSERT INTO team_progress (tech_lead, team, member, phase, text) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (tech_lead, team, member, phase) DO UPDATE SET text = excluded.text",
+                [(lead, team, member or "", phase, text) for phase, text in progress.items()]
+            )
+        return version
+
+
+def open_backend(kind="csv", sqlite_path="tracker.db", **options):
+    """Create the storage backend selected by ``kind`` ("csv" or "sqlite")
+
+    ``options`` are CsvBackend's folders and csv_engine; SQLite ignores them.
+    """
+    if kind == "sqlite":
+        return SqliteBackend(sqlite_path)
+    if kind == "csv":
+        return CsvBackend(**options)
+    raise ValueError(f"Unknown storage backend: {kind}")
+
+
+def load_leads(backend, leads, max_workers=4):
+    """Every lead's interns in one frame tagged with LEAD_COLUMN, read by a bounded thread pool"""
+    def load(lead):
+        return backend.load_interns(lead).assign(**{LEAD_COLUMN: lead})
+
+    if max_workers <= 1 or len(leads) <= 1:
+        frames = [load(lead) for lead in leads]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(leads))) as pool:
+            frames = list(pool.map(load, leads))
+    if not frames:
+        return empty_interns().assign(**{LEAD_COLUMN: pd.Series(dtype=object)})
+    return pd.concat(frames, ignore_index=True)
+
+
+def import_csv_tree(source, target, leads=None):
+    """One-shot copy of interns, history and teams from a CsvBackend into another backend"""
+    imported = {}
+    for lead in leads or source.discover_leads():
+        interns = source.load_interns(lead)
+        if not interns.empty:
+            target.save_interns(lead, interns)
+        history = source.load_history(lead)
+        # History is append-only, so never import it twice
+        if not history.empty and not target.has_history(lead):
+            history = history.reindex(columns=HISTORY_COLUMNS).fillna("")
+            target.append_history_many(lead, history.to_dict("records"))
+        teams = source.load_teams(lead)
+        if teams:
+            target.save_teams(lead, teams)
+        imported[lead] = (len(interns), len(history), len(teams))
+    return imported
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Import the data/, history/ and teams/ folders into SQLite")
+    parser.add_argument("--db", default=os.environ.get("TRACKER_DB", "tracker.db"), help="SQLite database to fill")
+    parser.add_argument("--data", default="data", help="Folder of <lead>.csv intern files")
+    parser.add_argument("--history", default="history", help="Folder of <lead>_history files")
+    parser.add_argument("--teams", default="teams", help="Folder of <lead>_teams.json files")
+    args = parser.parse_args()
+
+    csv_backend = CsvBackend(args.data, args.history, args.teams)
+    for lead, (n_interns, n_history, n_teams) in import_csv_tree(csv_backend, SqliteBackend(args.db)).items():
+        print(f"{lead}: {n_interns} interns, {n_history} history entries, {n_teams} teams")
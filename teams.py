@@ -0,0 +1,188 @@
+"""Project team records: progress phases, migration of old layouts, export rows
+and the cross-lead progress table of the Super Admin dashboard.
+
+A tech lead's teams are a mapping of team name to
+``{"team_progress": {phase: text}, "members": {intern: {phase: text}}}``.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from aggregation import LEAD_COLUMN
+
+PHASES = [
+    "Phase 0: Ideation & Mission",
+    "Week 1: MVP Build",
+    "Week 2: Testing & Iteration",
+    "Weeks 3-4: User Acquisition",
+    "Post-Internship Vision",
+]
+# Column prefix of each phase in the progress export
+PHASE_SHORT_NAMES = {
+    "Phase 0: Ideation & Mission": "Phase 0",
+    "Week 1: MVP Build": "Week 1",
+    "Week 2: Testing & Iteration": "Week 2",
+    "Weeks 3-4: User Acquisition": "Weeks 3-4",
+    "Post-Internship Vision": "Vision",
+}
+# Member choice on the Project Teams page for the team's overall progress
+OVERALL_TEAM = "Overall Team"
+
+
+def changed_phases(current, updated):
+    """The phases of ``updated`` whose text differs from ``current``"""
+    return {phase: text for phase, text in updated.items() if text != current.get(phase, "")}
+
+
+def empty_progress():
+    return {phase: "" for phase in PHASES}
+
+
+def new_team(members, team_progress=None):
+    return {
+        "team_progress": dict(team_progress or empty_progress()),
+        "members": {member: empty_progress() for member in members},
+    }
+
+
+def migrate_teams(teams):
+    """Upgrade teams saved by older versions in place; True if anything changed
+
+    Older teams stored ``members`` as a list of names and had no team_progress,
+    and updating the overall progress also stored it as a member named
+    OVERALL_TEAM.
+    """
+    changed = False
+    for team in teams.values():
+        if isinstance(team.get('members'), list):
+            team['members'] = {member: empty_progress() for member in team['members']}
+            changed = True
+        if 'team_progress' not in team:
+            team['team_progress'] = empty_progress()
+            changed = True
+        if team['members'].pop(OVERALL_TEAM, None) is not None:
+            changed = True
+    return changed
+
+
+def team_membership(teams):
+    """Intern name -> the first team they belong to"""
+    membership = {}
+    for team_name, team in teams.items():
+        for member in team.get('members') or ():
+            membership.setdefault(member, team_name)
+    return membership
+
+
+def progress_rows(teams):
+    """One export row per team member with the team's and the member's progress"""
+    rows = []
+    for team_name, team_data in teams.items():
+        for member, progress in team_data['members'].items():
+            row = {"Team Name": team_name, "Member Name": member}
+            for phase in PHASES:
+                row[f"{PHASE_SHORT_NAMES[phase]} (Team)"] = team_data['team_progress'].get(phase, "")
+            for phase in PHASES:
+                row[f"{PHASE_SHORT_NAMES[phase]} (Member)"] = progress.get(phase, "")
+            rows.append(row)
+    return rows
+
+
+# Columns of the cross-lead progress table, one row per team x member x phase;
+# the team's overall progress is listed as member OVERALL_TEAM
+PROGRESS_COLUMNS = [LEAD_COLUMN, "Team", "Member", "Phase", "Progress"]
+
+
+def progress_frame(lead, teams):
+    """A tech lead's teams as rows of PROGRESS_COLUMNS plus a boolean Done"""
+    rows = []
+    for team_name, team_data in teams.items():
+        members = {OVERALL_TEAM: team_data.get('team_progress', {}), **team_data.get('members', {})}
+        for member, progress in members.items():
+            for phase in PHASES:
+                rows.append((lead, team_name, member, phase, progress.get(phase, "") or ""))
+    frame = pd.DataFrame(rows, columns=PROGRESS_COLUMNS)
+    frame["Done"] = frame["Progress"].str.strip() != ""
+    return frame
+
+
+def team_completion(table):
+    """Per team: member count and the share of phases filled in, overall and per phase"""
+    members = table[table["Member"] != OVERALL_TEAM]
+    overall = table[table["Member"] == OVERALL_TEAM]
+    keys = [LEAD_COLUMN, "Team"]
+    summary = pd.DataFrame({
+        "Members": members.groupby(keys, sort=False)["Member"].nunique(),
+        "Member Completion %": members.groupby(keys, sort=False)["Done"].mean() * 100,
+        "Team Completion %": overall.groupby(keys, sort=False)["Done"].mean() * 100,
+    })
+    per_phase = members.pivot_table(index=keys, columns="Phase", values="Done", aggfunc="mean", sort=False) * 100
+    per_phase = per_phase.reindex(columns=[phase for phase in PHASES if phase in per_phase.columns])
+    per_phase.columns = [f"{PHASE_SHORT_NAMES[phase]} %" for phase in per_phase.columns]
+    return summary.join(per_phase).fillna(0).round(1).reset_index()
+
+
+class TeamProgressCache:
+    """Every tech lead's progress_frame, rebuilt only for leads whose teams version changed
+
+    The CSV backend's teams version is made of the files' inode, mtime and
+    size, so an unchanged lead costs two os.stat calls. Leads are loaded in a
+    thread pool so that waits on slow storage (a network share, a busy
+    database) overlap; parsing itself holds the GIL and gains little.
+    """
+
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+        self._frames = {}
+        self._lock = threading.Lock()
+
+    def _lead_frame(self, backend, lead):
+        version = backend.teams_version(lead)
+        with self._lock:
+            cached = self._frames.get(lead)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        frame = progress_frame(lead, backend.load_teams(lead))
+        with self._lock:
+            self._frames[lead] = (version, frame)
+        return frame
+
+    def load(self, backend, leads):
+        """The progress table of ``leads``, concatenated in their order"""
+        if not leads:
+            return pd.DataFrame(columns=PROGRESS_COLUMNS + ["Done"])
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(leads))) as pool:
+            frames = list(pool.map(lambda lead: self._lead_frame(backend, lead), leads))
+        return pd.concat(frames, ignore_index=True)
+
+
+class TeamMembershipCache:
+    """Every tech lead's team_membership, rebuilt only when their teams version changed
+
+    save_teams() gives the teams a new version, so a lead's mapping is rebuilt
+    on its next use after any session or process changed their teams.
+    """
+
+    def __init__(self):
+        self._membership = {}
+        self._lock = threading.Lock()
+
+    def get(self, backend, lead):
+        """Intern name -> team of ``lead``'s teams; callers must not modify it"""
+        version = backend.teams_version(lead)
+        with self._lock:
+            cached = self._membership.get(lead)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        membership = team_membership(backend.load_teams(lead))
+        with self._lock:
+            self._membership[lead] = (version, membership)
+        return membership
+
+    def carry(self, lead, before, after):
+        """Keep ``lead``'s mapping for version ``after`` of a write that left the members alone"""
+        with self._lock:
+            cached = self._membership.get(lead)
+            if cached is not None and cached[0] == before:
+                self._membership[lead] = (after, cached[1])
@@ -0,0 +1,8 @@
+"""Streamlit pages of the tracker.
+
+Each page module exposes ``render(ctx)``, drawing the page for the
+``views.context.Context`` of the current run. app.py only logs the user in,
+builds the context and dispatches to the page picked in the sidebar; keeping
+the pages in modules means Python compiles them once per process instead of
+on every rerun.
+"""
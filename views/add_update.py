@@ -0,0 +1,71 @@
+"""Add/Update Intern page: create an intern or overwrite all of an existing intern's fields, or import a roster"""
+import streamlit as st
+
+from config import TEAM_NUMBERS
+from search_index import intern_changes
+from storage import clean_record
+from views import bulk_import
+
+
+def render(ctx):
+    df, interns, tech_lead, is_super_admin = ctx.df, ctx.interns, ctx.tech_lead, ctx.is_super_admin
+    try:
+        st.title("Add or Update Intern")
+        mode = st.radio("Mode", ["Single Intern", "Bulk Import"], horizontal=True)
+        if mode == "Bulk Import":
+            bulk_import.render(ctx)
+            return
+        filtered_df = df # No need to filter by team here, as it's handled by the page selection
+        intern_names = ["New"] + filtered_df["Name"].dropna().astype(str).tolist()
+        selected_intern = st.selectbox("Select Intern to Update (or leave as 'New' to add):", intern_names)
+        if selected_intern != "New" and selected_intern in interns:
+            # Blank cells as "", not NaN, which the text inputs would turn into "nan"
+            intern_data = {key: "" if value is None else value for key, value in clean_record(interns.get(selected_intern)).items()}
+        else:
+            intern_data = {}
+        with st.form("intern_form"):
+            name = st.text_input("Name", value=intern_data.get("Name", ""))
+            cohort = st.selectbox("Cohort", ["Cohort 1", "Cohort 2"], index=["Cohort 1", "Cohort 2"].index(intern_data.get("Cohort", "Cohort 1")) if intern_data.get("Cohort") in ["Cohort 1", "Cohort 2"] else 0)
+            if is_super_admin:
+                team = st.text_input("Team(eg :2 or 3)", value=intern_data.get("Team(eg :2 or 3)", ""))
+            else:
+                team = st.text_input("Team(eg :2 or 3)", value=TEAM_NUMBERS.get(tech_lead, ""), disabled=True)
+            values = {
+                "GitLab User Name": st.text_input("GitLab User Name", value=intern_data.get("GitLab User Name", "")),
+                "Year": st.selectbox("Year", ["1", "2", "3", "4"], index=["1", "2", "3", "4"].index(str(intern_data.get("Year", "1"))) if str(intern_data.get("Year", "1")) in ["1", "2", "3", "4"] else 0),
+                "Received Offer letter": st.selectbox("Received Offer letter", ["Yes", "No"], index=["Yes", "No"].index(intern_data.get("Received Offer letter", "Yes")) if intern_data.get("Received Offer letter") in ["Yes", "No"] else 0),
+                "College": st.text_input("College", value=intern_data.get("College", "")),
+                "GitLab Acc (README.md)": st.text_input("GitLab Acc (README.md)", value=intern_data.get("GitLab Acc (README.md)", "")),
+                "GitLab Acc Link": st.text_input("GitLab Acc Link", value=intern_data.get("GitLab Acc Link", "")),
+                "Innings Courses (Python & AI)": st.text_input("Innings Courses (Python & AI)", value=intern_data.get("Innings Courses (Python & AI)", "")),
+                "Huggingchat/Dify": st.text_input("Huggingchat/Dify", value=intern_data.get("Huggingchat/Dify", "")),
+                "Huggingchat Link": st.text_input("Huggingchat Link", value=intern_data.get("Huggingchat Link", "")),
+                "Streamlit app and Deployment": st.text_input("Streamlit app and Deployment", value=intern_data.get("Streamlit app and Deployment", "")),
+                "Streamlit Link": st.text_input("Streamlit Link", value=intern_data.get("Streamlit Link", "")),
+                "Huggingface+streamlit integration": st.text_input("Huggingface+streamlit integration", value=intern_data.get("Huggingface+streamlit integration", "")),
+                "HF+Streamlit Link": st.text_input("HF+Streamlit Link", value=intern_data.get("HF+Streamlit Link", "")),
+                "Pushed Apps onto GitLab": st.selectbox("Pushed Apps onto GitLab", ["Yes", "No"], index=["Yes", "No"].index(intern_data.get("Pushed Apps onto GitLab", "Yes")) if intern_data.get("Pushed Apps onto GitLab") in ["Yes", "No"] else 0),
+                "Data Collection (started?)": st.selectbox("Data Collection (started?)", ["Yes", "No"], index=["Yes", "No"].index(intern_data.get("Data Collection (started?)", "Yes")) if intern_data.get("Data Collection (started?)") in ["Yes", "No"] else 0),
+                "Size of Data": st.text_input("Size of Data", value=intern_data.get("Size of Data", "")),
+                "Can go to any other places": st.text_input("Can go to any other places", value=intern_data.get("Can go to any other places", "")),
+                "Blockers?": st.text_area("Blockers?", value=intern_data.get("Blockers?", "")),
+                "Remarks": st.text_area("Remarks", value=intern_data.get("Remarks", ""))
+            }
+            submitted = st.form_submit_button("Save")
+            if submitted and name:
+                new_row = {"Name": name, "Cohort": cohort, "Team(eg :2 or 3)": team}
+                new_row.update(values)
+                if 'Team' in new_row:
+                    del new_row['Team']
+                old_row = interns.get(name)
+                ctx.guarded_write("interns", ctx.backend.upsert_intern, new_row, changes=intern_changes([new_row]))
+                if old_row is not None:
+                    ctx.save_history(name, "Updated", old_row, new_row)
+                    st.success("Intern data updated successfully.")
+                else:
+                    ctx.save_history(name, "Added", None, new_row)
+                    st.success("Intern added successfully.")
+                # The sidebar below shows the interns as saved
+                ctx.load_data()
+    except Exception as e:
+        st.error(f"[ERROR] {e}")
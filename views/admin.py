@@ -0,0 +1,156 @@
+"""Super Admin panel: statistics and reports across every tech lead"""
+from collections import Counter
+
+import pandas as pd
+import streamlit as st
+
+from aggregation import LEAD_COLUMN, in_teams, prefixed
+from config import TECH_LEADS
+from exports import chunks
+from jobs import combined_report, compact_histories
+import storage
+from views import job_status, search, team_dashboard, trends
+
+
+def render(ctx):
+    st.title("Super Admin Panel")
+    st.subheader("All Tech Lead Reports")
+    
+    # Team selection for super admin
+    st.subheader("👥 Team Selection")
+    team_filter_text = st.text_input(
+        "Enter team numbers to filter (comma-separated, e.g., '2, 3' or leave empty for all teams):"
+    )
+    
+    # Parse team filter
+    selected_teams = []
+    if team_filter_text:
+        selected_teams = [team.strip() for team in team_filter_text.split(",") if team.strip()]
+    else:
+        # If no filter specified, include all teams
+        selected_teams = None
+    
+    # Tech lead statistics
+    # Without a team filter the overview renders from the summary index that every
+    # intern write keeps up to date; filtering by team needs the interns themselves,
+    # so they are counted by a background job whose result is reused until the
+    # data changes. The job loads every lead into the process's shared frame, which
+    # the individual downloads below slice instead of reading the lead again.
+    if selected_teams:
+        job = ctx.team_statistics(selected_teams)
+        tech_lead_stats = job["result"] if job["status"] == "done" else {}
+        if job["status"] == "failed":
+            st.error(f"[ERROR] {job['error']}")
+        elif job["status"] != "done":
+            job_status.show_progress(job)
+            st.button("🔄 Refresh", key="team_statistics_refresh")
+    else:
+        tech_lead_stats = ctx.backend.load_summary(TECH_LEADS)
+
+    # Progress Overview
+    st.subheader("📊 Progress Overview")
+    if tech_lead_stats:
+        col1, col2, col3 = st.columns(3)
+        
+        total_interns = sum(stats.get("total_interns", 0) for stats in tech_lead_stats.values())
+        total_offers = sum(stats.get("offers_received", 0) for stats in tech_lead_stats.values())
+        total_apps = sum(stats.get("apps_pushed", 0) for stats in tech_lead_stats.values())
+        
+        with col1:
+            st.metric("Total Interns", total_interns)
+        with col2:
+            st.metric("Offers Received", total_offers)
+        with col3:
+            st.metric("Apps Pushed to GitLab", total_apps)
+        
+        # Tech Lead Performance Table
+        st.subheader("👥 Tech Lead Performance")
+        performance_data = []
+        for tech_lead_name, stats in tech_lead_stats.items():
+            performance_data.append({
+                "Tech Lead": tech_lead_name,
+                "Total Interns": stats.get("total_interns", 0),
+                "Cohort 1": stats.get("cohort:Cohort 1", 0),
+                "Cohort 2": stats.get("cohort:Cohort 2", 0),
+                "Offers Received": stats.get("offers_received", 0),
+                "Apps Pushed": stats.get("apps_pushed", 0),
+                "Data Collection Started": stats.get("data_collection_started", 0),
+                "Inactive": stats.get("inactive", 0),
+                "Academic Break": stats.get("academic_break", 0)
+            })
+        
+        performance_df = pd.DataFrame(performance_data)
+        st.dataframe(performance_df, use_container_width=True)
+        
+        # Download reports, built and streamed lead by lead only when requested
+        if any(stats.get("total_interns") for stats in tech_lead_stats.values()):
+            st.subheader("📥 Download Reports")
+            
+            col1, col2 = st.columns(2)
+
+            def team_filtered(frame):
+                return frame[in_teams(frame, selected_teams)] if selected_teams else frame
+
+            with col1:
+                # Every lead's file is read and exported by a background job; the
+                # file is offered under Background Jobs once it is ready
+                if st.button("📊 Prepare Combined Report", key="export_combined"):
+                    ctx.run_job(
+                        "combined_report", f"Combined report ({ctx.export_format})",
+                        combined_report, TECH_LEADS, selected_teams, ctx.export_format,
+                        storage.INTERN_COLUMNS + [LEAD_COLUMN], versioned=True
+                    )
+                    st.info("The report is listed under Background Jobs below.")
+            
+            with col2:
+                # Download individual tech lead reports
+                selected_tech_lead = st.selectbox("Download Individual Report:", TECH_LEADS)
+                if selected_tech_lead in tech_lead_stats:
+                    ctx.export_button(
+                        f"📄 Download {selected_tech_lead} Report",
+                        lambda: chunks(team_filtered(ctx.lead_interns(selected_tech_lead))),
+                        f"{selected_tech_lead.replace(' ', '_')}_report",
+                        key="export_individual",
+                        columns=storage.INTERN_COLUMNS
+                    )
+    else:
+        st.info("No tech lead reports found.")
+    
+    # Cohort Analysis
+    st.subheader("📈 Cohort Analysis")
+    if tech_lead_stats:
+        overall_stats = sum((Counter(stats) for stats in tech_lead_stats.values()), Counter())
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            cohort_counts = Counter(prefixed(overall_stats, "cohort:")).most_common()
+            st.write("**Cohort Distribution:**")
+            for cohort, count in cohort_counts:
+                st.write(f"{cohort}: {count} interns")
+        
+        with col2:
+            offer_counts = Counter(prefixed(overall_stats, "offer:")).most_common()
+            st.write("**Offer Status:**")
+            for status, count in offer_counts:
+                st.write(f"{status}: {count} interns")
+
+    # Project teams of every tech lead
+    team_dashboard.render(ctx)
+
+    # Blockers, remarks and team progress of every tech lead
+    search.render(ctx)
+
+    # Week-over-week changes from the daily snapshots
+    trends.render(ctx)
+
+    # History Maintenance
+    st.subheader("🗜️ History Maintenance")
+    if st.button("Compact History Logs"):
+        job = ctx.run_job("compact_history", "Compact history logs", compact_histories, TECH_LEADS)
+        if job["status"] == "done":
+            st.success("History logs compacted for all tech leads.")
+        else:
+            st.info("Compacting in the background; see Background Jobs below.")
+
+    # Progress and results of the jobs above, from every admin session
+    job_status.render(ctx)
@@ -0,0 +1,77 @@
+"""Bulk edit mode of the Edit Intern page: set one field on many interns with a single write"""
+import streamlit as st
+
+from history import history_entry
+from search_index import intern_changes
+from storage import INTERN_SCHEMA
+
+# Fields that can be set on many interns at once; the Team field is for the Super Admin only
+TEXT_FIELDS = ["College", "Size of Data", "Can go to any other places", "Blockers?", "Remarks"]
+STATUS_LABELS = {"Active": "Yes", "Inactive": "No", "Academic Break": "Academic Break"}
+
+
+def render(ctx):
+    df, interns, is_super_admin = ctx.df, ctx.interns, ctx.is_super_admin
+    if "bulk_edit_message" in st.session_state:
+        st.success(st.session_state.pop("bulk_edit_message"))
+    if df.empty:
+        st.info("No interns to edit.")
+        return
+
+    fields = list(INTERN_SCHEMA) + (["Team(eg :2 or 3)"] if is_super_admin else []) + TEXT_FIELDS
+    col1, col2 = st.columns(2)
+    with col1:
+        field = st.selectbox("Field to change", fields, key="bulk_edit_field")
+    with col2:
+        if field in INTERN_SCHEMA:
+            value = st.selectbox("New value", INTERN_SCHEMA[field], key="bulk_edit_value")
+        else:
+            value = st.text_input("New value", key="bulk_edit_text")
+
+    # Narrow down the table, then tick the interns to change
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        cohort_filter = st.selectbox("Cohort", ["All", "Cohort 1", "Cohort 2"], key="bulk_edit_cohort")
+    with col2:
+        status_filter = st.selectbox("Status", ["All"] + list(STATUS_LABELS), key="bulk_edit_status")
+    with col3:
+        select_all = st.checkbox("Select all shown", key="bulk_edit_select_all")
+    filtered_df = df
+    if cohort_filter != "All":
+        filtered_df = filtered_df[filtered_df["Cohort"] == cohort_filter]
+    if status_filter != "All":
+        filtered_df = filtered_df[filtered_df["Active"] == STATUS_LABELS[status_filter]]
+    if filtered_df.empty:
+        st.info("No interns match these filters.")
+        return
+
+    columns = list(dict.fromkeys(["Name", "Cohort", "Active", field]))
+    table = filtered_df[columns].astype(object).where(filtered_df[columns].notna(), None)
+    table.insert(0, "Select", select_all)
+    # The filters are part of the key so ticks never carry over onto other rows
+    edited = st.data_editor(
+        table,
+        hide_index=True,
+        disabled=columns,
+        column_config={"Select": st.column_config.CheckboxColumn("Select")},
+        key=f"bulk_edit_table_{cohort_filter}_{status_filter}_{field}_{select_all}"
+    )
+    selected = edited.loc[edited["Select"], "Name"].tolist()
+
+    if st.button(f"Set {field} for {len(selected)} Intern(s)", disabled=not selected, key="bulk_edit_apply"):
+        fields_to_edit = {field: value}
+        # One history entry per intern whose value actually changes, appended in one batch
+        entries = [
+            history_entry(name, "Updated", {field: interns.value(name, field)}, fields_to_edit)
+            for name in selected
+        ]
+        entries = [entry for entry in entries if entry["Changed_Fields"]]
+        if entries:
+            names = [entry["Intern"] for entry in entries]
+            ctx.guarded_write(
+                "interns", ctx.backend.update_interns, names, fields_to_edit,
+                changes=intern_changes([{"Name": name, **fields_to_edit} for name in names])
+            )
+            ctx.save_history_many(entries)
+        st.session_state.bulk_edit_message = f"Updated {field} for {len(entries)} intern(s); {len(selected) - len(entries)} already had that value."
+        st.rerun()
@@ -0,0 +1,56 @@
+"""Bulk import mode of the Add/Update Intern page: validate a roster file, preview conflicts, apply in one write"""
+import streamlit as st
+
+from config import TEAM_NUMBERS
+from roster import conflict_preview, import_records, plan_import, read_roster, template_csv, upload_types, validate_roster
+from search_index import intern_changes
+
+
+def render(ctx):
+    interns, tech_lead, is_super_admin = ctx.interns, ctx.tech_lead, ctx.is_super_admin
+    st.write("Upload a roster with a **Name** column and any of the intern columns. "
+             "New names are added; for existing interns only the filled-in cells are updated.")
+    if "roster_import_message" in st.session_state:
+        st.success(st.session_state.pop("roster_import_message"))
+    st.download_button(
+        "📄 Download Empty Template",
+        template_csv(),
+        file_name="intern_roster_template.csv",
+        mime="text/csv"
+    )
+    upload = st.file_uploader("Roster file", type=upload_types(), key="roster_upload")
+    if upload is None:
+        return
+
+    rows, problems, ignored = validate_roster(read_roster(upload, upload.name))
+    if ignored:
+        st.warning(f"Ignoring unknown columns: {', '.join(ignored)}")
+    if not problems.empty:
+        st.error(f"Found {len(problems)} problem(s). Fix the file and upload it again; nothing was imported.")
+        st.dataframe(problems, hide_index=True)
+        return
+
+    # Tech leads file interns under their own team number, as on the form
+    defaults = None if is_super_admin else {"Team(eg :2 or 3)": TEAM_NUMBERS.get(tech_lead, "")}
+    inserts, updates, unchanged = plan_import(rows, interns, defaults)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("New Interns", len(inserts))
+    with col2:
+        st.metric("Existing, With Changes", len(updates))
+    with col3:
+        st.metric("Existing, Unchanged", unchanged)
+
+    update_existing = False
+    if updates:
+        st.markdown("**Conflicts with existing interns:**")
+        st.dataframe(conflict_preview(updates), hide_index=True)
+        update_existing = st.checkbox("Overwrite these fields of existing interns", key="roster_update_existing")
+
+    records, entries = import_records(inserts, updates if update_existing else [])
+    if st.button(f"Import {len(records)} Intern(s)", disabled=not records, key="roster_import"):
+        # One intern write and one history append for the whole roster
+        ctx.guarded_write("interns", ctx.backend.upsert_interns, records, changes=intern_changes(records))
+        ctx.save_history_many(entries)
+        st.session_state.roster_import_message = f"Imported {len(records)} intern(s): {len(inserts)} added, {len(records) - len(inserts)} updated."
+        st.rerun()
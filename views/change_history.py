@@ -0,0 +1,104 @@
+"""Change History page: paginated audit trail and point-in-time records"""
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from history import entry_changes, record_as_of
+
+
+def _cell(value):
+    # One line of a Markdown table cell
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+def changes_table(before, after):
+    """Before/after of the changed fields as a Markdown table
+
+    Cheaper than st.table, which converts a DataFrame to Arrow for every
+    entry on the page.
+    """
+    lines = ["| Field | Before | After |", "| --- | --- | --- |"]
+    lines += [f"| {_cell(field)} | {_cell(before.get(field))} | {_cell(value)} |" for field, value in after.items()]
+    return "\n".join(lines)
+
+
+def render(ctx):
+    interns, tech_lead, is_super_admin = ctx.interns, ctx.tech_lead, ctx.is_super_admin
+    try:
+        st.title("Change History")
+        if ctx.backend.has_history(tech_lead):
+            # Get intern names from the history index
+            intern_names = ctx.backend.history_interns(tech_lead)
+            if not is_super_admin:
+                intern_names = [name for name in intern_names if name in interns]
+            if intern_names:
+                selected_intern = st.selectbox("Select Intern to View History", ["All"] + intern_names)
+                col1, col2 = st.columns(2)
+                with col1:
+                    date_range = st.date_input("Date range", value=(), help="Leave empty to show all dates")
+                with col2:
+                    page_size = st.selectbox("Entries per page", [10, 20, 50, 100], index=1)
+
+                if selected_intern != "All":
+                    intern_filter = [selected_intern]
+                    st.subheader(f"History for: {selected_intern}")
+                else:
+                    intern_filter = None if is_super_admin else intern_names
+                    st.subheader("All Changes")
+                start = end = None
+                if len(date_range) == 2:
+                    start = date_range[0].isoformat()
+                    end = (date_range[1] + timedelta(days=1)).isoformat()
+
+                # Page number is kept per filter so changing a filter starts from page 1
+                page_key = f"history_page:{selected_intern}:{start}:{end}:{page_size}"
+                page_number = st.session_state.get(page_key, 1)
+                filtered_hist, total = ctx.backend.history_page(
+                    tech_lead, intern_filter, start, end, (page_number - 1) * page_size, page_size
+                )
+                page_count = max(1, -(-total // page_size))
+                if page_number > page_count:
+                    page_number = st.session_state[page_key] = page_count
+                    filtered_hist, total = ctx.backend.history_page(
+                        tech_lead, intern_filter, start, end, (page_number - 1) * page_size, page_size
+                    )
+                first = (page_number - 1) * page_size
+                if total:
+                    st.caption(f"Showing {first + 1}–{first + len(filtered_hist)} of {total} changes, newest first")
+                else:
+                    st.info("No changes in this date range.")
+
+                # Display history
+                for index, row in filtered_hist.iterrows():
+                    with st.expander(f"{row['Time']} - {row['Action']} - {row['Intern']}"):
+                        st.markdown(
+                            f"**Action:** {row['Action']}  \n**Time:** {row['Time']}  \n**Intern:** {row['Intern']}"
+                        )
+                        before, after = entry_changes(row)
+                        if row['Action'] == "Updated":
+                            st.markdown(f"**Changed Fields:** {', '.join(after)}\n\n{changes_table(before, after)}")
+                        elif row['Action'] == "Added":
+                            st.write("**Added Data:**")
+                            st.json(after)
+                        elif row['Action'] == "Deleted":
+                            st.write("**Deleted Data:**")
+                            st.json(before)
+                if page_count > 1:
+                    st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, key=page_key)
+
+                # Point-in-time view, rebuilt by replaying the intern's changes
+                if selected_intern != "All":
+                    with st.expander(f"🕰️ {selected_intern} as of a date"):
+                        as_of_date = st.date_input("As of end of", value=datetime.now().date())
+                        as_of = (as_of_date + timedelta(days=1)).isoformat()
+                        record = record_as_of(ctx.backend, tech_lead, selected_intern, as_of)
+                        if record is None:
+                            st.info(f"{selected_intern} did not exist on {as_of_date}.")
+                        else:
+                            st.json(record)
+            else:
+                st.info("No history available.")
+        else:
+            st.info("No history found.")
+    except Exception as e:
+        st.error(f"[ERROR] {e}")
@@ -0,0 +1,246 @@
+"""Per-run state the pages share: the storage backend, who is logged in and their interns"""
+from datetime import date, datetime
+from functools import partial
+
+import streamlit as st
+
+import profiling
+import storage
+from aggregation import LEAD_COLUMN
+from config import (
+    CSV_ENGINE, DATA_FOLDER, HISTORY_FOLDER, JOB_FOLDER, JOB_WORKERS, LOAD_WORKERS, SEARCH_INDEX_PATH,
+    SNAPSHOT_FOLDER, SQLITE_PATH, STORAGE_BACKEND, TEAM_FOLDER, TECH_LEADS
+)
+from exports import EXPORT_FORMATS, export_file
+from history import history_entry
+from jobs import JobRunner, data_version, job_key, team_statistics
+from search_index import SearchIndex, all_teams, progress_changes
+from snapshots import SnapshotStore, take_snapshot
+from teams import TeamMembershipCache, TeamProgressCache, migrate_teams
+
+
+# Storage backend, shared by every session in this process
+@st.cache_resource
+def get_backend():
+    backend = storage.open_backend(
+        STORAGE_BACKEND, sqlite_path=SQLITE_PATH,
+        data_folder=DATA_FOLDER, history_folder=HISTORY_FOLDER, team_folder=TEAM_FOLDER, csv_engine=CSV_ENGINE
+    )
+    # Upgrade teams saved by older versions once per process instead of on every page load
+    for lead in TECH_LEADS:
+        teams = backend.load_teams(lead)
+        if migrate_teams(teams):
+            backend.save_teams(lead, teams)
+    return backend
+
+
+# Every tech lead's team progress table, shared by every session in this process
+@st.cache_resource
+def get_team_progress_cache():
+    return TeamProgressCache()
+
+
+# Every tech lead's interns in one frame, shared by every session in this process
+@st.cache_resource
+def get_leads_frame_cache():
+    return storage.LeadsFrameCache()
+
+
+# Every tech lead's intern -> team mapping, shared by every session in this process
+@st.cache_resource
+def get_team_membership_cache():
+    return TeamMembershipCache()
+
+
+# Full-text index of the Search page, shared by every session in this process
+@st.cache_resource
+def get_search_index():
+    return SearchIndex(SEARCH_INDEX_PATH)
+
+
+# Daily snapshots of the trends view, shared by every session in this process
+@st.cache_resource
+def get_snapshot_store():
+    return SnapshotStore(SNAPSHOT_FOLDER)
+
+
+# Background jobs of the Super Admin panel, shared by every session in this process
+@st.cache_resource
+def get_job_runner():
+    return JobRunner(JOB_FOLDER, JOB_WORKERS)
+
+
+# How long a run waits for a job it started, so quick jobs show their result at once
+JOB_WAIT_SECONDS = 1.0
+
+
+class Context:
+    """What a page needs to render for the logged-in tech lead during one run"""
+
+    def __init__(self, backend, tech_lead, is_super_admin):
+        self.backend = backend
+        self.tech_lead = tech_lead
+        self.is_super_admin = is_super_admin
+        # Set once the sidebar and the intern frame are ready
+        self.export_format = "CSV"
+        self.df = None
+        self.interns = None
+
+        # Optimistic concurrency
+        # Writes are checked against the version of the data this session rendered on
+        # its previous run, so a save made from a stale page is rejected with
+        # StaleDataError instead of overwriting another session's changes.
+        self.session_versions = st.session_state.setdefault("versions", {})
+        self.expected_versions = dict(self.session_versions)
+        self.session_versions[("interns", tech_lead)] = backend.interns_version(tech_lead)
+        self.session_versions[("teams", tech_lead)] = backend.teams_version(tech_lead)
+
+    def guarded_write(self, kind, write, *args, changes=None):
+        """Run a backend write for the current tech lead against the version this session last saw
+
+        ``changes`` (see search_index.Changes) are the texts the write changed,
+        applied to the search index so it stays current without a rebuild.
+        """
+        key = (kind, self.tech_lead)
+        before = self.session_versions[key]
+        version = write(self.tech_lead, *args, expected_version=self.expected_versions.get(key))
+        self.expected_versions[key] = self.session_versions[key] = version
+        get_search_index().apply(self.tech_lead, kind, before, version, changes)
+
+    # Load data
+    @profiling.timed("load_data")
+    def load_data(self):
+        df = self.backend.load_interns(self.tech_lead)
+        # Ensure 'Active' column exists in df
+        if 'Active' not in df.columns:
+            df['Active'] = 'Yes'
+        self.df = df
+        # Name -> row index for single-intern reads and updates
+        self.interns = storage.InternIndex(df)
+        return df
+
+    # Save history function
+    def save_history(self, intern_name, action, old_data=None, new_data=None):
+        entry = history_entry(intern_name, action, old_data, new_data)
+        if action == "Updated" and not entry["Changed_Fields"]:
+            return  # Nothing actually changed
+        self.backend.append_history(self.tech_lead, entry)
+
+    def save_history_many(self, entries):
+        """Append prepared history entries in one write, skipping updates that changed nothing"""
+        entries = [entry for entry in entries if entry["Action"] != "Updated" or entry["Changed_Fields"]]
+        if entries:
+            self.backend.append_history_many(self.tech_lead, entries)
+
+    # Team management functions
+    @profiling.timed("load_teams")
+    def load_teams(self):
+        """Load teams for the current tech lead"""
+        return self.backend.load_teams(self.tech_lead)
+
+    @profiling.timed("save_teams")
+    def save_teams(self, teams):
+        """Save teams for the current tech lead"""
+        self.guarded_write("teams", self.backend.save_teams, teams, changes=all_teams(teams))
+
+    @profiling.timed("update_team_progress")
+    def update_team_progress(self, team, member, progress):
+        """Save some phases of one member's progress, or the team's if ``member`` is None"""
+        key = ("teams", self.tech_lead)
+        before, checked = self.session_versions[key], self.expected_versions.get(key) is not None
+        self.guarded_write(
+            "teams", self.backend.update_team_progress, team, member, progress,
+            changes=progress_changes(team, member, progress)
+        )
+        if checked:
+            # Written on top of the version this session saw, and progress doesn't move anyone
+            get_team_membership_cache().carry(self.tech_lead, before, self.session_versions[key])
+
+    def team_membership(self):
+        """Intern name -> team of the current tech lead, from the per-process cache"""
+        return get_team_membership_cache().get(self.backend, self.tech_lead)
+
+    def load_team_progress(self):
+        """Every tech lead's teams as one row per team, member and phase"""
+        with profiling.span("load_team_progress", leads=len(TECH_LEADS)) as info:
+            table = get_team_progress_cache().load(self.backend, TECH_LEADS)
+            info["rows"] = len(table)
+        return table
+
+    def team_statistics(self, teams):
+        """The background job counting every lead's interns in ``teams``, through the shared frame"""
+        return self.run_job(
+            "team_statistics", f"Statistics of teams {', '.join(teams)}",
+            partial(team_statistics, frames=get_leads_frame_cache()), TECH_LEADS, teams, LOAD_WORKERS, versioned=True
+        )
+
+    def lead_interns(self, lead):
+        """One lead's interns, sliced from the shared frame of every lead if it is current"""
+        frame = get_leads_frame_cache().get(self.backend, TECH_LEADS)
+        if frame is None:
+            return self.backend.load_interns(lead)
+        return frame[frame[LEAD_COLUMN] == lead]
+
+    def search(self, text, leads):
+        """Ranked search hits of ``leads``, first catching the index up on leads changed elsewhere"""
+        index = get_search_index()
+        with profiling.span("search", leads=len(leads)) as info:
+            info["rebuilt"] = index.refresh(self.backend, leads)
+            hits = index.search(text, leads)
+            info["hits"] = len(hits)
+        return hits
+
+    def snapshots(self):
+        """The snapshot store, with today's snapshot taken for the leads that have none yet
+
+        Only the first render of the day in this process looks at the file;
+        the scheduled ``python snapshots.py`` records each day's final state.
+        """
+        store = get_snapshot_store()
+        with profiling.span("update_snapshot") as info:
+            info["rows"] = store.snapshot_once(
+                date.today(), TECH_LEADS,
+                lambda leads: take_snapshot(self.backend, leads, self.load_team_progress(), date.today())
+            )
+        return store
+
+    def run_job(self, kind, label, func, *args, versioned=False):
+        """Start ``func(backend, *args)`` as a background job, or join the same job already running
+
+        ``versioned`` jobs depend only on the interns data, so a finished run
+        over unchanged data is reused instead of starting again. Returns the
+        job as it is after waiting up to JOB_WAIT_SECONDS for it.
+        """
+        params = {"args": args}
+        if versioned:
+            params["data"] = data_version(self.backend, TECH_LEADS)
+        runner = get_job_runner()
+        job_id = runner.submit(kind, job_key(kind, **params), label, func, self.backend, *args, reuse=versioned)
+        return runner.wait(job_id, JOB_WAIT_SECONDS)
+
+    def export_button(self, label, frames, file_stem, key, container=st, columns=None):
+        """Build an export only when it is asked for, then offer it for download
+
+        ``frames`` is a callable returning the frames to export, so reruns that
+        don't request the export read and serialize nothing.
+        """
+        if container.button(label, key=key):
+            suffix, mime = EXPORT_FORMATS[self.export_format]
+            file_name = f"{file_stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}"
+            # Streamlit serves downloads from bytes; the export itself is built chunk by chunk
+            with export_file(frames(), self.export_format, columns) as f:
+                data = f.read()
+            container.download_button(
+                f"⬇️ Save {file_name}",
+                data,
+                file_name=file_name,
+                mime=mime,
+                key=f"{key}_save"
+            )
+
+    def get_available_interns(self):
+        """Get list of interns available for team creation"""
+        if self.df.empty:
+            return []
+        membership = self.team_membership()
+        return [name for name in self.df["Name"].tolist() if name not in membership]
@@ -0,0 +1,72 @@
+"""Delete Intern page: set an intern's status or delete them"""
+import streamlit as st
+
+from search_index import removed_intern
+
+
+def render(ctx):
+    df, interns = ctx.df, ctx.interns
+    try:
+        st.title("Delete Intern")
+        # Add status filter
+        status_options = ["All", "Active", "Inactive", "Academic Break"]
+        selected_status = st.selectbox("Filter interns by status:", status_options)
+        # Filter the dataframe based on status
+        if selected_status != "All":
+            filtered_df = df[df["Active"] == ("Yes" if selected_status == "Active" else selected_status)]
+        else:
+            filtered_df = df
+        if filtered_df.empty:
+            st.info("No interns to delete.")
+        else:
+            intern_names = filtered_df["Name"].tolist()
+            selected_intern = st.selectbox("Select Intern to Delete", ["None"] + intern_names)
+            if selected_intern != "None":
+                intern_data = interns.get(selected_intern)
+                st.subheader("Intern Details:")
+                st.write(f"**Name:** {intern_data['Name']}")
+                st.write(f"**Cohort:** {intern_data['Cohort']}")
+                st.write(f"**College:** {intern_data.get('College', 'N/A')}")
+                st.write(f"**Year:** {intern_data.get('Year', 'N/A')}")
+                st.write(f"**Status:** {intern_data.get('Active', 'Yes')}")
+                # Option to update status directly
+                st.markdown("---")
+                st.write("### Update Intern Status")
+                new_status = st.selectbox("Set status to:", ["Active", "Inactive", "Academic Break"], index=["Yes", "No", "Academic Break"].index(intern_data.get("Active", "Yes")) if intern_data.get("Active", "Yes") in ["Yes", "No", "Academic Break"] else 0)
+                if st.button("Update Status"):
+                    ctx.guarded_write("interns", ctx.backend.update_intern, selected_intern, {"Active": ("Yes" if new_status == "Active" else new_status)})
+                    st.success(f"Status for {selected_intern} updated to {new_status}.")
+                    st.rerun()
+                # Check if intern is in any team and show the team name
+                team_name_found = ctx.team_membership().get(selected_intern)
+                in_team = team_name_found is not None
+                if in_team:
+                    st.info(f"This intern is a member of team: {team_name_found}")
+                st.warning("⚠️ This action cannot be undone!")
+                col1, col2, col3 = st.columns(3)
+                if in_team:
+                    with col1:
+                        if st.button("Mark as Inactive", type="secondary"):
+                            ctx.guarded_write("interns", ctx.backend.update_intern, selected_intern, {"Active": "No"})
+                            st.success(f"Intern {selected_intern} marked as inactive.")
+                            st.rerun()
+                    with col2:
+                        if st.button("Mark as Academic Break", type="secondary"):
+                            ctx.guarded_write("interns", ctx.backend.update_intern, selected_intern, {"Active": "Academic Break"})
+                            st.success(f"Intern {selected_intern} marked as on academic break.")
+                            st.rerun()
+                    with col3:
+                        if st.button("Cancel"):
+                            st.rerun()
+                else:
+                    with col1:
+                        if st.button("🗑️ Delete Intern", type="secondary"):
+                            ctx.guarded_write("interns", ctx.backend.delete_intern, selected_intern, changes=removed_intern(selected_intern))
+                            ctx.save_history(selected_intern, "Deleted", intern_data)
+                            st.success(f"Intern {selected_intern} has been deleted.")
+                            st.rerun()
+                    with col2:
+                        if st.button("Cancel"):
+                            st.rerun()
+    except Exception as e:
+        st.error(f"[ERROR] {e}")
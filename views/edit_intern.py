@@ -0,0 +1,94 @@
+"""Edit Intern page: change selected fields of one intern, or one field of many"""
+import streamlit as st
+
+from search_index import intern_changes
+from views import bulk_edit
+
+
+def render(ctx):
+    df, interns, is_super_admin = ctx.df, ctx.interns, ctx.is_super_admin
+    try:
+        st.title("Edit Intern")
+        mode = st.radio("Mode", ["Single Intern", "Bulk Edit"], horizontal=True)
+        if mode == "Bulk Edit":
+            bulk_edit.render(ctx)
+            return
+        filtered_df = df # No need to filter by team here, as it's handled by the page selection
+        if filtered_df.empty:
+            st.info("No interns to edit.")
+        else:
+            intern_names = filtered_df["Name"].tolist()
+            selected_intern = st.selectbox("Select Intern to Edit", ["None"] + intern_names)
+            if selected_intern != "None":
+                intern_data = interns.get(selected_intern)
+                st.subheader(f"Editing: {selected_intern}")
+                with st.form("edit_intern_form"):
+                    st.write("Select fields to edit:")
+                    fields_to_edit = {}
+                    edit_cohort = st.checkbox("Edit Cohort")
+                    if edit_cohort:
+                        fields_to_edit["Cohort"] = st.selectbox("Cohort", ["Cohort 1", "Cohort 2"], index=0 if intern_data["Cohort"] == "Cohort 1" else 1)
+                    # Team number is fixed for tech leads
+                    edit_team = st.checkbox("Edit Team") if is_super_admin else False
+                    if edit_team:
+                        current_team = intern_data.get("Team(eg :2 or 3)", "")
+                        fields_to_edit["Team(eg :2 or 3)"] = st.text_input("Team(eg :2 or 3)", value=current_team)
+                    # Other fields
+                    field_mapping = {
+                        "GitLab User Name": "text",
+                        "Year": "selectbox",
+                        "Received Offer letter": "selectbox",
+                        "College": "text",
+                        "GitLab Acc (README.md)": "text",
+                        "GitLab Acc Link": "text",
+                        "Innings Courses (Python & AI)": "text",
+                        "Huggingchat/Dify": "text",
+                        "Huggingchat Link": "text",
+                        "Streamlit app and Deployment": "text",
+                        "Streamlit Link": "text",
+                        "Huggingface+streamlit integration": "text",
+                        "HF+Streamlit Link": "text",
+                        "Pushed Apps onto GitLab": "selectbox",
+                        "Data Collection (started?)": "selectbox",
+                        "Size of Data": "text",
+                        "Can go to any other places": "text",
+                        "Blockers?": "textarea",
+                        "Remarks": "textarea"
+                    }
+                    for field, input_type in field_mapping.items():
+                        edit_field = st.checkbox(f"Edit {field}")
+                        if edit_field:
+                            current_value = intern_data.get(field, "")
+                            if input_type == "text":
+                                fields_to_edit[field] = st.text_input(f"{field}", value=current_value)
+                            elif input_type == "textarea":
+                                fields_to_edit[field] = st.text_area(f"{field}", value=current_value)
+                            elif input_type == "selectbox":
+                                if field == "Year":
+                                    options = ["1", "2", "3", "4"]
+                                    index = options.index(current_value) if current_value in options else 0
+                                    fields_to_edit[field] = st.selectbox(f"{field}", options, index=index)
+                                elif field in ["Received Offer letter", "Pushed Apps onto GitLab", "Data Collection (started?)"]:
+                                    options = ["Yes", "No"]
+                                    index = options.index(current_value) if current_value in options else 0
+                                    fields_to_edit[field] = st.selectbox(f"{field}", options, index=index)
+                    # Place the submit buttons INSIDE the form
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        update_submitted = st.form_submit_button("Update Intern")
+                    with col2:
+                        submit_submitted = st.form_submit_button("Submit Changes")
+                    if (update_submitted or submit_submitted) and fields_to_edit:
+                        old_data = intern_data.copy()
+                        # Save changes
+                        ctx.guarded_write(
+                            "interns", ctx.backend.update_intern, selected_intern, fields_to_edit,
+                            changes=intern_changes([{"Name": selected_intern, **fields_to_edit}])
+                        )
+                        # Save history of the fields that actually changed
+                        new_data = {**old_data, **fields_to_edit}
+                        ctx.save_history(selected_intern, "Updated", old_data, new_data)
+                        st.success(f"Updated {len(fields_to_edit)} field(s) for {selected_intern}")
+                        st.rerun()
+    except Exception as e:
+        st.error(f"[ERROR] {e}")
@@ -0,0 +1,40 @@
+"""Super Admin view of the background jobs: progress, errors and finished report files"""
+import os
+
+import streamlit as st
+
+from views.context import get_job_runner
+
+STATUS_ICONS = {"queued": "⏳", "running": "⚙️", "done": "✅", "failed": "❌"}
+
+
+def show_progress(job):
+    """A progress bar for a job that hasn't finished yet"""
+    st.progress(job["progress"], text=job["message"] or ("Waiting for a free worker" if job["status"] == "queued" else "Starting"))
+
+
+def render(ctx):
+    st.subheader("⚙️ Background Jobs")
+    st.button("🔄 Refresh", key="jobs_refresh")
+    jobs = get_job_runner().recent()
+    if not jobs:
+        st.info("No jobs yet.")
+        return
+    for job in jobs:
+        st.write(f"{STATUS_ICONS[job['status']]} **{job['label']}** · submitted {job['submitted'].replace('T', ' ')}")
+        if job["status"] in ("queued", "running"):
+            show_progress(job)
+        elif job["status"] == "failed":
+            st.error(f"[ERROR] {job['error']}")
+        elif job["result"] and "path" in job["result"] and os.path.exists(job["result"]["path"]):
+            # Read the file only once it is asked for
+            result = job["result"]
+            if st.button(f"📥 Get {result['file_name']}", key=f"job_file_{job['id']}"):
+                with open(result["path"], "rb") as f:
+                    st.download_button(
+                        f"⬇️ Save {result['file_name']}",
+                        f.read(),
+                        file_name=result["file_name"],
+                        mime=result["mime"],
+                        key=f"job_save_{job['id']}"
+                    )
@@ -0,0 +1,47 @@
+"""Login page for tech leads and the super admin"""
+import streamlit as st
+
+from config import TECH_LEADS
+
+
+def require_login():
+    """Show the login forms and stop the run until someone has logged in"""
+    # Auth system using Streamlit secrets
+    if "logged_in" not in st.session_state:
+        st.session_state.logged_in = False
+        st.session_state.tech_lead = None
+        st.session_state.is_super_admin = False
+
+    if not st.session_state.logged_in:
+        st.title("Tech Lead Login")
+    
+        # Super Admin Login Section
+        st.markdown("---")
+        st.subheader("Super Admin Panel")
+        super_admin_username = st.text_input("Super Admin Username")
+        super_admin_password = st.text_input("Super Admin Password", type="password")
+    
+        if st.button("Super Admin Login"):
+            if super_admin_username == "admin" and super_admin_password == st.secrets.get("admin_password", "admin123"):
+                st.session_state.logged_in = True
+                st.session_state.tech_lead = "Super Admin"
+                st.session_state.is_super_admin = True
+                st.success("Super Admin login successful!")
+                st.rerun()
+            else:
+                st.error("Invalid super admin credentials")
+    
+        st.markdown("---")
+        st.subheader("Tech Lead Login")
+        username = st.text_input("Enter your full name")
+        password = st.text_input("Password", type="password")
+        if st.button("Login"):
+            if username in TECH_LEADS and st.secrets["tech_leads"].get(username, "") == password:
+                st.session_state.logged_in = True
+                st.session_state.tech_lead = username
+                st.session_state.is_super_admin = False
+                st.success("Login successful!")
+                st.rerun()
+            else:
+                st.error("Invalid credentials")
+        st.stop()
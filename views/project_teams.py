@@ -0,0 +1,165 @@
+"""Project Teams page: create teams of five interns and track their progress"""
+import pandas as pd
+import streamlit as st
+
+from teams import OVERALL_TEAM, PHASES, changed_phases, new_team, progress_rows
+
+
+def render(ctx):
+    interns, tech_lead = ctx.interns, ctx.tech_lead
+    try:
+        st.title("🚀 Project Teams")
+
+        # Load existing teams (older layouts are migrated once when the backend opens)
+        teams = ctx.load_teams()
+
+        # Check if a team is selected for detailed view
+        if "selected_team" in st.session_state and st.session_state.selected_team:
+            selected_team_name = st.session_state.selected_team
+            if selected_team_name in teams:
+                team_data = teams[selected_team_name]
+                st.subheader(f"📋 Team: {selected_team_name}")
+                team_member_names = []
+                for m in team_data['members'].keys():
+                    if m in interns:
+                        is_inactive = interns.value(m, 'Active') == 'No'
+                        team_member_names.append(m + (' (Inactive)' if is_inactive else ''))
+                    else:
+                        team_member_names.append(m + ' (Not in CSV)')
+                st.write(f"**Team Members:** {', '.join(team_member_names)}")
+                st.subheader("📊 Overall Team Progress")
+                for section in PHASES:
+                    st.text_area(section, value=team_data['team_progress'].get(section, ""), disabled=True, key=f"{selected_team_name}_overall_{section}")
+                st.subheader("📊 Project Progress (Per Member)")
+                for member, progress in team_data['members'].items():
+                    st.markdown(f"**{member}**")
+                    for section in PHASES:
+                        st.text_area(section, value=progress.get(section, ""), disabled=True, key=f"{selected_team_name}_{member}_{section}")
+                if st.button("⬅ Back to Team Dashboard"):
+                    del st.session_state.selected_team
+                    st.rerun()
+            else:
+                st.error("Selected team not found!")
+                del st.session_state.selected_team
+                st.rerun()
+        else:
+            # Team Creation Section
+            st.subheader("➕ Create New Team")
+            with st.form("create_team_form"):
+                team_name = st.text_input("Team Name (must be unique)")
+                available_for_team = ctx.get_available_interns()
+                if len(available_for_team) < 5:
+                    st.warning(f"⚠️ Only {len(available_for_team)} interns available. Need at least 5 interns to create a team.")
+                    team_members = []
+                else:
+                    st.write(f"**Available Interns:** {len(available_for_team)} interns")
+                    team_members = st.multiselect(
+                        "Select exactly 5 team members:",
+                        available_for_team,
+                        max_selections=5
+                    )
+                st.markdown("**Initial Overall Team Progress (Optional):**")
+                team_progress = {phase: st.text_area(f"{phase} (Team)", height=100) for phase in PHASES}
+                create_submitted = st.form_submit_button("Create Team")
+                if create_submitted:
+                    if not team_name:
+                        st.error("Please enter a team name.")
+                    elif team_name in teams:
+                        st.error("Team name already exists. Please choose a different name.")
+                    elif len(team_members) != 5:
+                        st.error("Please select exactly 5 team members.")
+                    else:
+                        teams[team_name] = new_team(team_members, team_progress)
+                        ctx.save_teams(teams)
+                        teams = ctx.load_teams()
+                        st.success(f"Team '{team_name}' created successfully!")
+                        st.rerun()
+            # Team Management Section
+            if teams:
+                st.markdown("---")
+                st.subheader("📋 My Teams – Click to View Progress")
+                for team_name in teams.keys():
+                    if st.button(f"👥 {team_name}", key=f"team_{team_name}"):
+                        st.session_state.selected_team = team_name
+                        st.rerun()
+                # Team Progress Update Section
+                st.markdown("---")
+                st.subheader("✏️ Update Team Progress (Overall & Per Member)")
+                selected_team_for_update = st.selectbox("Select Team to Update:", list(teams.keys()))
+                if selected_team_for_update:
+                    team_data = teams[selected_team_for_update]
+                    member_options = [OVERALL_TEAM] + list(team_data['members'].keys())
+                    selected_member = st.selectbox("Select Member to Update:", member_options)
+                    with st.form("update_team_progress"):
+                        if selected_member == OVERALL_TEAM:
+                            st.markdown("**Update Overall Team Progress:**")
+                            updated_progress = {
+                                phase: st.text_area(
+                                    f"{phase} (Team)",
+                                    value=team_data['team_progress'].get(phase, ""),
+                                    height=100
+                                )
+                                for phase in PHASES
+                            }
+                            update_submitted = st.form_submit_button("Update Progress")
+                            if update_submitted:
+                                # Only the phases that changed are written
+                                changed = changed_phases(team_data['team_progress'], updated_progress)
+                                if changed:
+                                    ctx.update_team_progress(selected_team_for_update, None, changed)
+                                st.success(f"Overall team progress updated for '{selected_team_for_update}'!")
+                                st.rerun()
+                        else:
+                            st.markdown(f"**Update Progress for {selected_member}:**")
+                            member_progress = team_data['members'][selected_member]
+                            updated_progress = {
+                                phase: st.text_area(
+                                    f"{phase} (Member)",
+                                    value=member_progress.get(phase, ""),
+                                    height=100
+                                )
+                                for phase in PHASES
+                            }
+                            update_submitted = st.form_submit_button("Update Progress")
+                            if update_submitted:
+                                changed = changed_phases(member_progress, updated_progress)
+                                if changed:
+                                    ctx.update_team_progress(selected_team_for_update, selected_member, changed)
+                                st.success(f"Progress updated for member '{selected_member}' in team '{selected_team_for_update}'!")
+                                st.rerun()
+                # CSV Export Section
+                st.markdown("---")
+                st.subheader("📥 Export Team Progress (Overall & Per Member)")
+                csv_data = progress_rows(teams)
+                if csv_data:
+                    ctx.export_button(
+                        "📥 Export My Team Progress",
+                        lambda: [pd.DataFrame(csv_data)],
+                        f"{tech_lead.replace(' ', '_')}_team_progress",
+                        key="export_team_progress"
+                    )
+                # --- Delete Team Section ---
+                st.markdown("---")
+                st.subheader("🗑️ Delete a Team")
+                team_names_for_delete = list(teams.keys())
+                if team_names_for_delete:
+                    team_to_delete = st.selectbox("Select Team to Delete:", team_names_for_delete, key="delete_team_select")
+                    if st.button("Delete Team", key="delete_team_btn"):
+                        st.session_state.pending_delete_team = team_to_delete
+                if "pending_delete_team" in st.session_state and st.session_state.pending_delete_team == team_to_delete:
+                    confirm = st.checkbox(f"Are you sure you want to delete team '{team_to_delete}'? This cannot be undone.", key="delete_team_confirm")
+                    if confirm and st.button("Confirm Delete", key="confirm_delete_team_btn"):
+                        del teams[team_to_delete]
+                        ctx.save_teams(teams)
+                        teams = ctx.load_teams()
+                        del st.session_state.pending_delete_team
+                        if "selected_team" in st.session_state and st.session_state.selected_team == team_to_delete:
+                            del st.session_state.selected_team
+                        st.success(f"Team '{team_to_delete}' deleted successfully!")
+                        st.rerun()
+                else:
+                    st.info("No teams to delete.")
+            else:
+                st.info("No teams created yet. Create your first team above!")
+    except Exception as e:
+        st.error(f"[ERROR] {e}")
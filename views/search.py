@@ -0,0 +1,40 @@
+"""Search page: ranked full-text search over blockers, remarks and team progress"""
+import time
+
+import streamlit as st
+
+from aggregation import LEAD_COLUMN
+from config import TECH_LEADS
+
+
+def render(ctx):
+    tech_lead, is_super_admin = ctx.tech_lead, ctx.is_super_admin
+    try:
+        if is_super_admin:
+            st.subheader("🔎 Search Across Leads")
+        else:
+            st.title("🔎 Search")
+        text = st.text_input(
+            "Search intern blockers, remarks and team progress",
+            placeholder="e.g. deploy, api key, waiting",
+            key="search_text"
+        )
+        if not text.strip():
+            return
+
+        # The Super Admin searches every tech lead; a tech lead only their own interns and teams
+        leads = TECH_LEADS if is_super_admin else [tech_lead]
+        start = time.perf_counter()
+        hits = ctx.search(text, leads)
+        st.caption(f"{len(hits)} result(s) in {(time.perf_counter() - start) * 1000:.0f} ms")
+        if hits.empty:
+            st.info("No matches.")
+            return
+
+        for hit in hits.to_dict("records"):
+            where = hit["Name"] if hit["Type"] == "Intern" else f"{hit['Team']} – {hit['Name']}"
+            if is_super_admin:
+                where = f"{hit[LEAD_COLUMN]} / {where}"
+            st.markdown(f"**{where}** · {hit['Field']}  \n{hit['Match']}")
+    except Exception as e:
+        st.error(f"[ERROR] {e}")
@@ -0,0 +1,73 @@
+"""Sidebar downloads and intern totals shown under every tech lead page, and the profiling panel"""
+import pandas as pd
+import streamlit as st
+
+from exports import chunks
+
+
+def render_downloads(ctx):
+    df, tech_lead, is_super_admin = ctx.df, ctx.tech_lead, ctx.is_super_admin
+    # Download Data Section
+    st.sidebar.markdown("---")
+    st.sidebar.subheader("Download Data")
+    if not df.empty:
+        ctx.export_button(
+            "📥 Download All Data",
+            lambda: chunks(df),
+            f"{tech_lead.replace(' ', '_')}_all_interns",
+            key="export_all",
+            container=st.sidebar
+        )
+        cohort_download = st.sidebar.selectbox("Download by Cohort:", ["All", "Cohort 1", "Cohort 2"])
+        if cohort_download != "All":
+            ctx.export_button(
+                f"📥 Download {cohort_download}",
+                lambda: chunks(df[df["Cohort"] == cohort_download]),
+                f"{tech_lead.replace(' ', '_')}_{cohort_download.replace(' ', '_')}",
+                key="export_cohort",
+                container=st.sidebar
+            )
+        if is_super_admin and "Team(eg :2 or 3)" in df.columns:
+            team_download_text = st.sidebar.text_input("Download by Team (enter team name):")
+            if team_download_text:
+                filtered_team_df = df[df["Team(eg :2 or 3)"].astype(str).str.contains(team_download_text, case=False, na=False)]
+                if not filtered_team_df.empty:
+                    ctx.export_button(
+                        f"📥 Download Team: {team_download_text}",
+                        lambda: chunks(filtered_team_df),
+                        f"{tech_lead.replace(' ', '_')}_{team_download_text.replace(' ', '_')}",
+                        key="export_team",
+                        container=st.sidebar
+                    )
+                else:
+                    st.sidebar.info(f"No interns found for team: {team_download_text}")
+
+    # Footer
+    st.sidebar.markdown("---")
+    st.sidebar.write(f"Total Interns: {len(df)}")
+    if not df.empty:
+        cohort_counts = df["Cohort"].value_counts()
+        # Categorical columns also count categories nobody is in
+        cohort_counts = cohort_counts[cohort_counts > 0]
+        for cohort, count in cohort_counts.items():
+            st.sidebar.write(f"{cohort}: {count}")
+
+
+def render_profile(runs):
+    """Spans of the previous reruns, shown to the Super Admin only while profiling is on"""
+    if not runs:
+        return
+    with st.sidebar.expander("⏱️ Profile"):
+        last = runs[-1]
+        st.caption(f"Last rerun ({last.get('page', 'login')}): {last['total_ms']:.1f} ms")
+        if last["spans"]:
+            spans = pd.DataFrame(last["spans"]).sort_values("start_ms")
+            spans["name"] = ["  " * depth + name for depth, name in zip(spans["depth"], spans["name"])]
+            st.dataframe(spans.drop(columns=["depth"]), hide_index=True)
+        for name, value in last["counters"].items():
+            st.write(f"{name}: {value}")
+        st.caption("Recent reruns")
+        st.dataframe(
+            pd.DataFrame([{"time": run["time"], "page": run.get("page"), "ms": run["total_ms"]} for run in runs[::-1]]),
+            hide_index=True
+        )
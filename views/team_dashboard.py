@@ -0,0 +1,57 @@
+"""Super Admin view of every tech lead's project teams and their phase progress"""
+import streamlit as st
+
+from aggregation import LEAD_COLUMN
+from exports import chunks
+from teams import OVERALL_TEAM, PHASES, PROGRESS_COLUMNS, team_completion
+
+
+def render(ctx):
+    st.subheader("🚀 Project Teams Across Leads")
+    table = ctx.load_team_progress()
+    if table.empty:
+        st.info("No project teams created yet.")
+        return
+
+    leads = st.multiselect("Filter by tech lead (leave empty for all):", list(dict.fromkeys(table[LEAD_COLUMN])))
+    if leads:
+        table = table[table[LEAD_COLUMN].isin(leads)]
+    members = table[table["Member"] != OVERALL_TEAM]
+    completion = team_completion(table)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Teams", len(completion))
+    with col2:
+        st.metric("Team Members", int(completion["Members"].sum()))
+    with col3:
+        st.metric("Member Phases Done", f"{members['Done'].mean() * 100:.0f}%" if not members.empty else "0%")
+
+    st.write("**Completion by tech lead:**")
+    by_lead = members.groupby(LEAD_COLUMN, sort=False).agg(
+        Teams=("Team", "nunique"), Members=("Member", "nunique"), Completion=("Done", "mean")
+    )
+    by_lead["Completion"] = (by_lead["Completion"] * 100).round(1)
+    st.dataframe(by_lead.rename(columns={"Completion": "Member Completion %"}), use_container_width=True)
+
+    st.write("**Completion by team:**")
+    st.dataframe(completion, hide_index=True, use_container_width=True)
+
+    # Drill down into one team's progress texts
+    indexed = table.set_index([LEAD_COLUMN, "Team"]).sort_index()
+    team_keys = list(dict.fromkeys(zip(table[LEAD_COLUMN], table["Team"])))
+    selected = st.selectbox(
+        "View team progress:", team_keys, format_func=lambda key: f"{key[0]} – {key[1]}", key="team_dashboard_team"
+    )
+    if selected:
+        team_rows = indexed.loc[selected]
+        grid = team_rows.pivot(index="Member", columns="Phase", values="Progress")
+        member_order = [OVERALL_TEAM] + [m for m in dict.fromkeys(team_rows["Member"]) if m != OVERALL_TEAM]
+        st.dataframe(grid.reindex(index=member_order, columns=PHASES), use_container_width=True)
+
+    ctx.export_button(
+        "📥 Download All Team Progress",
+        lambda: chunks(table[PROGRESS_COLUMNS]),
+        "all_team_progress",
+        key="export_team_dashboard"
+    )
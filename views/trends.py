@@ -0,0 +1,118 @@
+"""Super Admin trends: week-over-week charts of the daily per-lead snapshots"""
+import pandas as pd
+import streamlit as st
+
+from aggregation import LEAD_COLUMN
+
+# Snapshot counters with a friendlier name; cohort: and offer: counters are named after their value
+METRIC_LABELS = {
+    "total_interns": "Interns",
+    "offers_received": "Offers Received",
+    "apps_pushed": "Apps Pushed to GitLab",
+    "data_collection_started": "Data Collection Started",
+    "inactive": "Inactive Interns",
+    "academic_break": "Interns on Academic Break",
+    "teams": "Project Teams",
+    "team_members": "Team Members",
+    "member_phases_done": "Member Phases Done",
+    "team_phases_done": "Team Phases Done",
+}
+# Rates: label -> (done counter, total counter)
+RATE_METRICS = {
+    "Member Phase Completion %": ("member_phases_done", "member_phases"),
+    "Team Phase Completion %": ("team_phases_done", "team_phases"),
+}
+RANGES = {"Last 4 weeks": 28, "Last 12 weeks": 84, "Last year": 365, "All": None}
+
+
+def metric_label(metric):
+    if metric.startswith("cohort:"):
+        return f"Interns in {metric[len('cohort:'):]}"
+    if metric.startswith("offer:"):
+        return f"Offer Letter: {metric[len('offer:'):]}"
+    return METRIC_LABELS.get(metric, metric)
+
+
+def _series(store, days, metric, leads, combined):
+    """Date x lead (or one "All Leads" column) values of a metric from the snapshot store
+
+    ``days`` are the (Date, Tech Lead) pairs with a snapshot; a metric missing
+    from one of them was zero that day.
+    """
+    done, total = RATE_METRICS.get(metric, (metric, None))
+    rows = store.load(metrics=[done] + ([total] if total else []))
+    if leads:
+        rows, days = rows[rows[LEAD_COLUMN].isin(leads)], days[days[LEAD_COLUMN].isin(leads)]
+
+    def pivot(name):
+        values = rows[rows["Metric"] == name].pivot_table(
+            index="Date", columns=LEAD_COLUMN, values="Value", aggfunc="sum"
+        )
+        values = values.reindex(index=sorted(days["Date"].unique()), columns=list(dict.fromkeys(days[LEAD_COLUMN])))
+        values = values.fillna(0)
+        return values.sum(axis=1).to_frame("All Leads") if combined else values
+
+    if total is None:
+        return pivot(done)
+    return (pivot(done) / pivot(total).replace(0, float("nan")) * 100).round(1)
+
+
+def line_chart(series):
+    """A line per column of a dated frame
+
+    A plain Vega-Lite spec: st.line_chart builds it through Altair, whose
+    schema validation took most of the admin panel's rerun time.
+    """
+    data = series.rename_axis("Date").reset_index().melt(id_vars="Date", var_name="Series", value_name="Value")
+    st.vega_lite_chart(data, {
+        "mark": {"type": "line", "point": True, "tooltip": True},
+        "encoding": {
+            "x": {"field": "Date", "type": "temporal"},
+            "y": {"field": "Value", "type": "quantitative"},
+            "color": {"field": "Series", "type": "nominal", "title": None},
+        },
+    }, use_container_width=True)
+
+
+def render(ctx):
+    st.subheader("📉 Trends")
+    store = ctx.snapshots()
+    metrics = store.metrics()
+    if not metrics:
+        st.info("No snapshots yet.")
+        return
+    options = [m for m in METRIC_LABELS if m in metrics] + sorted(
+        m for m in metrics if m.startswith(("cohort:", "offer:"))
+    ) + list(RATE_METRICS)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        metric = st.selectbox("Metric", options, format_func=metric_label, key="trends_metric")
+    with col2:
+        period = st.selectbox("Range", list(RANGES), key="trends_range")
+    with col3:
+        weekly = st.radio("Points", ["Daily", "Weekly"], horizontal=True, key="trends_points") == "Weekly"
+    days = store.load(metrics=["total_interns"])[["Date", LEAD_COLUMN]]
+    leads = st.multiselect("Tech leads (leave empty for all):", list(dict.fromkeys(days[LEAD_COLUMN])), key="trends_leads")
+    combined = st.checkbox("Combine the leads into one line", key="trends_combined")
+
+    series = _series(store, days, metric, leads, combined)
+    if RANGES[period] is not None and not series.empty:
+        series = series[series.index > series.index.max() - pd.Timedelta(days=RANGES[period])]
+    if series.empty:
+        st.info("No snapshots in this range.")
+        return
+    if weekly:
+        # The last snapshot of each week
+        series = series.resample("W").last().dropna(how="all")
+    line_chart(series)
+
+    # Latest value against the snapshot a week before it
+    latest = series.index.max()
+    week_ago = series[series.index <= latest - pd.Timedelta(days=7)]
+    change = pd.DataFrame({"Latest": series.loc[latest]})
+    if not week_ago.empty:
+        change["A Week Before"] = week_ago.iloc[-1]
+        change["Change"] = change["Latest"] - change["A Week Before"]
+    st.write(f"**{metric_label(metric)} on {latest:%Y-%m-%d}:**")
+    st.dataframe(change, use_container_width=True)
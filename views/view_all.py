@@ -0,0 +1,35 @@
+"""View All Interns page: the tech lead's interns with cohort and team filters"""
+import streamlit as st
+
+from exports import chunks
+
+
+def render(ctx):
+    df, tech_lead, is_super_admin = ctx.df, ctx.tech_lead, ctx.is_super_admin
+    try:
+        st.title("All Interns")
+        col1, col2 = st.columns(2)
+        with col1:
+            cohort_filter = st.selectbox("Select Cohort", ["All", "Cohort 1", "Cohort 2"])
+        if is_super_admin:
+            with col2:
+                team_filter = st.text_input("Filter by Team (leave empty for all)")
+        else:
+            team_filter = ""
+        filtered_df = df # No need to filter by team here, as it's handled by the page selection
+        if cohort_filter != "All":
+            filtered_df = filtered_df[filtered_df["Cohort"] == cohort_filter]
+        if is_super_admin and team_filter and "Team(eg :2 or 3)" in filtered_df.columns:
+            filtered_df = filtered_df[filtered_df["Team(eg :2 or 3)"].astype(str).str.contains(team_filter, case=False, na=False)]
+        if not filtered_df.empty:
+            st.dataframe(filtered_df, use_container_width=True)
+            ctx.export_button(
+                "Download CSV",
+                lambda: chunks(filtered_df),
+                f"{tech_lead.replace(' ', '_')}_interns",
+                key="export_filtered"
+            )
+        else:
+            st.info("No interns found.")
+    except Exception as e:
+        st.error(f"[ERROR] {e}")